@@ -0,0 +1 @@
+"""Micro-benchmarks for the Pokemon card generator. Run modules with `python -m benchmarks.<name>`."""
@@ -0,0 +1,55 @@
+"""
+Micro-benchmark: per-card base card creation.
+
+Compares the previous per-card gradient (one draw.line per row plus an
+alpha_composite) with copying the cached base-card template.
+
+Usage: python -m benchmarks.base_card [--cards N]
+"""
+
+import argparse
+import time
+
+from PIL import Image, ImageDraw
+
+from src.card.card_designer import CardDesigner
+
+
+def legacy_base_card(designer: CardDesigner) -> Image.Image:
+    """Reference implementation: draw the gradient line by line for every card."""
+    card = Image.new('RGBA', (designer.card_width, designer.card_height), designer.background_color)
+    gradient = Image.new('RGBA', (designer.card_width, designer.card_height))
+    draw = ImageDraw.Draw(gradient)
+    for y in range(designer.card_height):
+        intensity = int(255 - (y / designer.card_height) * 20)
+        draw.line([(0, y), (designer.card_width, y)], fill=(intensity, intensity, intensity, 255))
+    return Image.alpha_composite(card, gradient)
+
+
+def time_per_card(func, cards: int) -> float:
+    """Return average milliseconds per call."""
+    start = time.perf_counter()
+    for _ in range(cards):
+        func()
+    return (time.perf_counter() - start) * 1000 / cards
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cards", type=int, default=50, help="Cards to create per variant (default: 50)")
+    args = parser.parse_args()
+
+    designer = CardDesigner()
+    designer._create_base_card()  # Warm the template cache
+
+    legacy_ms = time_per_card(lambda: legacy_base_card(designer), args.cards)
+    template_ms = time_per_card(designer._create_base_card, args.cards)
+
+    print(f"Card size: {designer.card_width}x{designer.card_height}px, {args.cards} cards")
+    print(f"Per-card gradient:  {legacy_ms:8.2f} ms/card")
+    print(f"Cached template:    {template_ms:8.2f} ms/card")
+    print(f"Saving:             {legacy_ms - template_ms:8.2f} ms/card ({legacy_ms / template_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Startup benchmark: time to import main, as reported by `python -X importtime`.
+
+Runs a fresh interpreter several times and prints the median total import
+time of main plus the slowest modules it pulls in.
+
+Usage: python -m benchmarks.startup [--runs N] [--top N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def import_times(module: str = "main") -> dict:
+    """Return cumulative import time in microseconds per module for one cold import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+
+    # Lines look like "import time:   self_us |   cumulative_us |   package"
+    times = {}
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            times[parts[2].strip()] = int(parts[1])
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Cold imports to time (default: 5)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to list (default: 10)")
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.runs)]
+    totals = [run["main"] for run in runs]
+    print(f"import main: median {statistics.median(totals) / 1000:.1f} ms over {args.runs} runs "
+          f"(min {min(totals) / 1000:.1f} ms)")
+
+    last = runs[-1]
+    print("\nSlowest modules (cumulative, last run):")
+    for name, cumulative_us in sorted(last.items(), key=lambda item: item[1], reverse=True)[1:args.top + 1]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""
+Benchmark suite: card rendering and PDF generation hot paths.
+
+Measures throughput of CardDesigner.create_card, TextRenderer.fit_text_to_width
+and PDFGenerator.generate_cards_pdf / generate_cards_pdf_stream /
+generate_cards_pdf_shards at several document sizes, plus the peak memory of
+each case. Inputs are synthetic and
+generated locally, so runs work offline and are comparable across machines.
+
+Memory is the peak resident memory of a fresh process that builds the
+inputs and runs a case once; the inputs are the same for every case, so
+differences between cases are down to the code under test. Unlike
+tracemalloc this sees Pillow's pixel buffers, and it does not slow
+reportlab down by an order of magnitude.
+
+Usage:
+    python -m benchmarks.suite [--quick] [--save results.json]
+    python -m benchmarks.suite --baseline results.json [--threshold 10]
+
+With --baseline the run is compared case by case and the exit status is 1
+when any case is slower or uses more memory than the threshold allows.
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import multiprocessing.forkserver
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import PIL
+import reportlab
+
+from benchmarks.synthetic import SYNTHETIC_NAMES, make_pokemon, offline_environment
+from src.card.card_designer import CardDesigner
+from src.card.text_renderer import TextRenderer
+from src.pdf.pdf_generator import PDFGenerator
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_PDF_SIZES = (9, 90, 1025)
+QUICK_PDF_SIZES = (9, 90)
+SHARD_PAGES = 4  # Pages per shard in the sharded PDF cases
+
+# A case is (name, items processed per run, function running it once)
+Case = Tuple[str, int, Callable[[], None]]
+
+
+def build_cases(workdir: Path, artwork: List[Path], card_count: int, text_calls: int,
+                pdf_sizes: Tuple[int, ...]) -> List[Case]:
+    """Create the benchmark cases over synthetic inputs."""
+    designer = CardDesigner()
+    pokemon = [make_pokemon(pid) for pid in range(1, len(artwork) + 1)]
+
+    def create_cards():
+        for index in range(card_count):
+            designer.create_card(pokemon[index % len(pokemon)], artwork[index % len(artwork)], 'en')
+
+    renderer = TextRenderer()
+    # Narrow widths force the multi-word names through wrapping
+    text_jobs = [(names[lang], width, lang)
+                 for names in SYNTHETIC_NAMES for lang in names for width in (160, 320, 700)]
+
+    def fit_texts():
+        for index in range(text_calls):
+            renderer.fit_text_to_width(*text_jobs[index % len(text_jobs)])
+
+    # A page's worth of distinct cards, reused to build larger documents
+    cards = [designer.create_card(p, path, 'en') for p, path in zip(pokemon, artwork)]
+    pdf_generator = PDFGenerator()
+    output = workdir / "benchmark.pdf"
+
+    def pdf_case(method: str, size: int) -> Callable[[], None]:
+        def run():
+            document = [cards[i % len(cards)] for i in range(size)]
+            if method == "generate_cards_pdf":
+                pdf_generator.generate_cards_pdf(document, str(output))
+            elif method == "generate_cards_pdf_shards":
+                pdf_generator.generate_cards_pdf_shards(iter(document), str(output), SHARD_PAGES, total_cards=size)
+            else:
+                pdf_generator.generate_cards_pdf_stream(iter(document), str(output), total_cards=size)
+        return run
+
+    cases = [
+        ("create_card", card_count, create_cards),
+        ("fit_text_to_width", text_calls, fit_texts),
+    ]
+    for method in ("generate_cards_pdf", "generate_cards_pdf_stream", "generate_cards_pdf_shards"):
+        cases.extend((f"{method}[{size}]", size, pdf_case(method, size)) for size in pdf_sizes)
+    return cases
+
+
+def _max_rss_mb() -> Optional[float]:
+    """Process high-water resident memory, or None where unavailable."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024  # Bytes vs KB
+
+
+def time_case(run: Callable[[], None], items: int, repeat: int) -> Dict[str, float]:
+    """
+    Time a case.
+
+    Args:
+        run: Function processing `items` items once
+        items: Items processed per run
+        repeat: Timed runs; the fastest one is reported
+
+    Returns:
+        items, seconds and per_second
+    """
+    run()  # Warm fonts, templates and the derived artwork cache
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+
+    return {'items': items, 'seconds': best, 'per_second': items / best if best > 0 else 0.0}
+
+
+def _case_peak_memory(name: str, build_options: Dict[str, Any]) -> Optional[float]:
+    """Run one case in this (fresh) process and return its peak RSS in MB."""
+    logging.disable(logging.WARNING)
+    with tempfile.TemporaryDirectory(prefix="ptcg-bench-") as tmp:
+        with offline_environment(Path(tmp)) as artwork:
+            cases = build_cases(Path(tmp), artwork, **build_options)
+            run = next(run for case_name, _, run in cases if case_name == name)
+            run()
+    return _max_rss_mb()
+
+
+def start_memory_server() -> bool:
+    """
+    Start the fork server memory runs are forked from, if the platform allows it.
+
+    Peak RSS is inherited across fork and exec, so measurement processes must
+    come from a small server started before this process holds any cards.
+    """
+    if resource is None or "forkserver" not in multiprocessing.get_all_start_methods():
+        return False
+    multiprocessing.forkserver.ensure_running()
+    return True
+
+
+def measure_peak_memory(name: str, build_options: Dict[str, Any]) -> Optional[float]:
+    """Measure a case's peak RSS in a fresh process forked from the memory server."""
+    context = multiprocessing.get_context("forkserver")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(_case_peak_memory, name, build_options).result()
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """
+    Compare results with a baseline.
+
+    Args:
+        results: Case results from this run
+        baseline: Case results from a saved run
+        threshold: Allowed slowdown or memory growth in percent
+
+    Returns:
+        Names of cases that regressed
+    """
+    regressions = []
+    print(f"\n{'case':32} {'baseline/s':>12} {'now/s':>12} {'speed':>8} {'peak MB':>16}")
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:32} {'-':>12} {result['per_second']:12.1f} {'new':>8}")
+            continue
+
+        speed_change = (result['per_second'] / before['per_second'] - 1) * 100 if before['per_second'] else 0.0
+        memory_before, memory_now = before.get('peak_rss_mb'), result.get('peak_rss_mb')
+        # Growth below a few MB is allocator noise rather than a trend
+        memory_regressed = (memory_before is not None and memory_now is not None
+                            and memory_now > max(memory_before * (1 + threshold / 100), memory_before + 5))
+        regressed = speed_change < -threshold or memory_regressed
+        if regressed:
+            regressions.append(name)
+        memory = (f"{memory_before:7.1f}->{memory_now:<7.1f}"
+                  if memory_before is not None and memory_now is not None else f"{'-':>16}")
+        print(f"{name:32} {before['per_second']:12.1f} {result['per_second']:12.1f} {speed_change:+7.1f}% "
+              f"{memory}{'  REGRESSION' if regressed else ''}")
+    return regressions
+
+
+def environment_info() -> Dict[str, str]:
+    """Describe the machine and library versions a run was made with."""
+    return {
+        'python': platform.python_version(),
+        'pillow': PIL.__version__,
+        'reportlab': reportlab.Version,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true",
+                        help=f"Skip the largest PDF size and time a single run ({', '.join(map(str, QUICK_PDF_SIZES))} cards)")
+    parser.add_argument("--pdf-sizes", metavar="N,N",
+                        help=f"Cards per PDF case (default: {','.join(map(str, DEFAULT_PDF_SIZES))})")
+    parser.add_argument("--cards", type=int, default=27, help="Cards per create_card run (default: 27)")
+    parser.add_argument("--text-calls", type=int, default=500,
+                        help="Calls per fit_text_to_width run (default: 500)")
+    parser.add_argument("--repeat", type=int, help="Timed runs per case, best is kept (default: 3, quick: 1)")
+    parser.add_argument("--only", metavar="TEXT", help="Run only cases whose name contains TEXT")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the per-case peak memory runs")
+    parser.add_argument("--save", metavar="FILE", help="Write results as JSON, e.g. to use as a baseline")
+    parser.add_argument("--baseline", metavar="FILE", help="Compare with results saved by --save")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Allowed regression against the baseline in percent (default: 10)")
+    args = parser.parse_args()
+
+    if args.pdf_sizes:
+        pdf_sizes = tuple(int(size) for size in args.pdf_sizes.split(","))
+    else:
+        pdf_sizes = QUICK_PDF_SIZES if args.quick else DEFAULT_PDF_SIZES
+    repeat = args.repeat or (1 if args.quick else 3)
+    build_options = {'card_count': args.cards, 'text_calls': args.text_calls, 'pdf_sizes': pdf_sizes}
+
+    # Missing-font warnings would otherwise be logged (and written to disk) on every card
+    logging.disable(logging.WARNING)
+    measure_memory = not args.no_memory and start_memory_server()
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="ptcg-bench-") as tmp:
+        workdir = Path(tmp)
+        with offline_environment(workdir) as artwork:
+            cases = build_cases(workdir, artwork, **build_options)
+            print(f"{'case':32} {'items/s':>10} {'ms/item':>10} {'peak MB':>9}")
+            for name, items, run in cases:
+                if args.only and args.only not in name:
+                    continue
+                result = time_case(run, items, repeat)
+                result['peak_rss_mb'] = measure_peak_memory(name, build_options) if measure_memory else None
+                results[name] = result
+                memory = f"{result['peak_rss_mb']:9.1f}" if result['peak_rss_mb'] is not None else f"{'-':>9}"
+                print(f"{name:32} {result['per_second']:10.1f} {result['seconds'] * 1000 / items:10.2f} {memory}")
+
+    if args.save:
+        path = Path(args.save).expanduser()
+        path.write_text(json.dumps({'environment': environment_info(), 'results': results}, indent=2) + "\n",
+                        encoding="utf-8")
+        print(f"\nSaved results to {path}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).expanduser().read_text(encoding="utf-8"))
+        regressions = compare(results, baseline['results'], args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold:g}%: "
+                  f"{', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Synthetic, offline inputs for benchmarks.
+
+Builds PokemonData, artwork and type icons locally so benchmark runs never
+touch PokeAPI and are reproducible from one machine to the next.
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List
+
+from PIL import Image, ImageDraw
+
+from src.models import PokemonBasicData, PokemonData, PokemonType
+from src.utils.cache_manager import ImageCache, cache_manager
+from src.utils.type_icon_manager import type_icon_manager
+
+PALETTE = ['#F08030', '#6890F0', '#78C850', '#F8D030', '#A040A0', '#E0C068', '#98D8D8', '#7038F8']
+
+# Mix of short, multi-word and long names to exercise fitting and wrapping
+SYNTHETIC_NAMES = [
+    {'en': 'Pikachu', 'ja': 'ピカチュウ', 'zh-Hant': '皮卡丘'},
+    {'en': 'Mr. Mime', 'ja': 'バリヤード', 'zh-Hant': '魔牆人偶'},
+    {'en': 'Tapu Koko', 'ja': 'カプ・コケコ', 'zh-Hant': '卡璞・鳴鳴'},
+    {'en': 'Iron Valiant', 'ja': 'テツノブジン', 'zh-Hant': '鐵武者'},
+    {'en': 'Crabominable', 'ja': 'ケケンカニ', 'zh-Hant': '好勝毛蟹'},
+    {'en': 'Great Tusk Ancient Paradox', 'ja': 'イダイナキバ', 'zh-Hant': '雄偉牙'},
+]
+
+
+def make_pokemon(pokemon_id: int) -> PokemonData:
+    """Create Pokemon data with names in every supported language and one or two types."""
+    type_names = list(type_icon_manager.type_to_id)
+    types = [PokemonType(slot=1, type={'name': type_names[pokemon_id % len(type_names)], 'url': ''})]
+    if pokemon_id % 2:
+        types.append(PokemonType(slot=2, type={'name': type_names[(pokemon_id * 7) % len(type_names)], 'url': ''}))
+
+    names = SYNTHETIC_NAMES[pokemon_id % len(SYNTHETIC_NAMES)]
+    basic = PokemonBasicData(id=pokemon_id, name=names['en'].lower(), height=10, weight=100, types=types)
+    return PokemonData(basic=basic, names=dict(names))
+
+
+def make_artwork(path: Path, pokemon_id: int, size: int = 475) -> Path:
+    """Draw artwork the size of PokeAPI official artwork: a transparent canvas with a colored body."""
+    color = PALETTE[pokemon_id % len(PALETTE)]
+    image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    inset = size // 8 + pokemon_id % (size // 8)
+    draw.ellipse([inset, inset, size - inset, size - inset], fill=color, outline='black', width=6)
+    draw.polygon([(size // 2, inset // 2), (inset, size // 2), (size - inset, size // 2)], fill='white')
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    image.save(path)
+    return path
+
+
+def make_type_icons(directory: Path, size: int = 140) -> None:
+    """Write a round placeholder icon for every type, as TypeIconManager caches them."""
+    directory.mkdir(parents=True, exist_ok=True)
+    for index, type_name in enumerate(type_icon_manager.type_to_id):
+        icon = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        ImageDraw.Draw(icon).ellipse([4, 4, size - 4, size - 4], fill=PALETTE[index % len(PALETTE)])
+        icon.save(directory / f"{type_name}.png")
+
+
+@contextmanager
+def offline_environment(workdir: Path, artwork_count: int = 9) -> Iterator[List[Path]]:
+    """
+    Point type icons and the image cache at a scratch directory and create artwork there.
+
+    Args:
+        workdir: Scratch directory for icons, artwork and derived images
+        artwork_count: Number of distinct artwork files to create
+
+    Yields:
+        Artwork paths, one per synthetic Pokemon ID starting at 1
+    """
+    original_icon_dir = type_icon_manager.cache_dir
+    original_image_cache = cache_manager.image_cache
+    try:
+        type_icon_manager.cache_dir = workdir / "type_icons"
+        make_type_icons(type_icon_manager.cache_dir)
+        type_icon_manager.invalidate()
+        cache_manager.image_cache = ImageCache(workdir / "images")
+        yield [make_artwork(workdir / "artwork" / f"{pid}.png", pid) for pid in range(1, artwork_count + 1)]
+    finally:
+        type_icon_manager.cache_dir = original_icon_dir
+        type_icon_manager.invalidate()
+        cache_manager.image_cache = original_image_cache
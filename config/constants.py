@@ -58,6 +58,18 @@ FALLBACK_FONTS: Dict[str, List[str]] = {
     'ja': ['Hiragino Sans GB', 'STHeiti Medium', 'Yu Gothic', 'Hiragino Sans'],
 }
 
+# Further CJK families tried for Chinese and Japanese before any other covering font
+CJK_FALLBACK_FONTS: List[str] = [
+    # Primary Chinese fonts
+    'PingFang TC', 'PingFang SC', 'STHeiti', 'STHeiti Light', 'STHeiti Medium',
+    'Hiragino Sans GB', 'Hiragino Sans CNS',
+    # Primary Japanese fonts
+    'Hiragino Sans', 'Hiragino Kaku Gothic Pro', 'Hiragino Kaku Gothic ProN',
+    'Yu Gothic', 'Yu Gothic Medium', 'AppleGothic',
+    # Universal CJK fonts
+    'Arial Unicode MS', 'Microsoft JhengHei', 'Microsoft YaHei', 'SimHei', 'SimSun',
+]
+
 # API endpoints
 API_ENDPOINTS: Dict[str, str] = {
     'pokemon': '/pokemon/{id}',
@@ -82,6 +94,10 @@ CACHE_KEYS: Dict[str, str] = {
     'names': 'names_{id}_{language}',
 }
 
+# Version of the compact card record stored under CACHE_KEYS['pokemon'];
+# bump when its layout changes so stale records are refetched
+CARD_RECORD_SCHEMA_VERSION = 1
+
 # File extensions and MIME types
 SUPPORTED_IMAGE_FORMATS: Dict[str, str] = {
     '.png': 'image/png',
@@ -98,6 +114,9 @@ PDF_CONSTANTS: Dict[str, Any] = {
     'DEFAULT_QUALITY': 300,    # DPI for images
 }
 
+# Compression of card images embedded in PDFs
+IMAGE_ENCODINGS: Tuple[str, ...] = ('flate', 'jpeg')
+
 # Error messages
 ERROR_MESSAGES: Dict[str, str] = {
     'POKEMON_NOT_FOUND': 'Pokemon with ID {id} not found',
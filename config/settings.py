@@ -2,8 +2,9 @@
 Configuration settings for the Pokemon card generator.
 """
 
+import os
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Tuple
 
 
 @dataclass
@@ -47,7 +48,9 @@ class APISettings:
     cache_duration_hours: int = 24
     max_retries: int = 3
     timeout_seconds: int = 30
-    rate_limit_delay: float = 0.1  # Seconds between requests
+    rate_limit_per_second: float = 10.0  # Sustained request rate; 0 disables limiting
+    rate_limit_burst: int = 10  # Requests allowed back-to-back after an idle period
+    flavor_text_languages: Tuple[str, ...] = ()  # Flavor text kept in cached card records
 
 
 @dataclass
@@ -58,12 +61,48 @@ class PDFSettings:
     card_spacing_mm: float = 2.0
     cards_per_row: int = 3
     cards_per_column: int = 3
+    image_encoding: str = "flate"  # Card image compression: 'flate' (lossless) or 'jpeg'
+    jpeg_quality: int = 90  # 1-100, used when image_encoding is 'jpeg'
+    downsample_dpi: int = 0  # Resample cards to this DPI when embedding; 0 keeps the card DPI
+    encode_workers: int = 0  # Threads compressing card images; 0 = one per CPU core, 1 = encode while writing
+    shard_workers: int = 0  # Processes writing PDF shards; 0 = one per CPU core, up to max_shard_workers
+    max_shard_workers: int = 4  # Cap on the default count; an in-flight shard holds ~3 MB of raw pixels per card in each process
+    shard_retries: int = 1  # Times a failed shard is rewritten before the run fails
 
     @property
     def cards_per_page(self) -> int:
         """Calculate total cards per page."""
         return self.cards_per_row * self.cards_per_column
 
+    @property
+    def encode_worker_count(self) -> int:
+        """Resolve the effective number of image encoding threads."""
+        if self.encode_workers > 0:
+            return self.encode_workers
+        return os.cpu_count() or 1
+
+    @property
+    def shard_worker_count(self) -> int:
+        """Resolve the effective number of shard-writing processes."""
+        if self.shard_workers > 0:
+            return self.shard_workers
+        return min(os.cpu_count() or 1, self.max_shard_workers)
+
+
+@dataclass
+class RenderSettings:
+    """Settings for card rendering."""
+    workers: int = 0  # Render processes; 0 = one per CPU core, 1 = render in-process
+    max_pending_per_worker: int = 2  # Cards queued ahead of each worker
+    use_card_cache: bool = True  # Reuse finished cards whose inputs are unchanged
+
+    @property
+    def worker_count(self) -> int:
+        """Resolve the effective number of render workers."""
+        if self.workers > 0:
+            return self.workers
+        return os.cpu_count() or 1
+
 
 @dataclass
 class FontSettings:
@@ -87,6 +126,7 @@ class AppSettings:
     api: APISettings = None
     pdf: PDFSettings = None
     font: FontSettings = None
+    render: RenderSettings = None
 
     def __post_init__(self):
         if self.card is None:
@@ -97,6 +137,8 @@ class AppSettings:
             self.pdf = PDFSettings()
         if self.font is None:
             self.font = FontSettings()
+        if self.render is None:
+            self.render = RenderSettings()
 
 
 # Global settings instance
@@ -6,28 +6,38 @@ A comprehensive tool for generating printable Pokemon cards from PokeAPI.
 Supports generation/ID search, multi-language names, and A4-optimized PDF output.
 """
 
+import argparse
 import asyncio
+import contextlib
+import json
+import logging
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
 from rich.console import Console
 import tomllib
 
-# Import core modules
-from src.api.pokemon_api import get_pokemon_api_client, get_pokemon_batch_async
-from src.api.image_downloader import download_pokemon_images_async
-from src.card.card_designer import CardDesigner
-from src.pdf.pdf_generator import PDFGenerator
+# Import core modules needed before the first prompt; the API, rendering and
+# PDF pipeline (aiohttp, requests, pydantic, PIL, reportlab) is imported on first use
 from src.ui.menu_system import InteractiveSession, ProgressReporter
 from src.ui.input_validator import InputValidator
 from src.ui.welcome import show_welcome_screen, show_first_run_message
 from src.utils.cache_manager import cache_manager
+from src.utils.instrumentation import instrumentation, profile_run
 from src.utils.error_handler import (
     PokemonCardGeneratorError, log_error, display_error
 )
-from src.models import PokemonData
-from config.constants import GENERATION_RANGES, GENERATION_NAMES
+from config.constants import GENERATION_RANGES, GENERATION_NAMES, IMAGE_ENCODINGS, LANGUAGE_NAMES, MAX_VALUES
+from config.settings import settings
+
+if TYPE_CHECKING:
+    from PIL import Image
+    from src.card.card_designer import CardDesigner
+    from src.models import PokemonData
+    from src.pdf.image_encoding import ImageEncoding
+    from src.pdf.pdf_generator import PDFGenerator
 
 # Initialize components
 console = Console()
@@ -48,12 +58,31 @@ def get_version() -> str:
 class PokemonCardGenerator:
     """Main application class."""
 
-    def __init__(self):
-        self.session = InteractiveSession()
+    def __init__(self, interactive: bool = True, render_workers: Optional[int] = None):
         self.progress = ProgressReporter(console)
-        self.card_designer = CardDesigner()
-        self.pdf_generator = PDFGenerator()
-        self._show_welcome()
+        self.render_workers = render_workers
+        self.renderer = None
+        self._card_designer: Optional["CardDesigner"] = None
+        self._pdf_generator: Optional["PDFGenerator"] = None
+        if interactive:
+            self.session = InteractiveSession()
+            self._show_welcome()
+
+    @property
+    def card_designer(self) -> "CardDesigner":
+        """Card designer, created on first use."""
+        if self._card_designer is None:
+            from src.card.card_designer import CardDesigner
+            self._card_designer = CardDesigner()
+        return self._card_designer
+
+    @property
+    def pdf_generator(self) -> "PDFGenerator":
+        """PDF generator, created on first use."""
+        if self._pdf_generator is None:
+            from src.pdf.pdf_generator import PDFGenerator
+            self._pdf_generator = PDFGenerator()
+        return self._pdf_generator
 
     def _show_welcome(self):
         """Show welcome screen and first-run message."""
@@ -97,13 +126,10 @@ class PokemonCardGenerator:
             console.print("\n[cyan]Step 1: Downloading Pokemon images...[/cyan]")
             image_paths = await self._download_images(pokemon_list)
 
-            # Generate cards
-            console.print("\n[cyan]Step 2: Generating Pokemon cards...[/cyan]")
-            cards = await self._generate_cards(pokemon_list, image_paths, session_data['language'])
-
-            # Create PDF
-            console.print("\n[cyan]Step 3: Creating PDF...[/cyan]")
-            pdf_result = await self._create_pdf(cards, session_data)
+            # Generate cards and stream them into the PDF page by page
+            console.print("\n[cyan]Step 2: Generating Pokemon cards and creating PDF...[/cyan]")
+            jobs = self._prepare_card_jobs(pokemon_list, image_paths, session_data['language'])
+            pdf_result = await self._create_pdf(jobs, session_data)
 
             # Show success
             self.session.menu.show_success(
@@ -122,68 +148,49 @@ class PokemonCardGenerator:
             log_error(e, "CRITICAL")
             display_error(e)
 
-    async def _fetch_pokemon_data(self, session_data: dict) -> List[PokemonData]:
-        """Fetch Pokemon data based on search method."""
+    def _resolve_pokemon_ids(self, session_data: dict) -> List[int]:
+        """Get the Pokemon IDs selected by the search."""
         search_method = session_data.get('search_method')
 
-        try:
-            if search_method == 'generation':
-                generations = session_data['generations']
+        if search_method == 'generation':
+            # Collect all Pokemon IDs from selected generations
+            pokemon_ids = []
+            for gen in session_data['generations']:
+                start_id, end_id = GENERATION_RANGES[gen]
+                pokemon_ids.extend(range(start_id, end_id + 1))
+            return pokemon_ids
 
-                # Collect all Pokemon IDs from selected generations
-                all_pokemon_ids = []
-                for gen in generations:
-                    start_id, end_id = GENERATION_RANGES[gen]
-                    all_pokemon_ids.extend(range(start_id, end_id + 1))
+        if search_method == 'id':
+            return session_data['pokemon_ids']
 
-                from src.api.pokemon_api import AsyncPokemonAPIClient
+        raise PokemonCardGeneratorError("Name search not implemented yet")
 
-                with self.progress:
-                    self.progress.start_progress(
-                        f"Fetching {len(all_pokemon_ids)} Pokemon from {len(generations)} generation(s)...",
-                        total=len(all_pokemon_ids)
-                    )
-
-                    # Fetch in batches and update progress
-                    pokemon_list = []
-                    batch_size = 20
-                    client = AsyncPokemonAPIClient()
+    @instrumentation.timed("stage.fetch")
+    async def _fetch_pokemon_data(self, session_data: dict) -> List["PokemonData"]:
+        """Fetch Pokemon data based on search method."""
+        from src.api.pokemon_api import AsyncPokemonAPIClient
 
-                    for i in range(0, len(all_pokemon_ids), batch_size):
-                        batch_ids = all_pokemon_ids[i:i + batch_size]
-                        batch_pokemon = await client.get_pokemon_batch(batch_ids)
-                        pokemon_list.extend(batch_pokemon)
-                        self.progress.update_progress(completed=min(i + batch_size, len(all_pokemon_ids)))
+        try:
+            pokemon_ids = self._resolve_pokemon_ids(session_data)
+            if session_data.get('search_method') == 'generation':
+                description = (f"Fetching {len(pokemon_ids)} Pokemon from "
+                               f"{len(session_data['generations'])} generation(s)...")
+            else:
+                description = f"Fetching {len(pokemon_ids)} Pokemon..."
 
-                    self.progress.stop_progress()
+            with self.progress:
+                self.progress.start_progress(description, total=len(pokemon_ids))
 
-            elif search_method == 'id':
-                pokemon_ids = session_data['pokemon_ids']
+                def update_fetch_progress(completed, total, pokemon_id):
+                    self.progress.update_progress(completed=completed)
 
-                with self.progress:
-                    self.progress.start_progress(
-                        f"Fetching {len(pokemon_ids)} Pokemon...",
-                        total=len(pokemon_ids)
+                # One pooled session keeps requests in flight across the whole list
+                async with AsyncPokemonAPIClient() as client:
+                    pokemon_list = await client.fetch_pokemon(
+                        pokemon_ids, progress_callback=update_fetch_progress
                     )
 
-                    # Use async client for batch requests with progress tracking
-                    from src.api.pokemon_api import AsyncPokemonAPIClient
-                    client = AsyncPokemonAPIClient()
-
-                    # Fetch in batches and update progress
-                    pokemon_list = []
-                    batch_size = 20
-
-                    for i in range(0, len(pokemon_ids), batch_size):
-                        batch_ids = pokemon_ids[i:i + batch_size]
-                        batch_pokemon = await client.get_pokemon_batch(batch_ids)
-                        pokemon_list.extend(batch_pokemon)
-                        self.progress.update_progress(completed=min(i + batch_size, len(pokemon_ids)))
-
-                    self.progress.stop_progress()
-
-            else:
-                raise PokemonCardGeneratorError("Name search not implemented yet")
+                self.progress.stop_progress()
 
             return pokemon_list
 
@@ -192,8 +199,12 @@ class PokemonCardGenerator:
                 self.progress.stop_progress()
             raise
 
-    async def _download_images(self, pokemon_list: List[PokemonData]) -> Dict[int, Optional[Path]]:
+    @instrumentation.timed("stage.download")
+    async def _download_images(self, pokemon_list: List["PokemonData"]) -> Dict[int, Optional[Path]]:
         """Download Pokemon images."""
+        from src.api.image_downloader import download_pokemon_images_async
+        from src.utils.type_icon_manager import type_icon_manager
+
         pokemon_ids = [p.pokemon_id for p in pokemon_list]
 
         try:
@@ -230,6 +241,9 @@ class PokemonCardGenerator:
                         max_concurrent=20
                     )
 
+            # Fetch type icons now so rendering never blocks on the network
+            await type_icon_manager.provision_type_icons()
+
             # Get all image paths
             image_paths = {}
             for pokemon_id in pokemon_ids:
@@ -241,70 +255,96 @@ class PokemonCardGenerator:
         except Exception as e:
             raise
 
-    async def _generate_cards(self, pokemon_list: List[PokemonData],
-                            image_paths: Dict[int, Optional[Path]],
-                            language: Union[str, List[str]]) -> List:
-        """Generate Pokemon cards."""
-        cards = []
+    def _prepare_card_jobs(self, pokemon_list: List["PokemonData"],
+                           image_paths: Dict[int, Optional[Path]],
+                           language: Union[str, List[str]]) -> List[Tuple["PokemonData", Path]]:
+        """Pair each Pokemon with its image, skipping those without one."""
+        # Handle display name for warnings - use first language for display
+        display_lang = language[0] if isinstance(language, list) else language
+
+        jobs = []
+        for pokemon in pokemon_list:
+            image_path = image_paths.get(pokemon.pokemon_id)
+            if image_path and image_path.exists():
+                jobs.append((pokemon, image_path))
+            else:
+                console.print(f"[yellow]Warning: No image for {pokemon.get_display_name(display_lang)} (ID: {pokemon.pokemon_id})[/yellow]")
 
-        with self.progress:
-            self.progress.start_progress(f"Generating {len(pokemon_list)} cards...")
+        return jobs
 
-            try:
-                for i, pokemon in enumerate(pokemon_list):
-                    # Handle display name for progress - use first language for display
-                    if isinstance(language, list):
-                        display_lang = language[0]
-                    else:
-                        display_lang = language
-
-                    self.progress.update_progress(f"Generating card {i+1}/{len(pokemon_list)}: {pokemon.get_display_name(display_lang)}")
-
-                    image_path = image_paths.get(pokemon.pokemon_id)
-                    if image_path and image_path.exists():
-                        card = self.card_designer.create_card(pokemon, image_path, language)
-                        cards.append(card)
-                    else:
-                        console.print(f"[yellow]Warning: No image for {pokemon.get_display_name(display_lang)} (ID: {pokemon.pokemon_id})[/yellow]")
+    def _generate_cards(self, jobs: List[Tuple["PokemonData", Path]],
+                        language: Union[str, List[str]]) -> Iterator["Image.Image"]:
+        """Generate Pokemon cards lazily, one at a time, in job order."""
+        from src.card.parallel_renderer import ParallelCardRenderer
 
-                self.progress.stop_progress()
-                return cards
+        display_lang = language[0] if isinstance(language, list) else language
+        self.renderer = ParallelCardRenderer(workers=self.render_workers, card_designer=self.card_designer)
 
-            except Exception as e:
-                self.progress.stop_progress()
-                raise
+        def update_render_progress(completed, pokemon):
+            self.progress.update_progress(
+                f"Generating card {completed}/{len(jobs)}: {pokemon.get_display_name(display_lang)}",
+                completed=completed
+            )
 
-    async def _create_pdf(self, cards: List, session_data: dict):
-        """Create PDF from cards."""
-        # Generate output filename
+        return self.renderer.iter_cards(jobs, language, progress_callback=update_render_progress)
+
+    def _default_filename(self, session_data: dict) -> str:
+        """Build a timestamped PDF filename for the search."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         search_method = session_data.get('search_method', 'custom')
 
         if search_method == 'generation':
             generations = session_data.get('generations', [])
             if len(generations) == 1:
-                filename = f"pokemon_cards_gen{generations[0]}_{timestamp}.pdf"
-            else:
-                gen_str = "_".join(map(str, generations))
-                filename = f"pokemon_cards_gen{gen_str}_{timestamp}.pdf"
-        else:
-            filename = f"pokemon_cards_custom_{timestamp}.pdf"
-
-        # Ask user where to save the PDF
-        output_path = self._get_output_path(filename)
+                return f"pokemon_cards_gen{generations[0]}_{timestamp}.pdf"
+            gen_str = "_".join(map(str, generations))
+            return f"pokemon_cards_gen{gen_str}_{timestamp}.pdf"
+
+        return f"pokemon_cards_custom_{timestamp}.pdf"
+
+    @instrumentation.timed("stage.create_pdf")
+    async def _create_pdf(self, jobs: List[Tuple["PokemonData", Path]], session_data: dict,
+                          output_path: Optional[Path] = None, encoding: Optional["ImageEncoding"] = None,
+                          shard_pages: Optional[int] = None, merge_shards: bool = False):
+        """
+        Render cards and stream them into the PDF.
+
+        Args:
+            jobs: (pokemon, image path) pairs to render
+            session_data: Search and language choices
+            output_path: Where to write the PDF; asks the user when omitted
+            encoding: Image compression for the cards (default: settings.pdf)
+            shard_pages: Split the output into files of this many pages, written in parallel
+            merge_shards: Merge the shards back into output_path
+        """
+        if output_path is None:
+            # Ask user where to save the PDF
+            output_path = self._get_output_path(self._default_filename(session_data))
 
         with self.progress:
-            self.progress.start_progress("Creating PDF...")
+            self.progress.start_progress(f"Generating {len(jobs)} cards...", total=len(jobs))
 
             try:
                 metadata = {
                     'title': f'Pokemon Cards - {session_data.get("search_method", "Custom").title()}',
                     'language': session_data.get('language', 'en'),
                     'generated_at': datetime.now().isoformat(),
-                    'total_cards': len(cards)
+                    'total_cards': len(jobs)
                 }
 
-                result = self.pdf_generator.generate_cards_pdf(cards, str(output_path), metadata)
+                # Rendering and PDF writing are interleaved; "render.card" times producing each card
+                cards = instrumentation.timed_iter(
+                    "render.card", self._generate_cards(jobs, session_data['language'])
+                )
+                if shard_pages:
+                    result = self.pdf_generator.generate_cards_pdf_shards(
+                        cards, str(output_path), shard_pages, metadata, merge=merge_shards,
+                        total_cards=len(jobs), encoding=encoding
+                    )
+                else:
+                    result = self.pdf_generator.generate_cards_pdf_stream(
+                        cards, str(output_path), metadata, total_cards=len(jobs), encoding=encoding
+                    )
                 self.progress.stop_progress()
                 return result
 
@@ -399,11 +439,217 @@ class PokemonCardGenerator:
         cache_stats = cache_manager.get_comprehensive_stats()
         console.print(f"\n[dim]Cache: {cache_stats['image_cache']['total_images']} images, "
                      f"{cache_stats['memory_cache']['total_entries']} memory entries, "
-                     f"{cache_stats['file_cache']['total_files']} cached files[/dim]")
+                     f"{cache_stats['file_cache'].get('total_entries', 0)} cached API entries, "
+                     f"{cache_stats['rendered_card_cache'].get('total_cards', 0)} rendered cards[/dim]")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments; without a search scope the CLI runs interactively."""
+    parser = argparse.ArgumentParser(
+        prog="ptcg",
+        description="Generate printable Pokemon cards. Run without arguments for the interactive "
+                    "menu, or pass --generations/--ids for a non-interactive batch run."
+    )
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument("--generations", metavar="GENS",
+                       help="Generations to print, e.g. '1', '1,3' or '1-3'")
+    scope.add_argument("--ids", metavar="IDS",
+                       help="Pokemon IDs to print, e.g. '25', '1,4,7' or '1-151'")
+    parser.add_argument("--language", metavar="LANGS",
+                        help=f"Card name language(s), comma-separated from {', '.join(LANGUAGE_NAMES)} "
+                             "(default: en)")
+    parser.add_argument("--output", metavar="PATH",
+                        help="Output PDF file, or directory for a timestamped file (default: current directory)")
+    parser.add_argument("--workers", type=int, metavar="N",
+                        help="Render processes (default: one per CPU core; 1 renders in-process)")
+    parser.add_argument("--summary", metavar="FILE",
+                        help="Also write the JSON run summary to FILE")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="Profile the run with cProfile and dump stats to FILE")
+    parser.add_argument("--image-encoding", choices=IMAGE_ENCODINGS,
+                        help=f"Card image compression: lossless flate or smaller jpeg "
+                             f"(default: {settings.pdf.image_encoding})")
+    parser.add_argument("--jpeg-quality", type=int, metavar="Q",
+                        help=f"JPEG quality 1-100 (default: {settings.pdf.jpeg_quality})")
+    parser.add_argument("--downsample-dpi", type=int, metavar="DPI",
+                        help="Resample cards to DPI when embedding, e.g. 150 for proofs "
+                             f"(default: keep {settings.card.dpi})")
+    parser.add_argument("--shard-pages", type=int, metavar="N",
+                        help="Write the PDF as numbered files of N pages each, in parallel")
+    parser.add_argument("--merge-shards", action="store_true",
+                        help="Merge the shards back into one PDF (requires PyPDF2)")
+
+    args = parser.parse_args(argv)
+    batch_options = (args.language, args.output, args.workers, args.summary, args.profile,
+                     args.image_encoding, args.jpeg_quality, args.downsample_dpi, args.shard_pages)
+    if not (args.generations or args.ids) and any(option is not None for option in batch_options):
+        parser.error("--generations or --ids is required for a batch run")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.shard_pages is not None and args.shard_pages < 1:
+        parser.error("--shard-pages must be at least 1")
+    if args.merge_shards and not args.shard_pages:
+        parser.error("--merge-shards requires --shard-pages")
+    return args
+
+
+def build_batch_session(args: argparse.Namespace) -> dict:
+    """Translate batch arguments into the session data the interactive workflow produces."""
+    validator = InputValidator(max_batch_size=MAX_VALUES['POKEMON_ID'])
+
+    language_arg = args.language or 'en'
+    languages = [lang.strip() for lang in language_arg.split(",") if lang.strip()]
+    unknown = [lang for lang in languages if lang not in LANGUAGE_NAMES]
+    if not languages or unknown:
+        raise PokemonCardGeneratorError(
+            f"Unsupported language: {', '.join(unknown) or language_arg!r}. "
+            f"Choose from {', '.join(LANGUAGE_NAMES)}."
+        )
+    language = languages[0] if len(languages) == 1 else languages
+
+    if args.generations:
+        return {
+            'search_method': 'generation',
+            'generations': validator.parse_generation_input(args.generations),
+            'language': language
+        }
+    return {
+        'search_method': 'id',
+        'pokemon_ids': validator.parse_pokemon_id_input(args.ids),
+        'language': language
+    }
+
+
+def build_image_encoding(args: argparse.Namespace) -> "ImageEncoding":
+    """Combine the batch encoding options with the configured defaults."""
+    from src.pdf.image_encoding import ImageEncoding
+
+    return ImageEncoding(
+        args.image_encoding or settings.pdf.image_encoding,
+        args.jpeg_quality if args.jpeg_quality is not None else settings.pdf.jpeg_quality,
+        args.downsample_dpi if args.downsample_dpi is not None else settings.pdf.downsample_dpi
+    )
+
+
+def _route_output_to_stderr() -> None:
+    """Send progress, messages and log output to stderr so stdout carries only the JSON summary."""
+    global console
+    console = Console(stderr=True)
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.StreamHandler) and getattr(handler, 'stream', None) is sys.stdout:
+            handler.setStream(sys.stderr)
+
+
+async def run_batch(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Run fetch, download, render and PDF generation without prompts.
+
+    Args:
+        args: Parsed batch-mode arguments
+
+    Returns:
+        JSON-serializable run summary with per-stage timings and span statistics
+    """
+    instrumentation.reset()
+    run_start = time.perf_counter()
+    session_data = build_batch_session(args)
+    encoding = build_image_encoding(args)
+    app = PokemonCardGenerator(interactive=False, render_workers=args.workers)
+
+    pokemon_list = await app._fetch_pokemon_data(session_data)
+    if not pokemon_list:
+        raise PokemonCardGeneratorError("No Pokemon found for the requested scope")
+
+    image_paths = await app._download_images(pokemon_list)
+
+    jobs = app._prepare_card_jobs(pokemon_list, image_paths, session_data['language'])
+    if not jobs:
+        raise PokemonCardGeneratorError("No Pokemon images available to render")
+
+    output_path = Path(args.output).expanduser() if args.output else Path.cwd()
+    if output_path.suffix.lower() != ".pdf":
+        output_path = output_path / app._default_filename(session_data)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    pdf_result = await app._create_pdf(jobs, session_data, output_path=output_path, encoding=encoding,
+                                       shard_pages=args.shard_pages, merge_shards=args.merge_shards)
+    render_seconds = instrumentation.total('render.card')
+    timings = {
+        'fetch': instrumentation.total('stage.fetch'),
+        'download': instrumentation.total('stage.download'),
+        'render': render_seconds,
+        'pdf': instrumentation.total('stage.create_pdf') - render_seconds,
+        'total': time.perf_counter() - run_start
+    }
+
+    summary = {
+        'status': 'ok',
+        'output': pdf_result.file_path,
+        'language': session_data['language'],
+        'workers': app.renderer.workers if app.renderer else args.workers,
+        'requested': len(app._resolve_pokemon_ids(session_data)),
+        'fetched': len(pokemon_list),
+        'cards': pdf_result.total_cards,
+        'pages': pdf_result.total_pages,
+        'file_size_mb': round(pdf_result.file_size_mb, 3),
+        'image_encoding': {
+            'format': encoding.format,
+            'jpeg_quality': encoding.jpeg_quality if encoding.format == 'jpeg' else None,
+            'downsample_dpi': encoding.downsample_dpi or None
+        },
+        'rendered_card_cache_hits': app.renderer.cache_hits if app.renderer else 0,
+        'timings_seconds': {stage: round(seconds, 3) for stage, seconds in timings.items()},
+        'cards_per_second': round(pdf_result.total_cards / timings['total'], 2) if timings['total'] > 0 else 0.0,
+        'spans': {
+            name: {stat: round(value, 6) if isinstance(value, float) else value for stat, value in stats.items()}
+            for name, stats in instrumentation.get_stats().items()
+        }
+    }
+    if args.shard_pages:
+        summary['shards'] = {
+            'pages_per_shard': args.shard_pages,
+            'merged': pdf_result.merged,
+            'files': pdf_result.shard_paths,
+            'retried': pdf_result.retried_shards
+        }
+    return summary
+
+
+def main_batch(args: argparse.Namespace) -> int:
+    """Entry point for non-interactive batch mode; prints a JSON summary to stdout."""
+    _route_output_to_stderr()
+
+    # Plain print() calls anywhere in the pipeline would otherwise land in the JSON on stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            if args.profile:
+                with profile_run(args.profile):
+                    summary = asyncio.run(run_batch(args))
+                summary['profile'] = str(Path(args.profile).expanduser())
+            else:
+                summary = asyncio.run(run_batch(args))
+            exit_code = 0
+        except KeyboardInterrupt:
+            summary = {'status': 'cancelled'}
+            exit_code = 130
+        except Exception as e:
+            log_error(e, "ERROR")
+            summary = {'status': 'error', 'error': str(e)}
+            exit_code = 1
+
+    output = json.dumps(summary, ensure_ascii=False, indent=2)
+    if args.summary:
+        Path(args.summary).expanduser().write_text(output + "\n", encoding="utf-8")
+    print(output)
+    return exit_code
+
 
+def main(argv: Optional[List[str]] = None):
+    """Main entry point: interactive menu, or batch mode when a search scope is given."""
+    args = parse_args(argv)
+    if args.generations or args.ids:
+        sys.exit(main_batch(args))
 
-def main():
-    """Main entry point for interactive mode."""
     app = PokemonCardGenerator()
     try:
         asyncio.run(app.run())
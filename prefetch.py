@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Pokemon Card Generator - Cache Prefetch
+
+Warms the Pokemon data, species and official artwork caches ahead of a print run,
+so production runs start fully warm. Only entries missing from the cache are
+fetched, and each Pokemon is cached as soon as it arrives, so an interrupted
+prefetch resumes where it left off when re-run.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from rich.console import Console
+
+from src.api.pokemon_api import AsyncPokemonAPIClient
+from src.api.image_downloader import AsyncImageDownloader
+from src.ui.input_validator import InputValidator
+from src.ui.menu_system import ProgressReporter
+from src.utils.cache_manager import cache_manager
+from src.utils.type_icon_manager import type_icon_manager
+from src.utils.error_handler import PokemonCardGeneratorError, display_error
+from config.constants import GENERATION_RANGES, MAX_VALUES
+
+console = Console()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="ptcg-prefetch",
+        description="Warm the Pokemon data, species and artwork caches ahead of a print run."
+    )
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument("--all", action="store_true",
+                       help=f"Prefetch every Pokemon (1-{MAX_VALUES['POKEMON_ID']}); the default")
+    scope.add_argument("--generations", metavar="GENS",
+                       help="Generations to prefetch, e.g. '1', '1,3' or '1-3'")
+    scope.add_argument("--ids", metavar="IDS",
+                       help="Pokemon IDs to prefetch, e.g. '25', '1,4,7' or '1-151'")
+    parser.add_argument("--concurrency", type=int, default=20,
+                        help="Maximum concurrent requests (default: 20)")
+    parser.add_argument("--skip-images", action="store_true",
+                        help="Only warm Pokemon and species data, not artwork")
+    args = parser.parse_args(argv)
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    return args
+
+
+def resolve_pokemon_ids(args: argparse.Namespace) -> List[int]:
+    """Resolve the requested scope into a sorted list of Pokemon IDs."""
+    validator = InputValidator(max_batch_size=MAX_VALUES['POKEMON_ID'])
+
+    if args.generations:
+        pokemon_ids = []
+        for generation in validator.parse_generation_input(args.generations):
+            start_id, end_id = GENERATION_RANGES[generation]
+            pokemon_ids.extend(range(start_id, end_id + 1))
+        return pokemon_ids
+
+    if args.ids:
+        return validator.parse_pokemon_id_input(args.ids)
+
+    return list(range(1, MAX_VALUES['POKEMON_ID'] + 1))
+
+
+def find_missing(pokemon_ids: List[int],
+                 include_images: bool = True) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Split IDs by what the cache still lacks.
+
+    Returns:
+        Tuple of (IDs missing Pokemon data, IDs whose Pokemon data is cached
+        without species data, IDs missing artwork)
+    """
+    missing_pokemon = [pid for pid in pokemon_ids if cache_manager.get_pokemon_data(pid) is None]
+    missing_pokemon_set = set(missing_pokemon)
+    # A cached Pokemon is served from its card record without fetching species, so these need their own fetch
+    missing_species = [pid for pid in pokemon_ids
+                       if pid not in missing_pokemon_set and cache_manager.get_species_data(pid) is None]
+    missing_images = []
+    if include_images:
+        missing_images = [pid for pid in pokemon_ids if not cache_manager.has_pokemon_image(pid)]
+    return missing_pokemon, missing_species, missing_images
+
+
+async def prefetch_data(pokemon_ids: List[int], species_ids: List[int], concurrency: int,
+                        progress: ProgressReporter) -> int:
+    """
+    Fetch Pokemon and species data into the cache.
+
+    Args:
+        pokemon_ids: IDs missing Pokemon data; their species data is fetched with them
+        species_ids: IDs whose Pokemon data is cached but species data is not
+        concurrency: Maximum concurrent requests
+        progress: Progress display
+
+    Returns:
+        Number of IDs whose data was fetched
+    """
+    total = len(pokemon_ids) + len(species_ids)
+    progress.start_progress(f"Fetching data for {total} Pokemon...", total=total)
+
+    def update_fetch_progress(completed, total, pokemon_id):
+        progress.update_progress(completed=completed)
+
+    def update_species_progress(completed, total, pokemon_id):
+        progress.update_progress(completed=len(pokemon_ids) + completed)
+
+    async with AsyncPokemonAPIClient(max_concurrent=concurrency) as client:
+        pokemon_list = await client.fetch_pokemon(pokemon_ids, progress_callback=update_fetch_progress)
+        species_fetched = await client.fetch_species(species_ids, progress_callback=update_species_progress)
+    progress.stop_progress()
+
+    return len(pokemon_list) + len(species_fetched)
+
+
+async def prefetch_images(pokemon_ids: List[int], concurrency: int,
+                          progress: ProgressReporter) -> int:
+    """Download official artwork into the image cache. Returns number downloaded."""
+    progress.start_progress(f"Downloading {len(pokemon_ids)} images...", total=len(pokemon_ids))
+
+    def update_download_progress(completed, total, pokemon_id):
+        progress.update_progress(completed=completed)
+
+    downloader = AsyncImageDownloader(max_concurrent=concurrency, progress_callback=update_download_progress)
+    results = await downloader.get_pokemon_images_batch_async(pokemon_ids)
+    progress.stop_progress()
+
+    return sum(1 for path in results.values() if path)
+
+
+async def run_prefetch(pokemon_ids: List[int], concurrency: int = 20,
+                       include_images: bool = True) -> Dict[str, Any]:
+    """Warm caches for the given IDs and return throughput statistics."""
+    missing_pokemon, missing_species, missing_images = find_missing(pokemon_ids, include_images)
+    missing_data = len(missing_pokemon) + len(missing_species)
+    progress = ProgressReporter(console)
+
+    stats: Dict[str, Any] = {
+        'requested': len(pokemon_ids),
+        'already_cached_data': len(pokemon_ids) - missing_data,
+        'already_cached_images': (len(pokemon_ids) - len(missing_images)) if include_images else 0,
+    }
+
+    with progress:
+        start = time.perf_counter()
+        stats['fetched_data'] = await prefetch_data(missing_pokemon, missing_species, concurrency,
+                                                    progress) if missing_data else 0
+        stats['data_seconds'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        stats['downloaded_images'] = await prefetch_images(missing_images, concurrency, progress) if missing_images else 0
+        stats['image_seconds'] = time.perf_counter() - start
+
+        if include_images:
+            stats['missing_type_icons'] = await type_icon_manager.provision_type_icons()
+
+    stats['data_per_second'] = stats['fetched_data'] / stats['data_seconds'] if stats['data_seconds'] > 0 else 0.0
+    stats['images_per_second'] = stats['downloaded_images'] / stats['image_seconds'] if stats['image_seconds'] > 0 else 0.0
+    stats['failed_data'] = missing_data - stats['fetched_data']
+    stats['failed_images'] = len(missing_images) - stats['downloaded_images']
+    return stats
+
+
+def show_summary(stats: Dict[str, Any]) -> None:
+    """Print a prefetch summary with throughput."""
+    console.print(
+        f"\n[green]✓[/green] Pokemon data: {stats['fetched_data']} fetched "
+        f"({stats['already_cached_data']} already cached) "
+        f"in {stats['data_seconds']:.1f}s — {stats['data_per_second']:.1f} Pokemon/s"
+    )
+    console.print(
+        f"[green]✓[/green] Artwork: {stats['downloaded_images']} downloaded "
+        f"({stats['already_cached_images']} already cached) "
+        f"in {stats['image_seconds']:.1f}s — {stats['images_per_second']:.1f} images/s"
+    )
+
+    failed = stats['failed_data'] + stats['failed_images']
+    if failed:
+        console.print(f"[yellow]{failed} item(s) failed; re-run prefetch to retry them.[/yellow]")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point for cache prefetch."""
+    args = parse_args(argv)
+
+    try:
+        pokemon_ids = resolve_pokemon_ids(args)
+        console.print(f"[cyan]Prefetching {len(pokemon_ids)} Pokemon into {cache_manager.get_cache_location()}[/cyan]")
+
+        stats = asyncio.run(run_prefetch(
+            pokemon_ids,
+            concurrency=args.concurrency,
+            include_images=not args.skip_images
+        ))
+        show_summary(stats)
+        return 0 if stats['failed_data'] + stats['failed_images'] == 0 else 1
+
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Prefetch interrupted. Re-run to resume.[/yellow]")
+        return 130
+    except PokemonCardGeneratorError as e:
+        display_error(e)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
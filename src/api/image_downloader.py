@@ -13,6 +13,7 @@ import io
 
 from src.models import PokemonData, APIResponse
 from src.utils.cache_manager import cache_manager
+from src.utils.rate_limiter import api_rate_limiter
 from src.utils.error_handler import (
     ImageDownloadError, ValidationError,
     handle_errors, log_error, create_error_context
@@ -45,6 +46,8 @@ class ImageDownloader:
     @handle_errors(reraise=True)
     def download_image(self, url: str, pokemon_id: int, retries: int = 0) -> bytes:
         """Download image from URL."""
+        api_rate_limiter.acquire_sync()
+
         try:
             if self.session:
                 response = self.session.get(url, timeout=self.timeout, stream=True)
@@ -208,6 +211,8 @@ class AsyncImageDownloader:
     async def download_image_async(self, session: aiohttp.ClientSession, url: str, pokemon_id: int, retries: int = 0) -> bytes:
         """Download image asynchronously."""
         async with self._semaphore:
+            await api_rate_limiter.acquire()
+
             try:
                 async with session.get(url, timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
                     response.raise_for_status()
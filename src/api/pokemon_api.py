@@ -4,7 +4,7 @@ Pokemon API client for interacting with PokeAPI.
 
 import asyncio
 import time
-from typing import Dict, List, Optional, Set, Union
+from typing import Callable, Dict, List, Optional, Set, Union
 import requests
 import aiohttp
 from pydantic import ValidationError
@@ -14,6 +14,7 @@ from src.models import (
     GenerationData, SearchResult, APIResponse
 )
 from src.utils.cache_manager import cache_manager
+from src.utils.rate_limiter import api_rate_limiter
 from src.utils.error_handler import (
     APIError, PokemonNotFoundError, InvalidGenerationError,
     handle_errors, log_error, validate_pokemon_id, validate_generation,
@@ -26,6 +27,54 @@ from config.constants import (
 )
 
 
+def resolve_official_artwork_url(pokemon_id: int,
+                                 basic_data: Optional[PokemonBasicData] = None) -> str:
+    """Get the official artwork URL from sprite data, falling back to the URL pattern."""
+    if basic_data and basic_data.sprites and basic_data.sprites.other:
+        artwork = basic_data.sprites.other.official_artwork
+        if artwork and artwork.front_default:
+            return str(artwork.front_default)
+
+    return IMAGE_URL_PATTERNS['official_artwork'].format(id=pokemon_id)
+
+
+# PokeAPI language codes worth keeping in cached species data
+CACHED_SPECIES_LANGUAGES = set(LANGUAGE_MAP) | set(LANGUAGE_MAP.values())
+
+
+def load_cached_pokemon(pokemon_id: int) -> Optional[PokemonData]:
+    """Load Pokemon data from its cached card record, upgrading legacy full payloads."""
+    cached_data = cache_manager.get_pokemon_data(pokemon_id)
+    if not cached_data:
+        return None
+
+    try:
+        if 'v' in cached_data:
+            return PokemonData.from_card_record(cached_data)
+        # Full PokeAPI payload cached by an older version: validate once and compact it
+        pokemon_data = PokemonData(**cached_data)
+    except (ValidationError, ValueError, KeyError, TypeError):
+        # Corrupted or outdated cache data, fetch fresh data instead
+        return None
+
+    cache_pokemon(pokemon_data)
+    return pokemon_data
+
+
+def cache_pokemon(pokemon_data: PokemonData) -> None:
+    """Store the compact card record for Pokemon data."""
+    cache_manager.set_pokemon_data(pokemon_data.pokemon_id,
+                                   pokemon_data.to_card_record(settings.api.flavor_text_languages),
+                                   settings.api.cache_duration_hours)
+
+
+def cache_species(pokemon_id: int, species: PokemonSpeciesData) -> None:
+    """Store species data trimmed to the languages the app uses."""
+    cache_manager.set_species_data(pokemon_id,
+                                   species.for_languages(CACHED_SPECIES_LANGUAGES).model_dump(),
+                                   settings.api.cache_duration_hours)
+
+
 class PokemonAPIClient:
     """Client for interacting with PokeAPI."""
 
@@ -33,9 +82,7 @@ class PokemonAPIClient:
         self.base_url = settings.api.base_url
         self.timeout = settings.api.timeout_seconds
         self.max_retries = settings.api.max_retries
-        self.rate_limit_delay = settings.api.rate_limit_delay
         self.session: Optional[requests.Session] = None
-        self._last_request_time = 0.0
 
     def __enter__(self):
         """Context manager entry."""
@@ -50,18 +97,10 @@ class PokemonAPIClient:
         if self.session:
             self.session.close()
 
-    def _rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-        if time_since_last < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - time_since_last)
-        self._last_request_time = time.time()
-
     @handle_errors(reraise=True)
     def _make_request(self, endpoint: str, retries: int = 0) -> Dict:
         """Make HTTP request to PokeAPI with retries."""
-        self._rate_limit()
+        api_rate_limiter.acquire_sync()
 
         url = f"{self.base_url}{endpoint}"
 
@@ -93,13 +132,9 @@ class PokemonAPIClient:
         validate_pokemon_id(pokemon_id)
 
         # Check cache first
-        cached_data = cache_manager.get_pokemon_data(pokemon_id)
-        if cached_data:
-            try:
-                return PokemonData(**cached_data)
-            except ValidationError:
-                # Cache data is corrupted, continue to fetch fresh data
-                pass
+        cached_pokemon = load_cached_pokemon(pokemon_id)
+        if cached_pokemon:
+            return cached_pokemon
 
         # Fetch from API
         endpoint = API_ENDPOINTS['pokemon'].format(id=pokemon_id)
@@ -112,8 +147,8 @@ class PokemonAPIClient:
         # Get species data for names and additional info
         species_data = self.get_pokemon_species(pokemon_id)
 
-        # Get official artwork URL
-        official_artwork_url = self.get_official_artwork_url(pokemon_id)
+        # Get official artwork URL from the sprite data
+        official_artwork_url = self.get_official_artwork_url(pokemon_id, pokemon_basic)
 
         # Create complete Pokemon data
         pokemon_data = PokemonData(
@@ -123,8 +158,7 @@ class PokemonAPIClient:
         )
 
         # Cache the result
-        cache_manager.set_pokemon_data(pokemon_id, pokemon_data.model_dump(),
-                                     settings.api.cache_duration_hours)
+        cache_pokemon(pokemon_data)
 
         return pokemon_data
 
@@ -148,8 +182,7 @@ class PokemonAPIClient:
             species = PokemonSpeciesData(**species_data)
 
             # Cache the result
-            cache_manager.set_species_data(pokemon_id, species.model_dump(),
-                                         settings.api.cache_duration_hours)
+            cache_species(pokemon_id, species)
             return species
 
         except PokemonNotFoundError:
@@ -229,26 +262,17 @@ class PokemonAPIClient:
 
         return names
 
-    def get_official_artwork_url(self, pokemon_id: int) -> Optional[str]:
-        """Get the official artwork URL for a Pokemon."""
-        validate_pokemon_id(pokemon_id)
-
-        # Use the pattern from constants
-        url = IMAGE_URL_PATTERNS['official_artwork'].format(id=pokemon_id)
+    def get_official_artwork_url(self, pokemon_id: int,
+                                 basic_data: Optional[PokemonBasicData] = None) -> Optional[str]:
+        """
+        Get the official artwork URL for a Pokemon.
 
-        # Verify URL exists by making a HEAD request
-        try:
-            if self.session:
-                response = self.session.head(url, timeout=5)
-            else:
-                response = requests.head(url, timeout=5)
-
-            if response.status_code == 200:
-                return url
-        except requests.RequestException:
-            pass
-
-        return None
+        No request is made: the URL comes from the sprite data when available,
+        otherwise from the URL pattern. A missing image surfaces when the
+        artwork is actually downloaded.
+        """
+        validate_pokemon_id(pokemon_id)
+        return resolve_official_artwork_url(pokemon_id, basic_data)
 
     def search_pokemon_by_name(self, name: str, fuzzy: bool = True) -> List[int]:
         """Search Pokemon by name (placeholder implementation)."""
@@ -274,94 +298,221 @@ class AsyncPokemonAPIClient:
         self.base_url = settings.api.base_url
         self.timeout = settings.api.timeout_seconds
         self.max_retries = settings.api.max_retries
-        self.rate_limit_delay = settings.api.rate_limit_delay
         self.max_concurrent = max_concurrent
         self._semaphore = asyncio.Semaphore(max_concurrent)
-        self._last_request_time = 0.0
+        self._session: Optional[aiohttp.ClientSession] = None
 
-    async def _rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-        if time_since_last < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - time_since_last)
-        self._last_request_time = time.time()
+    async def __aenter__(self):
+        """Async context manager entry: open the shared session."""
+        await self.open()
+        return self
 
-    async def _make_request(self, session: aiohttp.ClientSession, endpoint: str, retries: int = 0) -> Dict:
-        """Make async HTTP request with retries."""
-        async with self._semaphore:
-            await self._rate_limit()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit: close the shared session."""
+        await self.close()
+
+    async def open(self) -> None:
+        """Open one pooled session reused by every request made by this client."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrent, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'User-Agent': 'Pokemon-Card-Generator/1.0 (https://github.com/user/pokemon-card-generator)'}
+            )
 
-            url = f"{self.base_url}{endpoint}"
+    async def close(self) -> None:
+        """Close the shared session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
-            try:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
-                    if response.status == 404:
-                        raise PokemonNotFoundError(0)
-                    response.raise_for_status()
-                    return await response.json()
-
-            except aiohttp.ClientError as e:
-                if retries < self.max_retries:
-                    await asyncio.sleep(2 ** retries)
-                    return await self._make_request(session, endpoint, retries + 1)
-                else:
-                    raise APIError(f"Request failed after {self.max_retries} retries: {e}", url=url)
+    async def _make_request(self, session: aiohttp.ClientSession, endpoint: str) -> Dict:
+        """
+        Make async HTTP request with retries.
+
+        A concurrency slot is held only while a request is in flight; it is
+        released before backing off, so retrying requests never hold every
+        slot while waiting for one.
+        """
+        url = f"{self.base_url}{endpoint}"
+
+        for retries in range(self.max_retries + 1):
+            async with self._semaphore:
+                await api_rate_limiter.acquire()
+
+                try:
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
+                        if response.status == 404:
+                            raise PokemonNotFoundError(0)
+                        response.raise_for_status()
+                        return await response.json()
+
+                except aiohttp.ClientError as e:
+                    if retries >= self.max_retries:
+                        raise APIError(f"Request failed after {self.max_retries} retries: {e}", url=url)
+
+            await asyncio.sleep(2 ** retries)
 
     async def get_pokemon_batch(self, pokemon_ids: List[int]) -> List[PokemonData]:
         """Get multiple Pokemon data concurrently."""
-        async with aiohttp.ClientSession() as session:
-            tasks = []
-
-            for pokemon_id in pokemon_ids:
-                # Check cache first
-                cached_data = cache_manager.get_pokemon_data(pokemon_id)
-                if cached_data:
-                    try:
-                        tasks.append(asyncio.create_task(self._return_cached_pokemon(cached_data)))
-                        continue
-                    except ValidationError:
-                        pass
-
-                # Create task for API request
-                task = asyncio.create_task(self._get_pokemon_async(session, pokemon_id))
-                tasks.append(task)
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            pokemon_list = []
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    log_error(result, "WARNING")
-                elif result:
-                    pokemon_list.append(result)
-
-            return pokemon_list
-
-    async def _return_cached_pokemon(self, cached_data: Dict) -> PokemonData:
-        """Return cached Pokemon data."""
-        return PokemonData(**cached_data)
+        return await self.fetch_pokemon(pokemon_ids)
+
+    async def fetch_pokemon(self, pokemon_ids: List[int],
+                            progress_callback: Optional[Callable[[int, int, int], None]] = None
+                            ) -> List[PokemonData]:
+        """
+        Fetch many Pokemon over the shared session through a bounded work queue.
+
+        `max_concurrent` workers pull IDs from the queue, so that many fetches
+        stay in flight until the list is exhausted, with no barrier between
+        batches. Results keep the input order; Pokemon that fail are logged
+        and skipped.
+
+        Args:
+            pokemon_ids: Pokemon IDs to fetch
+            progress_callback: Called with (completed, total, pokemon_id) per Pokemon
+        """
+        total = len(pokemon_ids)
+        if total == 0:
+            return []
+
+        opened_here = self._session is None
+        if opened_here:
+            await self.open()
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrent * 2)
+        results: List[Optional[PokemonData]] = [None] * total
+        worker_count = min(self.max_concurrent, total)
+        completed = 0
+
+        async def produce() -> None:
+            for index, pokemon_id in enumerate(pokemon_ids):
+                await queue.put((index, pokemon_id))
+            for _ in range(worker_count):
+                await queue.put(None)  # One stop signal per worker
+
+        async def work() -> None:
+            nonlocal completed
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+
+                index, pokemon_id = item
+                try:
+                    results[index] = await self._get_pokemon(pokemon_id)
+                except Exception as e:
+                    log_error(e, "WARNING")
+
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, total, pokemon_id)
+
+        try:
+            await asyncio.gather(produce(), *(work() for _ in range(worker_count)))
+        finally:
+            if opened_here:
+                await self.close()
+
+        return [pokemon for pokemon in results if pokemon]
+
+    async def fetch_species(self, pokemon_ids: List[int],
+                            progress_callback: Optional[Callable[[int, int, int], None]] = None
+                            ) -> List[int]:
+        """
+        Fetch species data for Pokemon whose card record was cached without it.
+
+        Each cached card record is rebuilt from the fetched species, so its
+        names and flavor text no longer fall back to English.
+
+        Args:
+            pokemon_ids: Pokemon IDs whose species data is missing
+            progress_callback: Called with (completed, total, pokemon_id) per Pokemon
+
+        Returns:
+            IDs whose species data was fetched and cached
+        """
+        total = len(pokemon_ids)
+        if total == 0:
+            return []
+
+        opened_here = self._session is None
+        if opened_here:
+            await self.open()
+
+        completed = 0
+
+        async def fetch(pokemon_id: int) -> Optional[int]:
+            nonlocal completed
+            try:
+                species = await self._get_species_async(self._session, pokemon_id)
+                if species:
+                    cached_pokemon = load_cached_pokemon(pokemon_id)
+                    if cached_pokemon:
+                        cache_pokemon(cached_pokemon.model_copy(
+                            update={'species': species, 'names': {}, 'flavor_texts': {}}
+                        ))
+            except Exception as e:
+                log_error(e, "WARNING")
+                species = None
+
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, pokemon_id)
+            return pokemon_id if species else None
+
+        try:
+            # Requests are bounded by the client's concurrency semaphore
+            fetched = await asyncio.gather(*(fetch(pokemon_id) for pokemon_id in pokemon_ids))
+        finally:
+            if opened_here:
+                await self.close()
+
+        return [pokemon_id for pokemon_id in fetched if pokemon_id is not None]
+
+    async def _get_pokemon(self, pokemon_id: int) -> Optional[PokemonData]:
+        """Get single Pokemon data from cache, or from the API over the shared session."""
+        cached_pokemon = load_cached_pokemon(pokemon_id)
+        if cached_pokemon:
+            return cached_pokemon
+
+        return await self._get_pokemon_async(self._session, pokemon_id)
+
+    async def _get_species_async(self, session: aiohttp.ClientSession, pokemon_id: int) -> Optional[PokemonSpeciesData]:
+        """Get Pokemon species data from cache, or from the API asynchronously."""
+        cached_data = cache_manager.get_species_data(pokemon_id)
+        if cached_data:
+            try:
+                return PokemonSpeciesData(**cached_data)
+            except ValidationError:
+                pass
+
+        species_endpoint = API_ENDPOINTS['pokemon_species'].format(id=pokemon_id)
+        try:
+            species_data = await self._make_request(session, species_endpoint)
+        except PokemonNotFoundError:
+            # Species data might not exist for some Pokemon
+            return None
+
+        species = PokemonSpeciesData(**species_data)
+        cache_species(pokemon_id, species)
+        return species
 
     async def _get_pokemon_async(self, session: aiohttp.ClientSession, pokemon_id: int) -> Optional[PokemonData]:
         """Get single Pokemon data asynchronously."""
         try:
             validate_pokemon_id(pokemon_id)
 
-            # Fetch basic data
+            # Fetch basic and species data concurrently; they are independent requests
             endpoint = API_ENDPOINTS['pokemon'].format(id=pokemon_id)
-            basic_data = await self._make_request(session, endpoint)
+            basic_data, species = await asyncio.gather(
+                self._make_request(session, endpoint),
+                self._get_species_async(session, pokemon_id)
+            )
             pokemon_basic = PokemonBasicData(**basic_data)
 
-            # Fetch species data
-            species_endpoint = API_ENDPOINTS['pokemon_species'].format(id=pokemon_id)
-            try:
-                species_data = await self._make_request(session, species_endpoint)
-                species = PokemonSpeciesData(**species_data)
-            except PokemonNotFoundError:
-                species = None
-
-            # Get official artwork URL
-            official_artwork_url = IMAGE_URL_PATTERNS['official_artwork'].format(id=pokemon_id)
+            # Get official artwork URL from the sprite data
+            official_artwork_url = resolve_official_artwork_url(pokemon_id, pokemon_basic)
 
             pokemon_data = PokemonData(
                 basic=pokemon_basic,
@@ -370,8 +521,7 @@ class AsyncPokemonAPIClient:
             )
 
             # Cache the result
-            cache_manager.set_pokemon_data(pokemon_id, pokemon_data.model_dump(),
-                                         settings.api.cache_duration_hours)
+            cache_pokemon(pokemon_data)
 
             return pokemon_data
 
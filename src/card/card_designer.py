@@ -2,8 +2,10 @@
 Pokemon card designer - creates the visual layout and design of cards.
 """
 
+from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List, Union
 from PIL import Image, ImageDraw, ImageFont, ImageEnhance
 import io
 
@@ -12,16 +14,41 @@ from src.utils.error_handler import (
     ImageDownloadError, FontNotFoundError,
     handle_errors, log_error, create_error_context
 )
-from src.card.text_renderer import TextRenderer
+from src.card.text_renderer import TextRenderer, text_renderer
 from src.utils.type_icon_manager import type_icon_manager
+from src.utils.cache_manager import cache_manager
+from src.utils.instrumentation import instrumentation
 from config.settings import settings
 from config.constants import FONT_CONFIG, FALLBACK_FONTS
 
 
+@lru_cache(maxsize=8)
+def _render_base_card(width: int, height: int, dpi: int) -> Image.Image:
+    """
+    Render the shared card background once per card geometry.
+
+    The gradient is built as a single-pixel column and stretched to the card
+    width, instead of drawing one line per row for every card.
+    """
+    # Light gray to white, lighter at top
+    column = bytes(int(255 - (y / height) * 20) for y in range(height))
+    shade = Image.frombytes('L', (1, height), column).resize((width, height), Image.Resampling.NEAREST)
+    opaque = Image.new('L', (width, height), 255)
+
+    card = Image.merge('RGBA', (shade, shade, shade, opaque))
+    card.info['dpi'] = (dpi, dpi)
+    return card
+
+
 class CardDesigner:
     """Main card designer for creating Pokemon cards."""
 
-    def __init__(self):
+    # Bump whenever a change to the drawing code alters card pixels,
+    # so previously cached renders are no longer reused
+    DESIGNER_VERSION = 2  # 2: names fitted by advance width and wrapped by the linear wrapper
+
+    def __init__(self, image_cache=None):
+        self._image_cache = image_cache
         self.card_width = settings.card.width_pixels
         self.card_height = settings.card.height_pixels
         self.background_color = settings.card.background_color
@@ -31,7 +58,13 @@ class CardDesigner:
         self.text_height = settings.card.text_height_pixels
         self.text_renderer = TextRenderer()
 
+    @property
+    def image_cache(self):
+        """Cache holding fitted artwork derivatives (default: the global image cache)."""
+        return self._image_cache if self._image_cache is not None else cache_manager.image_cache
+
     @create_error_context("create Pokemon card")
+    @instrumentation.timed("card.create")
     def create_card(self, pokemon_data: PokemonData, image_path: Path, language: str = 'en') -> Image.Image:
         """
         Create a complete Pokemon card image.
@@ -45,79 +78,88 @@ class CardDesigner:
             PIL Image object of the completed card
         """
         # Create base card
-        card = self._create_base_card()
+        with instrumentation.span("card.base"):
+            card = self._create_base_card()
 
         # Add Pokemon image
-        card = self._add_pokemon_image(card, image_path)
+        with instrumentation.span("card.image"):
+            card = self._add_pokemon_image(card, image_path)
 
         # Add Pokemon name
-        card = self._add_pokemon_name(card, pokemon_data, language)
+        with instrumentation.span("card.name"):
+            card = self._add_pokemon_name(card, pokemon_data, language)
 
         # Add decorative elements
-        card = self._add_decorative_elements(card, pokemon_data)
+        with instrumentation.span("card.decorations"):
+            card = self._add_decorative_elements(card, pokemon_data)
 
         # Add border
-        card = self._add_border(card)
+        with instrumentation.span("card.border"):
+            card = self._add_border(card)
 
         return card
 
-    def _create_base_card(self) -> Image.Image:
-        """Create the base card with background."""
-        card = Image.new('RGBA', (self.card_width, self.card_height), self.background_color)
-
-        # Set DPI information for correct print size
-        card.info['dpi'] = (settings.card.dpi, settings.card.dpi)
-
-        # Add subtle gradient background
-        card = self._add_gradient_background(card)
-
-        return card
+    @classmethod
+    def card_cache_key_inputs(cls, pokemon_data: PokemonData, image_path: Path,
+                              language: Union[str, List[str]] = 'en') -> Dict[str, Any]:
+        """
+        Collect everything that determines a card's pixels, for the rendered card cache.
 
-    def _add_gradient_background(self, card: Image.Image) -> Image.Image:
-        """Add a subtle gradient background to the card."""
-        # Create gradient from light gray to white
-        gradient = Image.new('RGBA', (self.card_width, self.card_height))
-        draw = ImageDraw.Draw(gradient)
+        Args:
+            pokemon_data: Complete Pokemon data
+            image_path: Path to Pokemon image
+            language: Language or list of languages for the card name
 
-        for y in range(self.card_height):
-            # Calculate gradient intensity (lighter at top)
-            intensity = int(255 - (y / self.card_height) * 20)  # Subtle gradient
-            color = (intensity, intensity, intensity, 255)
-            draw.line([(0, y), (self.card_width, y)], fill=color)
+        Returns:
+            JSON-serializable description of the card inputs
+        """
+        image_path = Path(image_path)
+        try:
+            stat = image_path.stat()
+            artwork = [str(image_path), stat.st_size, stat.st_mtime_ns]
+        except OSError:
+            artwork = None  # Rendered with the placeholder
+
+        languages = [language] if isinstance(language, str) else list(language)
+        return {
+            'designer_version': cls.DESIGNER_VERSION,
+            'pokemon': pokemon_data.to_card_record(),
+            'artwork': artwork,
+            'language': language,
+            'card_settings': asdict(settings.card),
+            'font_settings': asdict(settings.font),
+            # Names are fitted with the regular face and drawn with the bold one
+            'fonts': [text_renderer.font_identity(lang, style)
+                      for lang in languages for style in ('regular', 'bold')],
+            # Cards drawn with fallback circles must not outlive a later icon download
+            'type_icons': [t for t in pokemon_data.all_types[:2]
+                           if type_icon_manager.get_type_icon_path(t)],
+        }
 
-        # Blend with original card
-        return Image.alpha_composite(card, gradient)
+    def _create_base_card(self) -> Image.Image:
+        """Create the base card with background, copied from a cached template."""
+        # The opaque gradient covers the background color entirely
+        return _render_base_card(self.card_width, self.card_height, settings.card.dpi).copy()
 
     def _add_pokemon_image(self, card: Image.Image, image_path: Path) -> Image.Image:
         """Add Pokemon image to the card."""
         try:
-            # Load and process Pokemon image
-            with Image.open(image_path) as pokemon_img:
-                # Convert to RGBA
-                if pokemon_img.mode != 'RGBA':
-                    pokemon_img = pokemon_img.convert('RGBA')
-
-                # Calculate available space for image
-                available_width = self.card_width - (2 * self.image_padding)
-                available_height = self.card_height - self.text_height - (2 * self.image_padding)
-
-                # Resize image to fit while maintaining aspect ratio
-                pokemon_img = self._resize_with_aspect_ratio(
-                    pokemon_img, available_width, available_height
-                )
+            # Calculate available space for image
+            available_width = self.card_width - (2 * self.image_padding)
+            available_height = self.card_height - self.text_height - (2 * self.image_padding)
 
-                # Enhance image quality
-                pokemon_img = self._enhance_image(pokemon_img)
+            # Load image already fitted and enhanced for this space
+            pokemon_img = self._load_card_artwork(image_path, available_width, available_height)
 
-                # Calculate position to center image both horizontally and vertically
-                x_pos = (self.card_width - pokemon_img.width) // 2
+            # Calculate position to center image both horizontally and vertically
+            x_pos = (self.card_width - pokemon_img.width) // 2
 
-                # Center vertically within available image area
-                available_image_height = available_height
-                y_pos = self.image_padding + (available_image_height - pokemon_img.height) // 2
+            # Center vertically within available image area
+            available_image_height = available_height
+            y_pos = self.image_padding + (available_image_height - pokemon_img.height) // 2
 
-                # Paste image onto card
-                card.paste(pokemon_img, (x_pos, y_pos), pokemon_img)
+            # Paste image onto card
+            card.paste(pokemon_img, (x_pos, y_pos), pokemon_img)
 
         except Exception as e:
             log_error(ImageDownloadError(0, str(image_path), f"Could not add Pokemon image: {e}"), "ERROR")
@@ -126,6 +168,27 @@ class CardDesigner:
 
         return card
 
+    def _load_card_artwork(self, image_path: Path, max_width: int, max_height: int) -> Image.Image:
+        """Load artwork resized and enhanced for the card, reusing the cached derivative."""
+        variant = f"card{max_width}x{max_height}_{settings.card.dpi}dpi_v{self.DESIGNER_VERSION}"
+        artwork = self.image_cache.get_derived_image(image_path, variant)
+        if artwork is not None:
+            return artwork
+
+        with Image.open(image_path) as pokemon_img:
+            # Convert to RGBA
+            if pokemon_img.mode != 'RGBA':
+                pokemon_img = pokemon_img.convert('RGBA')
+
+            # Resize image to fit while maintaining aspect ratio
+            artwork = self._resize_with_aspect_ratio(pokemon_img, max_width, max_height)
+
+        # Enhance image quality
+        artwork = self._enhance_image(artwork)
+
+        self.image_cache.store_derived_image(image_path, variant, artwork)
+        return artwork
+
     def _resize_with_aspect_ratio(self, image: Image.Image, max_width: int, max_height: int) -> Image.Image:
         """Resize image maintaining aspect ratio."""
         img_ratio = image.width / image.height
@@ -282,7 +345,7 @@ class CardDesigner:
 
     def _add_type_indicators(self, card: Image.Image, pokemon_data: PokemonData) -> Image.Image:
         """Add type indicator icons to the card."""
-        # Ensure type icons are available
+        # Ensure type icons are available; a no-op once icons were provisioned up front
         type_icon_manager.ensure_type_icons_cached()
 
         # Get Pokemon types
@@ -297,31 +360,17 @@ class CardDesigner:
             x = x_start - (i * (indicator_size + 5))
             y = y_start
 
-            # Try to load type icon
-            type_icon = type_icon_manager.load_type_icon(type_name)
+            # Decoded and fitted to indicator_size once per process
+            type_icon = type_icon_manager.get_icon(type_name, indicator_size)
 
             if type_icon:
-                # Scale icon proportionally to fit within indicator_size if needed
-                icon_width, icon_height = type_icon.size
-                max_size = indicator_size
-
-                if icon_width > max_size or icon_height > max_size:
-                    # Scale down proportionally
-                    scale_factor = min(max_size / icon_width, max_size / icon_height)
-                    new_width = int(icon_width * scale_factor)
-                    new_height = int(icon_height * scale_factor)
-                    type_icon = type_icon.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
                 # Center the icon within the indicator area
                 icon_width, icon_height = type_icon.size
                 center_x = x + (indicator_size - icon_width) // 2
                 center_y = y + (indicator_size - icon_height) // 2
 
-                # Paste type icon on card (handle transparency)
-                if type_icon.mode == 'RGBA':
-                    card.paste(type_icon, (center_x, center_y), type_icon)
-                else:
-                    card.paste(type_icon, (center_x, center_y))
+                # Paste type icon on card using its alpha channel
+                card.paste(type_icon, (center_x, center_y), type_icon)
 
             else:
                 # Fallback to colored circle if icon not available
@@ -0,0 +1,193 @@
+"""
+Persistent index of system fonts and the languages they can render.
+Scans font directories once and reuses the result until a directory changes.
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+from src.utils.error_handler import CacheError, log_error
+from src.utils.path_utils import get_app_cache_dir
+
+# Bump when the index format or coverage detection changes
+FONT_INDEX_VERSION = 1
+
+FONT_EXTENSIONS = ('.ttf', '.otf', '.ttc')
+
+# Characters a font must draw for a language to count as covered
+LANGUAGE_SAMPLES: Dict[str, str] = {
+    'en': 'ABCabc123',
+    'zh-Hant': '妙蛙種子皮卡丘',
+    'ja': 'フシギダネピカチュウ'
+}
+
+# A private-use code point no font maps, so it renders as the font's missing-glyph box
+_MISSING_GLYPH = '\U0010FFFD'
+_SAMPLE_SIZE = 24
+
+
+@dataclass
+class IndexedFont:
+    """A font file and the languages it covers."""
+    path: str
+    family: str
+    style: str
+    languages: List[str]
+
+    def matches_style(self, style: str) -> bool:
+        """Check whether this face is the requested 'regular', 'bold' or 'italic' style."""
+        face_style = self.style.lower()
+        is_bold = 'bold' in face_style
+        is_italic = 'italic' in face_style or 'oblique' in face_style
+        if style == 'bold':
+            return is_bold and not is_italic
+        if style == 'italic':
+            return is_italic and not is_bold
+        return not is_bold and not is_italic
+
+
+def _glyph_signature(font: ImageFont.FreeTypeFont, char: str) -> Optional[bytes]:
+    """Pixels of a single rendered character, or None when nothing is drawn."""
+    canvas = Image.new('L', (_SAMPLE_SIZE * 2, _SAMPLE_SIZE * 2))
+    ImageDraw.Draw(canvas).text((0, 0), char, font=font, fill=255)
+    return canvas.tobytes() if canvas.getbbox() else None
+
+
+def font_covers(font: ImageFont.FreeTypeFont, sample: str) -> bool:
+    """Check that every sample character has a real glyph rather than the missing-glyph box."""
+    missing = _glyph_signature(font, _MISSING_GLYPH)
+    for char in sample:
+        signature = _glyph_signature(font, char)
+        if signature is None or signature == missing:
+            return False
+    return True
+
+
+class FontIndex:
+    """
+    Index of the fonts under a set of directories, persisted as JSON.
+
+    The index is rebuilt only when the directory tree's modification times
+    change, so resolving a font in later processes costs one file read.
+    """
+
+    def __init__(self, font_dirs: Iterable[str], index_path: Optional[Path] = None):
+        self.font_dirs = [str(Path(font_dir)) for font_dir in font_dirs]
+        self.index_path = Path(index_path) if index_path else get_app_cache_dir() / "font_index.json"
+        self._fonts: Optional[List[IndexedFont]] = None
+        self._resolved: Dict[Tuple, Optional[str]] = {}
+
+    @property
+    def fonts(self) -> List[IndexedFont]:
+        """Indexed fonts, loaded from disk or rebuilt on first use."""
+        if self._fonts is None:
+            directories = self._directory_mtimes()
+            self._fonts = self._load(directories)
+            if self._fonts is None:
+                self._fonts = self._scan()
+                self._save(directories, self._fonts)
+        return self._fonts
+
+    def find(self, language: str, style: str = 'regular',
+             preferred_names: Sequence[str] = ()) -> Optional[str]:
+        """
+        Find a font file for a language.
+
+        Args:
+            language: Language code the font must cover
+            style: Font style ('regular', 'bold', 'italic')
+            preferred_names: Font family names or file stems to try first, in order
+
+        Returns:
+            Path of the best covering font, or None if no indexed font covers the language
+        """
+        cache_key = (language, style, tuple(preferred_names))
+        if cache_key not in self._resolved:
+            self._resolved[cache_key] = self._resolve(language, style, preferred_names)
+        return self._resolved[cache_key]
+
+    def _resolve(self, language: str, style: str, preferred_names: Sequence[str]) -> Optional[str]:
+        """Pick a preferred family if one is installed, otherwise any covering font."""
+        candidates = [font for font in self.fonts if language in font.languages]
+
+        for name in preferred_names:
+            name = name.lower()
+            family = [font for font in candidates
+                      if name in (font.family.lower(), Path(font.path).stem.lower())]
+            if family:
+                return self._pick_style(family, style).path
+
+        return self._pick_style(candidates, style).path if candidates else None
+
+    @staticmethod
+    def _pick_style(fonts: List[IndexedFont], style: str) -> IndexedFont:
+        """Prefer a face of the requested style, falling back to the first face."""
+        return next((font for font in fonts if font.matches_style(style)), fonts[0])
+
+    def _directory_mtimes(self) -> Dict[str, int]:
+        """Modification time of every directory in the font trees; adding or removing a font changes one."""
+        mtimes = {}
+        for font_dir in self.font_dirs:
+            for dirpath, _, _ in os.walk(font_dir):
+                try:
+                    mtimes[dirpath] = os.stat(dirpath).st_mtime_ns
+                except OSError:
+                    continue
+        return mtimes
+
+    def _scan(self) -> List[IndexedFont]:
+        """Open every font file once and record the languages it covers."""
+        fonts = []
+        for font_dir in self.font_dirs:
+            for dirpath, _, filenames in os.walk(font_dir):
+                for filename in sorted(filenames):
+                    if not filename.lower().endswith(FONT_EXTENSIONS):
+                        continue
+                    path = os.path.join(dirpath, filename)
+                    try:
+                        # Only the first face of a collection is indexed
+                        font = ImageFont.truetype(path, _SAMPLE_SIZE)
+                        family, style = font.getname()
+                    except Exception:
+                        continue  # Unreadable or unsupported font file
+
+                    languages = [language for language, sample in LANGUAGE_SAMPLES.items()
+                                 if font_covers(font, sample)]
+                    if languages:
+                        fonts.append(IndexedFont(path, family or '', style or '', languages))
+        return fonts
+
+    def _load(self, directories: Dict[str, int]) -> Optional[List[IndexedFont]]:
+        """Load the persisted index if it was built from the same directory state."""
+        try:
+            data = json.loads(self.index_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+        if data.get('version') != FONT_INDEX_VERSION or data.get('directories') != directories:
+            return None
+        try:
+            return [IndexedFont(**entry) for entry in data['fonts']]
+        except (KeyError, TypeError):
+            return None
+
+    def _save(self, directories: Dict[str, int], fonts: List[IndexedFont]) -> None:
+        """Persist the index atomically; failure only costs a rescan next time."""
+        data = {
+            'version': FONT_INDEX_VERSION,
+            'directories': directories,
+            'fonts': [asdict(font) for font in fonts]
+        }
+        # Render workers may build the index concurrently; each writes its own temp file
+        temp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            log_error(CacheError("write", str(self.index_path), str(e)), "WARNING")
@@ -0,0 +1,194 @@
+"""
+Process-pool card rendering.
+Fans CardDesigner.create_card out across worker processes while keeping output order stable.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from PIL import Image
+
+from src.models import PokemonData
+from src.utils.instrumentation import instrumentation
+from config.settings import settings
+
+# (mode, size, raw pixel bytes, dpi) as shipped back from a worker process
+EncodedCard = Tuple[str, Tuple[int, int], bytes, Optional[Tuple[int, int]]]
+
+# Designer and rendered card cache owned by each worker process, set by the pool initializer
+_worker_designer = None
+_worker_card_cache = None
+
+
+def _init_worker(card_cache=None) -> None:
+    """Create the per-process CardDesigner and adopt the parent's rendered card cache."""
+    global _worker_designer, _worker_card_cache
+    from src.card.card_designer import CardDesigner
+    _worker_designer = CardDesigner()
+    _worker_card_cache = card_cache
+
+
+def _render_card_worker(card_record: dict, image_path: str, language: Union[str, List[str]],
+                        cache_key: Optional[str] = None) -> Tuple[EncodedCard, Dict[str, List[float]]]:
+    """
+    Render a single card inside a worker process, returning it with the spans it recorded.
+
+    With a cache key the card is also stored in the rendered card cache here,
+    so the PNG encode runs in the worker rather than on the consuming process.
+    """
+    pokemon = PokemonData.from_card_record(card_record)
+    card = _worker_designer.create_card(pokemon, Path(image_path), language)
+    if cache_key is not None and _worker_card_cache is not None:
+        with instrumentation.span("render.cache_store"):
+            _worker_card_cache.store(cache_key, card)
+    return encode_card(card), instrumentation.drain()
+
+
+def encode_card(card: Image.Image) -> EncodedCard:
+    """Encode a card image for transfer between processes."""
+    return card.mode, card.size, card.tobytes(), card.info.get('dpi')
+
+
+def decode_card(encoded: EncodedCard) -> Image.Image:
+    """Rebuild a card image from its encoded form."""
+    mode, size, data, dpi = encoded
+    card = Image.frombytes(mode, size, data)
+    if dpi:
+        card.info['dpi'] = dpi
+    return card
+
+
+class ParallelCardRenderer:
+    """Renders cards across a process pool, yielding them in input order."""
+
+    def __init__(self, workers: Optional[int] = None, card_designer=None,
+                 card_cache=None, use_card_cache: Optional[bool] = None):
+        self.workers = workers if workers is not None else settings.render.worker_count
+        self.max_pending = max(1, self.workers * settings.render.max_pending_per_worker)
+        self.use_card_cache = settings.render.use_card_cache if use_card_cache is None else use_card_cache
+        self._card_designer = card_designer
+        self._card_cache = card_cache
+        self.cache_hits = 0
+
+    @property
+    def card_designer(self):
+        """Designer used when rendering in-process."""
+        if self._card_designer is None:
+            from src.card.card_designer import CardDesigner
+            self._card_designer = CardDesigner()
+        return self._card_designer
+
+    @property
+    def card_cache(self):
+        """Rendered card cache, or None when caching is disabled."""
+        if not self.use_card_cache:
+            return None
+        if self._card_cache is None:
+            from src.utils.cache_manager import cache_manager
+            self._card_cache = cache_manager.rendered_card_cache
+        return self._card_cache
+
+    def _lookup_cached(self, pokemon: PokemonData, image_path: Path,
+                       language: Union[str, List[str]]) -> Tuple[Optional[str], Optional[Image.Image]]:
+        """Return (cache key, cached card or None); the key is None when caching is off."""
+        card_cache = self.card_cache
+        if card_cache is None:
+            return None, None
+
+        from src.card.card_designer import CardDesigner
+        with instrumentation.span("render.cache_lookup"):
+            key = card_cache.make_key(CardDesigner.card_cache_key_inputs(pokemon, image_path, language))
+            card = card_cache.get(key)
+        if card is not None:
+            self.cache_hits += 1
+        return key, card
+
+    def _store_rendered(self, key: Optional[str], card: Image.Image) -> Image.Image:
+        """Store a freshly rendered card in the cache."""
+        if key is not None:
+            self.card_cache.store(key, card)
+        return card
+
+    def iter_cards(self, jobs: Iterable[Tuple[PokemonData, Path]],
+                   language: Union[str, List[str]] = 'en',
+                   progress_callback: Optional[Callable[[int, PokemonData], None]] = None
+                   ) -> Iterator[Image.Image]:
+        """
+        Render cards for (pokemon, image_path) jobs.
+
+        Cards are yielded in the same order as the jobs. At most
+        `max_pending` cards are queued or held at once, so memory stays
+        bounded however many jobs are supplied. Cards whose inputs match a
+        previous render are loaded from the rendered card cache instead.
+
+        Args:
+            jobs: Iterable of (PokemonData, image path) pairs
+            language: Language or list of languages for the card name
+            progress_callback: Called with (completed_count, pokemon) per card
+        """
+        if self.workers <= 1:
+            yield from self._iter_serial(jobs, language, progress_callback)
+            return
+
+        # Each entry holds either a cached card or the future rendering it
+        pending: Deque[Tuple[PokemonData, Optional[str], Union[Image.Image, Future]]] = deque()
+        completed = 0
+
+        def finish(entry) -> Image.Image:
+            pokemon, key, result = entry
+            if isinstance(result, Future):
+                encoded, worker_spans = result.result()
+                instrumentation.merge(worker_spans)
+                result = decode_card(encoded)
+                if key is not None:
+                    result.info['card_key'] = key  # Stored by the worker
+            if progress_callback:
+                progress_callback(completed, pokemon)
+            return result
+
+        # The pool only starts worker processes on the first submitted card
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self.card_cache,)) as executor:
+            for pokemon, image_path in jobs:
+                key, card = self._lookup_cached(pokemon, image_path, language)
+                if card is None:
+                    card = executor.submit(
+                        _render_card_worker,
+                        pokemon.to_card_record(),
+                        str(image_path),
+                        language,
+                        key
+                    )
+                pending.append((pokemon, key, card))
+
+                if len(pending) >= self.max_pending:
+                    completed += 1
+                    yield finish(pending.popleft())
+
+            while pending:
+                completed += 1
+                yield finish(pending.popleft())
+
+    def _iter_serial(self, jobs: Iterable[Tuple[PokemonData, Path]],
+                     language: Union[str, List[str]],
+                     progress_callback: Optional[Callable[[int, PokemonData], None]]
+                     ) -> Iterator[Image.Image]:
+        """Render cards one by one in the current process."""
+        for completed, (pokemon, image_path) in enumerate(jobs, 1):
+            key, card = self._lookup_cached(pokemon, image_path, language)
+            if card is None:
+                card = self._store_rendered(
+                    key, self.card_designer.create_card(pokemon, Path(image_path), language)
+                )
+            if progress_callback:
+                progress_callback(completed, pokemon)
+            yield card
+
+    def render_cards(self, jobs: Iterable[Tuple[PokemonData, Path]],
+                     language: Union[str, List[str]] = 'en',
+                     progress_callback: Optional[Callable[[int, PokemonData], None]] = None
+                     ) -> List[Image.Image]:
+        """Render all cards and return them as a list in job order."""
+        return list(self.iter_cards(jobs, language, progress_callback))
@@ -3,21 +3,51 @@ Text rendering utilities for Pokemon cards.
 Handles multi-language text rendering with appropriate fonts.
 """
 
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 from PIL import Image, ImageDraw, ImageFont
+import os
 import platform
 
+from src.card.font_index import LANGUAGE_SAMPLES, FontIndex, font_covers
 from src.utils.error_handler import FontNotFoundError, log_error
 from config.settings import settings
-from config.constants import FONT_CONFIG, FALLBACK_FONTS
+from config.constants import FONT_CONFIG, FALLBACK_FONTS, CJK_FALLBACK_FONTS
+
+# Upper bound on memoized measurements and fitted layouts
+LAYOUT_CACHE_SIZE = 4096
+
+# textbbox needs a draw context but never touches its pixels, so one 1x1 canvas serves every measurement
+_MEASURE_DRAW = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def _text_bbox_size(text: str, font: ImageFont.FreeTypeFont) -> Tuple[int, int]:
+    """Width and height of the inked bounding box of text."""
+    bbox = _MEASURE_DRAW.textbbox((0, 0), text, font=font)
+    return bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def _text_length(text: str, font: ImageFont.FreeTypeFont) -> float:
+    """Advance width of a single line of text."""
+    return font.getlength(text)
 
 
 class TextRenderer:
     """Text renderer with multi-language font support."""
 
-    def __init__(self):
+    def __init__(self, font_index_path: Optional[Path] = None):
+        """
+        Args:
+            font_index_path: Where the system font index is persisted (default: the app cache directory)
+        """
+        self.font_index_path = font_index_path
         self.font_cache: Dict[str, ImageFont.FreeTypeFont] = {}
+        # Fitted (text, font) per (text, language, max_width, min_size, max_size), least recently used first
+        self._layout_cache: "OrderedDict[Tuple, Tuple[str, ImageFont.FreeTypeFont]]" = OrderedDict()
         self.default_font_size = settings.font.default_font_size
         self._init_font_paths()
 
@@ -44,6 +74,9 @@ class TextRenderer:
                 str(Path.home()) + "/.fonts/"
             ]
 
+        # Scanned once and persisted; later lookups never walk these directories
+        self.font_index = FontIndex(self.system_font_paths, self.font_index_path)
+
     def get_font(self, language: str = 'en', size: int = None, style: str = 'regular') -> ImageFont.FreeTypeFont:
         """
         Get appropriate font for language and style.
@@ -74,6 +107,21 @@ class TextRenderer:
 
         return font
 
+    def font_identity(self, language: str = 'en', style: str = 'regular') -> Optional[List]:
+        """
+        Identify the font file text in a language is drawn with.
+
+        Returns:
+            [path, modification time] of the resolved font file, or None for PIL's built-in font
+        """
+        path = getattr(self.get_font(language, style=style), 'path', None)
+        if not isinstance(path, (str, os.PathLike)):
+            return None
+        try:
+            return [str(path), os.stat(path).st_mtime_ns]
+        except OSError:
+            return [str(path), None]
+
     def _load_font_for_language(self, language: str, size: int, style: str) -> ImageFont.FreeTypeFont:
         """Load font for specific language."""
         # Try project fonts first
@@ -81,17 +129,11 @@ class TextRenderer:
         if font and self._test_font_can_render(font, language):
             return font
 
-        # Try system fonts
-        font = self._try_system_fonts(language, size, style)
-        if font and self._test_font_can_render(font, language):
+        # Try system fonts, resolved through the persisted font index
+        font = self._try_indexed_font(language, size, style)
+        if font:
             return font
 
-        # Enhanced fallback for Chinese and Japanese
-        if language in ['zh-Hant', 'ja']:
-            font = self._try_enhanced_cjk_fonts(language, size, style)
-            if font:
-                return font
-
         # Fallback to default font
         log_error(FontNotFoundError(language, "No suitable font found"), "WARNING")
         return self._get_default_font(size)
@@ -117,118 +159,27 @@ class TextRenderer:
 
         return None
 
-    def _try_system_fonts(self, language: str, size: int, style: str) -> Optional[ImageFont.FreeTypeFont]:
-        """Try to load system fonts."""
-        if language not in FALLBACK_FONTS:
-            return None
-
-        fallback_fonts = FALLBACK_FONTS[language]
-
-        for font_name in fallback_fonts:
-            font = self._try_system_font(font_name, size, style)
-            if font:
-                return font
-
-        return None
-
-    def _try_system_font(self, font_name: str, size: int, style: str) -> Optional[ImageFont.FreeTypeFont]:
-        """Try to load a specific system font."""
-        # First try loading font directly by name (works best on macOS)
-        try:
-            return ImageFont.truetype(font_name, size)
-        except Exception:
-            pass
-
-        # Common font file extensions
-        extensions = ['.ttf', '.otf', '.ttc']
-
-        # Style modifiers
-        style_modifiers = {
-            'bold': ['-Bold', '_Bold', ' Bold', 'Bold'],
-            'italic': ['-Italic', '_Italic', ' Italic', 'Italic'],
-            'regular': ['', '-Regular', '_Regular', ' Regular']
-        }
-
-        modifiers = style_modifiers.get(style, [''])
-
-        # Try loading from system font paths
-        for path_dir in self.system_font_paths:
-            path = Path(path_dir)
-            if not path.exists():
-                continue
-
-            for modifier in modifiers:
-                for ext in extensions:
-                    font_file = path / f"{font_name}{modifier}{ext}"
-                    if font_file.exists():
-                        try:
-                            return ImageFont.truetype(str(font_file), size)
-                        except Exception:
-                            continue
+    def _try_indexed_font(self, language: str, size: int, style: str) -> Optional[ImageFont.FreeTypeFont]:
+        """Load the best indexed system font covering the language, preferring the fallback families."""
+        preferred = list(FALLBACK_FONTS.get(language, []))
+        if language in ['zh-Hant', 'ja']:
+            preferred += CJK_FALLBACK_FONTS
 
+        font_path = self.font_index.find(language, style, preferred)
+        if font_path:
+            try:
+                return ImageFont.truetype(font_path, size)
+            except Exception as e:
+                log_error(FontNotFoundError(language, f"{font_path}: {e}"), "WARNING")
         return None
 
     def _test_font_can_render(self, font: ImageFont.FreeTypeFont, language: str) -> bool:
         """Test if a font can properly render text in the given language."""
-        # Test characters for each language
-        test_chars = {
-            'en': 'ABCabc123',
-            'zh-Hant': '妙蛙種子皮卡丘',
-            'ja': 'フシギダネピカチュウ'
-        }
-
-        test_text = test_chars.get(language, 'ABC')
-
         try:
-            # Try to measure the text - if font doesn't support the characters,
-            # this should still work but might use fallback glyphs
-            dummy_img = Image.new('RGB', (100, 100))
-            draw = ImageDraw.Draw(dummy_img)
-            bbox = draw.textbbox((0, 0), test_text, font=font)
-
-            # A very simple check: if width is 0, font probably can't render
-            width = bbox[2] - bbox[0]
-            return width > 0
-
+            return font_covers(font, LANGUAGE_SAMPLES.get(language, 'ABC'))
         except Exception:
             return False
 
-    def _try_enhanced_cjk_fonts(self, language: str, size: int, style: str) -> Optional[ImageFont.FreeTypeFont]:
-        """Enhanced CJK (Chinese/Japanese/Korean) font loading."""
-        # Comprehensive list of CJK fonts on macOS
-        cjk_fonts = [
-            # Primary Chinese fonts
-            "PingFang TC",  # Modern Chinese font
-            "PingFang SC",
-            "STHeiti",
-            "STHeiti Light",
-            "STHeiti Medium",
-            "Hiragino Sans GB",
-            "Hiragino Sans CNS",
-
-            # Primary Japanese fonts
-            "Hiragino Sans",
-            "Hiragino Kaku Gothic Pro",
-            "Hiragino Kaku Gothic ProN",
-            "Yu Gothic",
-            "Yu Gothic Medium",
-            "AppleGothic",
-
-            # Universal CJK fonts
-            "Arial Unicode MS",
-            "Microsoft JhengHei",
-            "Microsoft YaHei",
-            "SimHei",
-            "SimSun"
-        ]
-
-        for font_name in cjk_fonts:
-            font = self._try_system_font(font_name, size, style)
-            if font and self._test_font_can_render(font, language):
-                return font
-
-        return None
-
     def _get_default_font(self, size: int) -> ImageFont.FreeTypeFont:
         """Get default PIL font with better system font support."""
         # Try common system fonts in order of preference
@@ -252,15 +203,11 @@ class TextRenderer:
 
     def measure_text(self, text: str, font: ImageFont.FreeTypeFont) -> Tuple[int, int]:
         """Measure text dimensions."""
-        # Create a dummy image for measuring
-        dummy_img = Image.new('RGB', (1, 1))
-        draw = ImageDraw.Draw(dummy_img)
-
-        bbox = draw.textbbox((0, 0), text, font=font)
-        width = bbox[2] - bbox[0]
-        height = bbox[3] - bbox[1]
+        return _text_bbox_size(text, font)
 
-        return width, height
+    def _line_width(self, text: str, font: ImageFont.FreeTypeFont) -> float:
+        """Advance width of the widest line of text."""
+        return max(_text_length(line, font) for line in text.split('\n'))
 
     def fit_text_to_width(self, text: str, max_width: int, language: str = 'en',
                          min_size: int = 8, max_size: int = 24) -> Tuple[str, ImageFont.FreeTypeFont]:
@@ -270,7 +217,21 @@ class TextRenderer:
         Returns:
             Tuple of (possibly wrapped text, font)
         """
-        # Binary search for optimal font size
+        cache_key = (text, language, max_width, min_size, max_size)
+        layout = self._layout_cache.get(cache_key)
+        if layout is not None:
+            self._layout_cache.move_to_end(cache_key)
+            return layout
+
+        layout = self._fit_text(text, max_width, language, min_size, max_size)
+        self._layout_cache[cache_key] = layout
+        if len(self._layout_cache) > LAYOUT_CACHE_SIZE:
+            self._layout_cache.popitem(last=False)
+        return layout
+
+    def _fit_text(self, text: str, max_width: int, language: str,
+                  min_size: int, max_size: int) -> Tuple[str, ImageFont.FreeTypeFont]:
+        """Binary search the largest font size at which text fits, wrapping if needed."""
         low, high = min_size, max_size
         best_font = self.get_font(language, min_size)
         best_text = text
@@ -280,9 +241,7 @@ class TextRenderer:
             font = self.get_font(language, mid_size)
 
             # Try original text first
-            width, _ = self.measure_text(text, font)
-
-            if width <= max_width:
+            if self._line_width(text, font) <= max_width:
                 best_font = font
                 best_text = text
                 low = mid_size + 1
@@ -299,37 +258,37 @@ class TextRenderer:
         return best_text, best_font
 
     def _wrap_text(self, text: str, max_width: int, font: ImageFont.FreeTypeFont) -> Optional[str]:
-        """Wrap text to fit within width."""
+        """Wrap text to fit within width, measuring each word once."""
         words = text.split()
         if len(words) <= 1:
             return None
 
+        space_width = _text_length(' ', font)
         lines = []
         current_line = []
+        current_width = 0.0
 
         for word in words:
-            test_line = current_line + [word]
-            test_text = ' '.join(test_line)
-            width, _ = self.measure_text(test_text, font)
+            word_width = _text_length(word, font)
+            if word_width > max_width:
+                # Single word too long
+                return None
+
+            if current_line and current_width + space_width + word_width <= max_width:
+                current_line.append(word)
+                current_width += space_width + word_width
+                continue
 
-            if width <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    # Single word too long
+            if current_line:
+                lines.append(' '.join(current_line))
+                if len(lines) == 2:
+                    # Limit to 2 lines for card names
                     return None
+            current_line = [word]
+            current_width = word_width
 
-        if current_line:
-            lines.append(' '.join(current_line))
-
-        # Limit to 2 lines for card names
-        if len(lines) <= 2:
-            return '\n'.join(lines)
-
-        return None
+        lines.append(' '.join(current_line))
+        return '\n'.join(lines)
 
     def add_text_to_card(self, card: Image.Image, text: str, text_area: Dict[str, int],
                         language: str = 'en', font_size: int = None, style: str = 'regular',
@@ -420,8 +379,11 @@ class TextRenderer:
         return self.measure_text(text, font)
 
     def clear_font_cache(self):
-        """Clear the font cache to free memory."""
+        """Clear the font cache and the layouts measured with those fonts to free memory."""
         self.font_cache.clear()
+        self._layout_cache.clear()
+        _text_bbox_size.cache_clear()
+        _text_length.cache_clear()
 
 
 # Global text renderer instance
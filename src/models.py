@@ -6,6 +6,8 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 from pydantic import BaseModel, Field, HttpUrl, validator
 
+from config.constants import CARD_RECORD_SCHEMA_VERSION, LANGUAGE_NAMES
+
 
 class PokemonSprite(BaseModel):
     """Model for Pokemon sprite URLs."""
@@ -184,12 +186,21 @@ class PokemonSpeciesData(BaseModel):
                     return entry.flavor_text
         return None
 
+    def for_languages(self, languages) -> "PokemonSpeciesData":
+        """Copy keeping only names and flavor text in the given PokeAPI language codes."""
+        languages = set(languages)
+        return self.model_copy(update={
+            'names': [n for n in self.names if n.language_code in languages],
+            'flavor_text_entries': [e for e in self.flavor_text_entries if e.language_code in languages]
+        })
+
 
 class PokemonData(BaseModel):
     """Complete Pokemon data combining basic and species information."""
     basic: PokemonBasicData
     species: Optional[PokemonSpeciesData] = None
     names: Dict[str, str] = {}  # language -> name mapping
+    flavor_texts: Dict[str, str] = {}  # language -> flavor text mapping
     official_artwork_url: Optional[HttpUrl] = None
     cached_at: Optional[datetime] = None
 
@@ -209,6 +220,14 @@ class PokemonData(BaseModel):
         # Clean up name formatting
         return name.replace('-', ' ').title() if name else self.basic.name.capitalize()
 
+    def get_flavor_text(self, language: str = 'en') -> Optional[str]:
+        """Get flavor text in specified language, if available."""
+        if language in self.flavor_texts:
+            return self.flavor_texts[language]
+        if self.species:
+            return self.species.get_flavor_text_by_language(language)
+        return None
+
     @property
     def pokemon_id(self) -> int:
         """Get Pokemon ID."""
@@ -224,6 +243,70 @@ class PokemonData(BaseModel):
         """Get all types as a list."""
         return [t.name for t in self.basic.types]
 
+    def to_card_record(self, flavor_languages=()) -> Dict[str, Any]:
+        """
+        Build the compact, versioned record cached for card generation.
+
+        Only what the card and summary table render is kept: names are resolved
+        up front for every supported language, so sprites, abilities, stats and
+        species payloads can be dropped.
+
+        Args:
+            flavor_languages: Languages whose flavor text should be kept
+
+        Returns:
+            JSON-serializable card record
+        """
+        record = {
+            'v': CARD_RECORD_SCHEMA_VERSION,
+            'id': self.basic.id,
+            'name': self.basic.name,
+            'height': self.basic.height,
+            'weight': self.basic.weight,
+            'types': self.all_types,
+            'names': {lang: self.get_name(lang) for lang in LANGUAGE_NAMES},
+            'artwork_url': str(self.official_artwork_url) if self.official_artwork_url else None,
+        }
+
+        flavor_texts = {}
+        for lang in flavor_languages:
+            text = self.get_flavor_text(lang)
+            if text:
+                flavor_texts[lang] = text
+        if flavor_texts:
+            record['flavor_texts'] = flavor_texts
+
+        return record
+
+    @classmethod
+    def from_card_record(cls, record: Dict[str, Any]) -> "PokemonData":
+        """
+        Rebuild Pokemon data from a card record without re-running validation.
+
+        Raises:
+            ValueError: If the record was written with a different schema version
+        """
+        if record.get('v') != CARD_RECORD_SCHEMA_VERSION:
+            raise ValueError(f"Unsupported card record version: {record.get('v')}")
+
+        types = [
+            PokemonType.model_construct(slot=slot, type={'name': type_name})
+            for slot, type_name in enumerate(record['types'], start=1)
+        ]
+        basic = PokemonBasicData.model_construct(
+            id=record['id'],
+            name=record['name'],
+            height=record['height'],
+            weight=record['weight'],
+            types=types
+        )
+        return cls.model_construct(
+            basic=basic,
+            names=record['names'],
+            flavor_texts=record.get('flavor_texts', {}),
+            official_artwork_url=record['artwork_url']
+        )
+
 
 class GenerationData(BaseModel):
     """Model for Pokemon generation data."""
@@ -299,6 +382,13 @@ class PDFGenerationResult(BaseModel):
     generated_at: datetime = Field(default_factory=datetime.now)
 
 
+class ShardedPDFResult(PDFGenerationResult):
+    """Model for PDF output split into shards; file_path is the merged PDF or the shard directory."""
+    shard_paths: List[str] = Field(default_factory=list)  # Numbered shard files, empty once merged
+    merged: bool = False
+    retried_shards: int = 0
+
+
 class CacheEntry(BaseModel):
     """Model for cache entries."""
     key: str
@@ -0,0 +1,126 @@
+"""
+Image encodings for card images embedded in PDFs.
+Trades file size against fidelity: lossless Flate, JPEG (DCT) and optional downsampling.
+"""
+
+import io
+import zlib
+from dataclasses import dataclass
+from typing import Tuple
+
+from PIL import Image
+
+from src.utils.error_handler import PDFGenerationError
+from config.settings import settings
+from config.constants import IMAGE_ENCODINGS
+
+# Approximate embedded bytes per pixel of a rendered card, measured on cards with
+# shaded artwork. JPEG points are (quality, bytes per pixel), interpolated linearly.
+FLATE_BYTES_PER_PIXEL = 0.35
+JPEG_BYTES_PER_PIXEL: Tuple[Tuple[int, float], ...] = (
+    (1, 0.02), (50, 0.05), (75, 0.075), (85, 0.09), (90, 0.11), (95, 0.15), (100, 0.35)
+)
+
+# PDF color space for each image mode that can be embedded without conversion
+COLOR_SPACES = {'RGB': 'DeviceRGB', 'L': 'DeviceGray'}
+
+
+@dataclass(frozen=True)
+class EncodedImage:
+    """Compressed pixels ready to embed as a PDF image XObject."""
+    width: int
+    height: int
+    color_space: str  # 'DeviceRGB' or 'DeviceGray'
+    filter: str  # 'FlateDecode' or 'DCTDecode'
+    data: bytes
+
+    def to_image(self) -> Image.Image:
+        """Decode the stream back into a PIL image."""
+        if self.filter == 'DCTDecode':
+            with Image.open(io.BytesIO(self.data)) as image:
+                return image.copy()
+        mode = next(mode for mode, color_space in COLOR_SPACES.items() if color_space == self.color_space)
+        return Image.frombytes(mode, (self.width, self.height), zlib.decompress(self.data))
+
+
+@dataclass(frozen=True)
+class ImageEncoding:
+    """How card images are compressed when embedded in a PDF."""
+    format: str = 'flate'  # 'flate' (lossless) or 'jpeg'
+    jpeg_quality: int = 90  # 1-100, used by 'jpeg'
+    downsample_dpi: int = 0  # Resample cards to this DPI before embedding; 0 keeps the card DPI
+
+    def __post_init__(self):
+        if self.format not in IMAGE_ENCODINGS:
+            raise PDFGenerationError(
+                f"Unsupported image encoding '{self.format}'; choose from {', '.join(IMAGE_ENCODINGS)}"
+            )
+        if not 1 <= self.jpeg_quality <= 100:
+            raise PDFGenerationError(f"JPEG quality must be between 1 and 100, got {self.jpeg_quality}")
+        if self.downsample_dpi < 0:
+            raise PDFGenerationError(f"Downsample DPI must not be negative, got {self.downsample_dpi}")
+
+    @classmethod
+    def from_settings(cls) -> "ImageEncoding":
+        """Encoding configured in settings.pdf."""
+        return cls(settings.pdf.image_encoding, settings.pdf.jpeg_quality, settings.pdf.downsample_dpi)
+
+    @classmethod
+    def proof(cls) -> "ImageEncoding":
+        """Compact encoding for on-screen proofs: JPEG at half the print resolution."""
+        return cls('jpeg', jpeg_quality=80, downsample_dpi=150)
+
+    def scale(self, source_dpi: int = None) -> float:
+        """Factor applied to card dimensions before embedding."""
+        source_dpi = source_dpi or settings.card.dpi
+        if self.downsample_dpi and self.downsample_dpi < source_dpi:
+            return self.downsample_dpi / source_dpi
+        return 1.0
+
+    def encode(self, image: Image.Image) -> EncodedImage:
+        """
+        Compress a flattened card image into an embeddable stream.
+
+        Pillow and zlib release the GIL while resampling and compressing, so
+        cards can be encoded on worker threads while pages are written.
+
+        Args:
+            image: Card flattened to RGB (or grayscale)
+
+        Returns:
+            EncodedImage holding Flate-compressed pixels or a JPEG file
+        """
+        if image.mode not in COLOR_SPACES:
+            image = image.convert('RGB')
+
+        dpi = image.info.get('dpi', (settings.card.dpi,))[0]
+        factor = self.scale(int(round(dpi)))
+        if factor < 1.0:
+            size = (max(1, round(image.width * factor)), max(1, round(image.height * factor)))
+            image = image.resize(size, Image.Resampling.LANCZOS)
+
+        if self.format == 'jpeg':
+            buffer = io.BytesIO()
+            image.save(buffer, 'JPEG', quality=self.jpeg_quality)
+            data, stream_filter = buffer.getvalue(), 'DCTDecode'
+        else:
+            data, stream_filter = zlib.compress(image.tobytes()), 'FlateDecode'
+        return EncodedImage(image.width, image.height, COLOR_SPACES[image.mode], stream_filter, data)
+
+    def estimate_bytes_per_card(self, width_pixels: int = None, height_pixels: int = None) -> float:
+        """Estimated embedded size of one card image in bytes."""
+        width_pixels = width_pixels or settings.card.width_pixels
+        height_pixels = height_pixels or settings.card.height_pixels
+        pixels = width_pixels * height_pixels * self.scale() ** 2
+
+        if self.format == 'flate':
+            return pixels * FLATE_BYTES_PER_PIXEL
+        return pixels * _interpolate(JPEG_BYTES_PER_PIXEL, self.jpeg_quality)
+
+
+def _interpolate(points: Tuple[Tuple[int, float], ...], x: int) -> float:
+    """Piecewise-linear interpolation between sorted (x, y) points."""
+    for (x0, y0), (x1, y1) in zip(points, points[1:]):
+        if x <= x1:
+            return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+    return points[-1][1]
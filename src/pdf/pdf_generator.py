@@ -3,68 +3,178 @@ PDF generator for Pokemon cards.
 Handles page layout, card arrangement, and PDF creation.
 """
 
+import glob
+import hashlib
+import importlib.util
+import os
 import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Deque, Iterable, Iterator, List, Dict, Optional, Set, Tuple
 from PIL import Image
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
-from reportlab.platypus import SimpleDocTemplate, Spacer, Table, TableStyle
-from reportlab.lib import colors
-from reportlab.platypus.flowables import Flowable
-from reportlab.graphics.shapes import Drawing, Rect, String
-from reportlab.graphics import renderPDF
-import io
-
-from src.models import PDFGenerationResult, CardData
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase.pdfdoc import PDFImageXObject
+from reportlab.pdfgen import canvas
+
+from src.models import PDFGenerationResult, ShardedPDFResult, CardData
+from src.card.parallel_renderer import EncodedCard, decode_card, encode_card
 from src.utils.error_handler import PDFGenerationError, create_error_context, log_error
 from src.pdf.page_layout import PageLayoutManager
+from src.pdf.image_encoding import EncodedImage, ImageEncoding
+from src.utils.instrumentation import instrumentation
 from config.settings import settings
 from config.constants import PDF_CONSTANTS
 
-
-class CardFlowable(Flowable):
-    """Custom flowable for embedding PIL images in ReportLab."""
-
-    def __init__(self, image: Image.Image, width: float, height: float):
-        Flowable.__init__(self)
-        self.image = image
-        self.width = width
-        self.height = height
-
-    def draw(self):
-        """Draw the image on the canvas."""
-        # Convert RGBA to RGB for better PDF compatibility
-        if self.image.mode == 'RGBA':
-            # Create white background for transparency
-            rgb_image = Image.new('RGB', self.image.size, (255, 255, 255))
-            rgb_image.paste(self.image, mask=self.image.split()[-1])  # Use alpha as mask
-            # Preserve DPI information from original image
-            if 'dpi' in self.image.info:
-                rgb_image.info['dpi'] = self.image.info['dpi']
-            image_to_draw = rgb_image
-        else:
-            image_to_draw = self.image.convert('RGB')
-
-        # Draw the image with higher quality settings
-        # Explicitly specify dimensions to ensure correct print size
-        self.canv.drawInlineImage(
-            image_to_draw, 0, 0, width=self.width, height=self.height
-        )
+# Approximate PDF structure cost of each page and of each card placement
+PAGE_OVERHEAD_BYTES = 1024
+CARD_OVERHEAD_BYTES = 64
+
+# A card as the page writer sees it: its XObject name and, on first appearance, its encoded image
+PreparedCard = Tuple[str, Optional[EncodedImage]]
+
+
+def card_xobject_name(card: Image.Image) -> str:
+    """
+    Name of the form XObject holding a card's pixels.
+
+    Cards from the rendered card cache carry their content key; other cards
+    are named by a digest of their pixels, so identical cards share a name.
+    """
+    key = card.info.get('card_key') or hashlib.sha1(card.tobytes()).hexdigest()
+    return f"card_{key}_{card.width}x{card.height}_{card.mode}"
+
+
+class EncodedImageXObject(PDFImageXObject):
+    """Image XObject whose stream was compressed ahead of time."""
+
+    def __init__(self, name: str, encoded: EncodedImage):
+        PDFImageXObject.__init__(self, name)
+        self.width = encoded.width
+        self.height = encoded.height
+        self.bitsPerComponent = 8
+        self.colorSpace = encoded.color_space
+        self._filters = (encoded.filter,)
+        self.streamContent = encoded.data
+        self.mask = None
+
+
+# Private Canvas and document attributes the pre-encoded image path drives directly
+CANVAS_IMAGE_INTERNALS = ('_setXObjects', '_code', '_formsinuse')
+DOC_IMAGE_INTERNALS = ('getXObjectName', 'idToObject', 'Reference', 'addForm')
+
+
+def _has_image_internals(canv: canvas.Canvas) -> bool:
+    """Check that this ReportLab exposes the internals _draw_encoded_image relies on."""
+    doc = getattr(canv, '_doc', None)
+    return (doc is not None
+            and all(hasattr(canv, attribute) for attribute in CANVAS_IMAGE_INTERNALS)
+            and all(hasattr(doc, attribute) for attribute in DOC_IMAGE_INTERNALS))
+
+
+def _draw_encoded_image(canv: canvas.Canvas, name: str, encoded: EncodedImage,
+                        width: float, height: float) -> None:
+    """
+    Register a pre-encoded image with the document and draw it, as Canvas.drawImage does.
+
+    drawImage would compress the pixels again on the writer thread, so this
+    repeats its bookkeeping on Canvas internals instead; the reportlab range
+    in pyproject.toml is the one tests/test_pdf_generator.py checks against.
+    If a later ReportLab drops those internals, the image is decoded and drawn
+    through the public drawImage, which is slower but produces the same page.
+    """
+    if not _has_image_internals(canv):
+        canv.drawImage(ImageReader(encoded.to_image()), 0, 0, width, height)
+        return
+
+    image_name = f"{name}_image"
+    registered_name = canv._doc.getXObjectName(image_name)
+    if registered_name not in canv._doc.idToObject:
+        xobject = EncodedImageXObject(image_name, encoded)
+        canv._setXObjects(xobject)
+        canv._doc.Reference(xobject, registered_name)
+        canv._doc.addForm(image_name, xobject)
+
+    canv.saveState()
+    canv.scale(width, height)
+    canv._code.append(f"/{registered_name} Do")
+    canv.restoreState()
+    canv._formsinuse.append(image_name)
+    canv._currentPageHasImages = 1
+
+
+def draw_card_xobject(canv: canvas.Canvas, name: str, encoded: Optional[EncodedImage],
+                      x: float, y: float, width: float, height: float) -> None:
+    """
+    Draw a card, embedding its image only the first time it appears in the document.
+
+    Args:
+        canv: Canvas to draw on
+        name: Card XObject name from card_xobject_name
+        encoded: Encoded card image; only needed the first time the name is drawn
+        x, y: Bottom-left corner in points
+        width, height: Card size in points
+    """
+    if not canv.hasForm(name):
+        if encoded is None:
+            raise PDFGenerationError(f"Card '{name}' was drawn before its image was encoded")
+        canv.beginForm(name, 0, 0, width, height)
+        # An image XObject is stored once; drawInlineImage repeats it per use
+        _draw_encoded_image(canv, name, encoded, width, height)
+        canv.endForm()
+
+    canv.saveState()
+    canv.translate(x, y)
+    canv.doForm(name)
+    canv.restoreState()
+
+
+def pdf_merge_available() -> bool:
+    """Check whether PyPDF2, needed to merge shards into one PDF, is installed."""
+    return importlib.util.find_spec("PyPDF2") is not None
+
+
+def shard_path(output_path: Path, index: int, digits: int = 3) -> Path:
+    """Numbered file for one shard of a PDF, e.g. cards_part001.pdf."""
+    return output_path.with_name(f"{output_path.stem}_part{index:0{digits}d}{output_path.suffix or '.pdf'}")
+
+
+def _write_shard_worker(cards: List[EncodedCard], order: List[int], output_path: str,
+                        metadata: Optional[Dict], encoding: ImageEncoding
+                        ) -> Tuple[PDFGenerationResult, Dict[str, List[float]]]:
+    """Write one shard inside a worker process, returning its result with the spans it recorded."""
+    images = [decode_card(card) for card in cards]
+    # Write beside the target and rename, so a failed attempt never leaves a truncated shard
+    temp_path = f"{output_path}.part"
+    generator = PDFGenerator(encode_workers=1)
+    result = generator.generate_cards_pdf_stream(
+        (images[index] for index in order), temp_path, metadata,
+        total_cards=len(order), encoding=encoding
+    )
+    os.replace(temp_path, output_path)
+    result.file_path = output_path
+    return result, instrumentation.drain()
 
 
 class PDFGenerator:
     """Main PDF generator for Pokemon cards."""
 
-    def __init__(self):
+    def __init__(self, encode_workers: Optional[int] = None):
         self.page_layout = PageLayoutManager()
         self.a4_width = A4[0]
         self.a4_height = A4[1]
+        self.encode_workers = encode_workers if encode_workers is not None else settings.pdf.encode_worker_count
+        self.max_pending = max(1, self.encode_workers * 2)  # Cards encoded ahead of the page writer
 
     @create_error_context("generate PDF")
     def generate_cards_pdf(self, cards: List[Image.Image], output_path: str,
-                          metadata: Optional[Dict] = None) -> PDFGenerationResult:
+                          metadata: Optional[Dict] = None,
+                          encoding: Optional[ImageEncoding] = None) -> PDFGenerationResult:
         """
         Generate PDF with Pokemon cards arranged in optimal layout.
 
@@ -72,152 +182,340 @@ class PDFGenerator:
             cards: List of PIL Images (cards)
             output_path: Path for output PDF
             metadata: Optional metadata for PDF
+            encoding: Image compression for the cards (default: settings.pdf)
 
         Returns:
             PDFGenerationResult with generation stats
         """
-        start_time = time.time()
-
         if not cards:
             raise PDFGenerationError("No cards provided for PDF generation")
 
+        return self.generate_cards_pdf_stream(iter(cards), output_path, metadata,
+                                              total_cards=len(cards), encoding=encoding)
+
+    @create_error_context("generate PDF")
+    def generate_cards_pdf_stream(self, cards: Iterable[Image.Image], output_path: str,
+                                  metadata: Optional[Dict] = None,
+                                  total_cards: Optional[int] = None,
+                                  encoding: Optional[ImageEncoding] = None) -> PDFGenerationResult:
+        """
+        Generate PDF from a stream of cards, writing and releasing one page at a time.
+
+        Cards are pulled from the iterable only as each page is filled, and
+        encoded on a thread pool a few cards ahead of the page writer, so peak
+        memory is bounded by a page plus the encoding window regardless of run size.
+
+        Args:
+            cards: Iterable (e.g. generator) of PIL Images (cards)
+            output_path: Path for output PDF
+            metadata: Optional metadata for PDF
+            total_cards: Expected number of cards, if known (used for layout only)
+            encoding: Image compression for the cards (default: settings.pdf)
+
+        Returns:
+            PDFGenerationResult with generation stats
+        """
+        start_time = time.time()
+
         # Prepare output path
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Calculate layout
-        layout_info = self.page_layout.calculate_optimal_layout(len(cards))
+        layout_info = self.page_layout.calculate_optimal_layout(total_cards or 1)
+        positions = self.page_layout.get_card_positions(layout_info)
+        cards_per_page = layout_info['cards_per_page']
+
+        pdf_canvas = canvas.Canvas(str(output_file), pagesize=A4)
+        if metadata and metadata.get('title'):
+            pdf_canvas.setTitle(metadata['title'])
+
+        encoding = encoding or ImageEncoding.from_settings()
+        card_count = 0
+        page_count = 0
+        page_cards: List[PreparedCard] = []
 
         try:
-            # Create PDF document
-            doc = SimpleDocTemplate(
-                str(output_file),
-                pagesize=A4,
-                leftMargin=layout_info['margin'],
-                rightMargin=layout_info['margin'],
-                topMargin=layout_info['margin'],
-                bottomMargin=layout_info['margin']
-            )
-
-            # Build document content
-            story = []
-
-            # Add metadata if provided (commented out to remove title)
-            # if metadata:
-            #     story.append(self._create_metadata_section(metadata))
-            #     story.append(Spacer(1, 10 * mm))
-
-            # Add cards in pages
-            cards_per_page = layout_info['cards_per_page']
-            total_pages = (len(cards) + cards_per_page - 1) // cards_per_page
-
-            for page_num in range(total_pages):
-                start_idx = page_num * cards_per_page
-                end_idx = min(start_idx + cards_per_page, len(cards))
-                page_cards = cards[start_idx:end_idx]
-
-                # Create page layout
-                page_content = self._create_page_content(page_cards, layout_info)
-                story.extend(page_content)
-
-                # Add page break if not last page
-                if page_num < total_pages - 1:
-                    story.append(Spacer(1, 0))  # Force page break
-
-            # Build PDF
-            doc.build(story)
-
-            # Calculate file size
-            file_size_mb = output_file.stat().st_size / (1024 * 1024)
-
-            # Calculate generation time
-            generation_time = time.time() - start_time
-
-            return PDFGenerationResult(
-                file_path=str(output_file),
-                total_cards=len(cards),
-                total_pages=total_pages,
-                cards_per_page=cards_per_page,
-                file_size_mb=file_size_mb,
-                generation_time_seconds=generation_time
-            )
+            for card in self._prepare_cards(cards, encoding):
+                page_cards.append(card)
+                card_count += 1
+
+                if len(page_cards) == cards_per_page:
+                    self._draw_page(pdf_canvas, page_cards, positions)
+                    page_count += 1
+                    page_cards = []  # Release this page's cards
+
+            if page_cards:
+                self._draw_page(pdf_canvas, page_cards, positions)
+                page_count += 1
+                page_cards = []
 
         except Exception as e:
             raise PDFGenerationError(f"Failed to create PDF: {str(e)}", str(output_file))
 
-    def _create_metadata_section(self, metadata: Dict) -> Flowable:
-        """Create metadata section for PDF header."""
-        # Create a simple text header with metadata
-        from reportlab.platypus import Paragraph
-        from reportlab.lib.styles import getSampleStyleSheet
-
-        styles = getSampleStyleSheet()
-        title_style = styles['Title']
+        if card_count == 0:
+            raise PDFGenerationError("No cards provided for PDF generation")
 
-        title_text = metadata.get('title', 'Pokemon Cards')
-        return Paragraph(title_text, title_style)
+        try:
+            with instrumentation.span("pdf.save"):
+                pdf_canvas.save()
+        except Exception as e:
+            raise PDFGenerationError(f"Failed to create PDF: {str(e)}", str(output_file))
 
-    def _create_page_content(self, cards: List[Image.Image], layout_info: Dict) -> List[Flowable]:
-        """Create content for a single page using proper table layout."""
-        # Calculate card dimensions in points
-        card_width_mm = settings.card.width_mm
-        card_height_mm = settings.card.height_mm
-        card_width_pt = card_width_mm * mm
-        card_height_pt = card_height_mm * mm
+        return PDFGenerationResult(
+            file_path=str(output_file),
+            total_cards=card_count,
+            total_pages=page_count,
+            cards_per_page=cards_per_page,
+            file_size_mb=output_file.stat().st_size / (1024 * 1024),
+            generation_time_seconds=time.time() - start_time
+        )
 
-        rows = layout_info['rows']
-        cols = layout_info['cols']
+    @create_error_context("generate sharded PDF")
+    def generate_cards_pdf_shards(self, cards: Iterable[Image.Image], output_path: str,
+                                  pages_per_shard: int, metadata: Optional[Dict] = None,
+                                  merge: bool = False, total_cards: Optional[int] = None,
+                                  encoding: Optional[ImageEncoding] = None,
+                                  workers: Optional[int] = None) -> ShardedPDFResult:
+        """
+        Generate a PDF as shards of a few pages each, written concurrently by worker processes.
 
-        # Create table data (2D array of flowables)
-        table_data = []
+        Shards are numbered files beside the output (cards_part001.pdf, ...).
+        A shard that fails is rewritten on its own in a fresh process, up to
+        settings.pdf.shard_retries times, without redoing the others; a worker
+        that dies takes its pool down, so later shards get a new pool. With
+        merge the shards are combined into output_path and removed; merging
+        needs PyPDF2, and without it the numbered set is kept.
 
-        for row in range(rows):
-            table_row = []
+        Each shard in flight holds the raw pixels of its distinct cards (about
+        3 MB per card at 300 DPI) in this process and again in its worker, so
+        memory grows with workers x pages_per_shard; the default worker count
+        is capped by settings.pdf.max_shard_workers for that reason.
 
-            for col in range(cols):
-                card_index = row * cols + col
-                if card_index < len(cards):
-                    card = cards[card_index]
+        Args:
+            cards: Iterable (e.g. generator) of PIL Images (cards)
+            output_path: Path for the merged PDF; shard names are derived from it
+            pages_per_shard: Pages written per shard
+            metadata: Optional metadata for PDF
+            merge: Combine the shards into a single PDF
+            total_cards: Expected number of cards, if known (used for shard numbering)
+            encoding: Image compression for the cards (default: settings.pdf)
+            workers: Shard-writing processes (default: settings.pdf.shard_worker_count)
 
-                    # Optimize card for print
-                    card = self._optimize_card_for_print(card)
+        Returns:
+            ShardedPDFResult with generation stats and the shard files
+        """
+        start_time = time.time()
+        if pages_per_shard < 1:
+            raise PDFGenerationError(f"Pages per shard must be at least 1, got {pages_per_shard}")
 
-                    # Create flowable for card
-                    card_flowable = CardFlowable(card, card_width_pt, card_height_pt)
-                    table_row.append(card_flowable)
-                else:
-                    # Fill empty cells with spacer
-                    table_row.append("")
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        encoding = encoding or ImageEncoding.from_settings()
+        workers = workers or settings.pdf.shard_worker_count
+
+        # Temp files of shards whose worker was killed in an earlier run
+        for stale in output_file.parent.glob(f"{glob.escape(output_file.stem)}_part*{output_file.suffix or '.pdf'}.part"):
+            stale.unlink(missing_ok=True)
+
+        if merge and not pdf_merge_available():
+            log_error(PDFGenerationError("PyPDF2 not available for PDF merging; keeping numbered shards",
+                                         str(output_file)), "WARNING")
+            merge = False
+
+        cards_per_shard = pages_per_shard * self.page_layout.calculate_optimal_layout(1)['cards_per_page']
+        shard_count = -(-total_cards // cards_per_shard) if total_cards else 0
+        digits = max(3, len(str(shard_count)))
+
+        results: List[PDFGenerationResult] = []
+        retried_shards = 0
+        # Each entry: (shard path, payload, future, pool the future runs on)
+        pending: Deque[Tuple[Path, Tuple, Future, ProcessPoolExecutor]] = deque()
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+        def rewrite(path: Path, payload: Tuple, error: Exception) -> Tuple[PDFGenerationResult, Dict]:
+            """Rewrite a failed shard in a fresh process, so a broken pool cannot fail the retry too."""
+            nonlocal retried_shards
+            for _ in range(settings.pdf.shard_retries):
+                log_error(PDFGenerationError(f"Rewriting shard after error: {str(error)}", str(path)), "WARNING")
+                retried_shards += 1
+                try:
+                    with ProcessPoolExecutor(max_workers=1) as retry_executor:
+                        return retry_executor.submit(
+                            _write_shard_worker, *payload, str(path), metadata, encoding
+                        ).result()
+                except Exception as e:
+                    error = e
+            raise PDFGenerationError(f"Failed to write shard: {str(error)}", str(path))
+
+        def finish() -> None:
+            nonlocal executor
+            path, payload, future, pool = pending.popleft()
+            try:
+                result, worker_spans = future.result()
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool) and pool is executor:
+                    # A worker died; its pool refuses new work, so later shards get a new one
+                    executor.shutdown(wait=False)
+                    executor = ProcessPoolExecutor(max_workers=workers)
+                result, worker_spans = rewrite(path, payload, e)
+            instrumentation.merge(worker_spans)
+            results.append(result)
 
-            table_data.append(table_row)
+        try:
+            for index, chunk in enumerate(self._chunk_cards(cards, cards_per_shard), 1):
+                path = shard_path(output_file, index, digits)
+                payload = self._shard_payload(chunk)
+                del chunk  # The payload holds the pixels until the shard is written
+                future = executor.submit(_write_shard_worker, *payload, str(path), metadata, encoding)
+                pending.append((path, payload, future, executor))
+
+                if len(pending) >= workers:
+                    finish()
+
+            while pending:
+                finish()
+        finally:
+            executor.shutdown()
+
+        if not results:
+            raise PDFGenerationError("No cards provided for PDF generation")
 
-        # Create table with proper dimensions
-        table = Table(
-            table_data,
-            colWidths=[card_width_pt] * cols,
-            rowHeights=[card_height_pt] * rows
+        shard_paths = [result.file_path for result in results]
+        if merge:
+            with instrumentation.span("pdf.merge"):
+                self.merge_pdfs(shard_paths, str(output_file))
+            for path in shard_paths:
+                Path(path).unlink()
+            file_path, file_size_mb, shard_paths = str(output_file), output_file.stat().st_size / (1024 * 1024), []
+        else:
+            file_path, file_size_mb = str(output_file.parent), sum(result.file_size_mb for result in results)
+
+        return ShardedPDFResult(
+            file_path=file_path,
+            total_cards=sum(result.total_cards for result in results),
+            total_pages=sum(result.total_pages for result in results),
+            cards_per_page=results[0].cards_per_page,
+            file_size_mb=file_size_mb,
+            generation_time_seconds=time.time() - start_time,
+            shard_paths=shard_paths,
+            merged=merge,
+            retried_shards=retried_shards
         )
 
-        # Configure table style
-        table_style = TableStyle([
-            # Remove all borders and backgrounds
-            ('GRID', (0, 0), (-1, -1), 0, colors.white),
-            ('BACKGROUND', (0, 0), (-1, -1), colors.white),
+    @staticmethod
+    def _chunk_cards(cards: Iterable[Image.Image], size: int) -> Iterator[List[Image.Image]]:
+        """Split a card stream into lists of at most `size` cards."""
+        iterator = iter(cards)
+        while True:
+            chunk = list(islice(iterator, size))
+            if not chunk:
+                return
+            yield chunk
+
+    @staticmethod
+    def _shard_payload(cards: List[Image.Image]) -> Tuple[List[EncodedCard], List[int]]:
+        """Encode a shard's distinct cards for transfer, with the order they are placed in."""
+        distinct: Dict[object, int] = {}
+        encoded: List[EncodedCard] = []
+        order = []
+        for card in cards:
+            # Repeated objects and cached cards are shipped once; the chunk keeps every card alive, so ids are unique
+            identity = card.info.get('card_key') or id(card)
+            if identity not in distinct:
+                distinct[identity] = len(encoded)
+                encoded.append(encode_card(card))
+            order.append(distinct[identity])
+        return encoded, order
+
+    def _prepare_cards(self, cards: Iterable[Image.Image], encoding: ImageEncoding) -> Iterator[PreparedCard]:
+        """
+        Name cards and encode each distinct card ahead of the page writer.
+
+        Encoding runs on a thread pool, `max_pending` cards ahead of the
+        writer; results are yielded in input order. Repeated cards are
+        embedded once and yielded without an image afterwards. Cards without
+        a cache key are named by a pixel digest computed on the pool, so a
+        repeat of one may be encoded again before it is recognized.
 
-            # Center align all cells
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        Args:
+            cards: Card images in document order
+            encoding: Image compression for the cards
 
-            # Add spacing between cards
-            ('LEFTPADDING', (0, 0), (-1, -1), layout_info['spacing'] / 2),
-            ('RIGHTPADDING', (0, 0), (-1, -1), layout_info['spacing'] / 2),
-            ('TOPPADDING', (0, 0), (-1, -1), layout_info['spacing'] / 2),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), layout_info['spacing'] / 2),
-        ])
+        Returns:
+            Iterator of (XObject name, encoded image or None for a repeat)
+        """
+        if self.encode_workers <= 1:
+            seen: Set[str] = set()
+            for card in cards:
+                name = card_xobject_name(card)
+                if name in seen:
+                    yield name, None
+                else:
+                    seen.add(name)
+                    yield name, self._encode_card(card, encoding)
+            return
+
+        # Keyed cards are named up front and repeats skip encoding; keyless cards are
+        # hashed on the pool with their encoding, and pixel repeats are dropped on the way out
+        submitted: Set[str] = set()
+        written: Set[str] = set()
+        pending: Deque[Tuple[Optional[str], Optional[Future]]] = deque()
+
+        def finish() -> PreparedCard:
+            name, future = pending.popleft()
+            if future is None:
+                return name, None
+            name, encoded = future.result()
+            if name in written:
+                return name, None
+            written.add(name)
+            return name, encoded
+
+        with ThreadPoolExecutor(max_workers=self.encode_workers, thread_name_prefix="pdf-encode") as executor:
+            for card in cards:
+                name = card_xobject_name(card) if card.info.get('card_key') else None
+                future = None
+                if name is None or name not in submitted:
+                    if name is not None:
+                        submitted.add(name)
+                    future = executor.submit(self._name_and_encode_card, card, encoding)
+                pending.append((name, future))
+
+                if len(pending) >= self.max_pending:
+                    yield finish()
+
+            while pending:
+                yield finish()
+
+    def _name_and_encode_card(self, card: Image.Image, encoding: ImageEncoding) -> Tuple[str, EncodedImage]:
+        """Name a card and encode it, so hashing the pixels of keyless cards stays off the writer thread."""
+        return card_xobject_name(card), self._encode_card(card, encoding)
+
+    def _encode_card(self, card: Image.Image, encoding: ImageEncoding) -> EncodedImage:
+        """Flatten a card for print and compress it for embedding."""
+        with instrumentation.span("pdf.encode"):
+            return encoding.encode(self._optimize_card_for_print(card))
+
+    def _draw_page(self, pdf_canvas: canvas.Canvas, cards: List[PreparedCard],
+                   positions: List[Tuple[float, float]]) -> None:
+        """Draw one page of cards at their precomputed positions and finish the page."""
+        with instrumentation.span("pdf.page"):
+            self._draw_cards(pdf_canvas, cards, positions)
+            pdf_canvas.showPage()
+
+    def _draw_cards(self, pdf_canvas: canvas.Canvas, cards: List[PreparedCard],
+                    positions: List[Tuple[float, float]]) -> None:
+        """Draw cards at their positions, measured in mm from the top-left of the page."""
+        card_width_mm = settings.card.width_mm
+        card_height_mm = settings.card.height_mm
 
-        table.setStyle(table_style)
+        for (name, encoded), (x_mm, y_mm) in zip(cards, positions):
+            # Positions are measured from the top-left; PDF origin is bottom-left
+            x = x_mm * mm
+            y = self.a4_height - (y_mm + card_height_mm) * mm
 
-        return [table]
+            draw_card_xobject(pdf_canvas, name, encoded, x, y, card_width_mm * mm, card_height_mm * mm)
 
     def _optimize_card_for_print(self, card: Image.Image) -> Image.Image:
         """Optimize card image for print quality."""
@@ -244,19 +542,11 @@ class PDFGenerator:
 
     def generate_proof_sheet(self, cards: List[Image.Image], output_path: str) -> PDFGenerationResult:
         """Generate a proof sheet with multiple cards per page for preview."""
-        # Use smaller card size for proof sheet
-        proof_cards = []
-        proof_size = (int(settings.card.width_pixels * 0.5), int(settings.card.height_pixels * 0.5))
-
-        for card in cards:
-            proof_card = card.resize(proof_size, Image.Resampling.LANCZOS)
-            proof_cards.append(proof_card)
-
-        # Generate with more cards per page
-        return self.generate_cards_pdf(proof_cards, output_path, {
+        # Proofs are for screen review: embed cards as downsampled JPEG
+        return self.generate_cards_pdf(cards, output_path, {
             'title': 'Pokemon Cards - Proof Sheet',
             'cards_per_page': 12  # More cards for preview
-        })
+        }, encoding=ImageEncoding.proof())
 
     def create_cutting_guides(self, cards: List[Image.Image], output_path: str) -> PDFGenerationResult:
         """Generate PDF with cutting guides for precise card cutting."""
@@ -378,19 +668,35 @@ class PDFGenerator:
 
         return True
 
-    def estimate_pdf_size(self, num_cards: int) -> Dict[str, float]:
-        """Estimate PDF file size and page count."""
+    def estimate_pdf_size(self, num_cards: int, encoding: Optional[ImageEncoding] = None,
+                          unique_cards: Optional[int] = None) -> Dict[str, float]:
+        """
+        Estimate PDF file size and page count.
+
+        Args:
+            num_cards: Number of cards in the document
+            encoding: Image compression for the cards (default: settings.pdf)
+            unique_cards: Number of distinct cards, if known; duplicates are embedded once
+
+        Returns:
+            Estimated pages and size in MB, cards per page and the encoding estimated for
+        """
+        encoding = encoding or ImageEncoding.from_settings()
         layout_info = self.page_layout.calculate_optimal_layout(num_cards)
 
         estimated_pages = layout_info['total_pages']
+        embedded_cards = min(num_cards, unique_cards) if unique_cards is not None else num_cards
+        bytes_per_card = encoding.estimate_bytes_per_card()
 
-        # Rough estimation: ~500KB per page for high-quality images
-        estimated_size_mb = estimated_pages * 0.5
+        estimated_bytes = (embedded_cards * bytes_per_card
+                           + estimated_pages * PAGE_OVERHEAD_BYTES + num_cards * CARD_OVERHEAD_BYTES)
 
         return {
             'estimated_pages': estimated_pages,
-            'estimated_size_mb': estimated_size_mb,
-            'cards_per_page': layout_info['cards_per_page']
+            'estimated_size_mb': estimated_bytes / (1024 * 1024),
+            'cards_per_page': layout_info['cards_per_page'],
+            'image_encoding': encoding.format,
+            'estimated_bytes_per_card': bytes_per_card
         }
 
 
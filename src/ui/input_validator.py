@@ -11,10 +11,10 @@ from config.constants import GENERATION_RANGES, MAX_VALUES
 class InputValidator:
     """Validator for user inputs in the menu system."""
 
-    def __init__(self):
+    def __init__(self, max_batch_size: Optional[int] = None):
         self.max_pokemon_id = MAX_VALUES['POKEMON_ID']
         self.max_generation = MAX_VALUES['GENERATION']
-        self.max_batch_size = MAX_VALUES['BATCH_SIZE']
+        self.max_batch_size = max_batch_size or MAX_VALUES['BATCH_SIZE']
 
     def parse_generation_input(self, input_str: str) -> List[int]:
         """
@@ -4,7 +4,7 @@ Uses Rich for beautiful terminal UI.
 """
 
 import sys
-from typing import List, Dict, Any, Optional, Union
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Union
 from rich.console import Console
 from rich.prompt import Prompt, Confirm, IntPrompt
 from rich.table import Table
@@ -13,7 +13,6 @@ from rich.text import Text
 from rich.columns import Columns
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
 
-from src.models import PokemonData, SearchResult
 from src.utils.error_handler import ValidationError, log_error
 from src.ui.input_validator import InputValidator
 from config.constants import (
@@ -21,6 +20,9 @@ from config.constants import (
     SEARCH_METHODS, MAX_VALUES
 )
 
+if TYPE_CHECKING:
+    from src.models import PokemonData
+
 console = Console()
 
 
@@ -247,7 +249,7 @@ class MenuSystem:
         self.console.print("[bold cyan]Processing Pokemon cards...[/bold cyan]")
         self.console.print()
 
-    def show_search_results(self, pokemon_list: List[PokemonData], search_method: str) -> None:
+    def show_search_results(self, pokemon_list: List["PokemonData"], search_method: str) -> None:
         """Display search results in a nice format."""
         if not pokemon_list:
             self.console.print("[red]No Pokemon found![/red]")
@@ -1,54 +1,83 @@
 """
 Cache management system for the Pokemon card generator.
-Implements three-layer caching: memory, file, and images.
+Implements three-layer caching: memory, persistent (SQLite), and images,
+plus a cache of finished card renders.
 """
 
+import atexit
 import json
-import pickle
+import os
 import hashlib
-from datetime import datetime, timedelta
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-from src.models import CacheEntry, APIResponse
-from src.utils.error_handler import CacheError, handle_errors, log_error
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
+from src.utils.error_handler import CacheError, log_error
 from src.utils.path_utils import get_app_cache_dir, get_app_data_dir
 from config.constants import CACHE_KEYS, MAX_VALUES
 
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+class _MemoryEntry:
+    """Lightweight memory cache entry with a monotonic-clock expiry."""
+
+    __slots__ = ('data', 'expires_at')
+
+    def __init__(self, data: Any, expires_at: float):
+        self.data = data
+        self.expires_at = expires_at
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check if the entry is expired."""
+        return (now if now is not None else time.monotonic()) > self.expires_at
+
 
 class MemoryCache:
-    """In-memory cache with TTL support."""
+    """In-memory LRU cache with TTL support and O(1) get, set and eviction."""
 
     def __init__(self, max_size: int = 1000, default_ttl_hours: int = 1):
-        self._cache: Dict[str, CacheEntry] = {}
+        # Ordered from least to most recently used
+        self._cache: "OrderedDict[str, _MemoryEntry]" = OrderedDict()
         self.max_size = max_size
         self.default_ttl_hours = default_ttl_hours
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
 
     def get(self, key: str) -> Optional[Any]:
         """Get item from memory cache."""
-        if key not in self._cache:
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
             return None
 
-        entry = self._cache[key]
         if entry.is_expired():
             del self._cache[key]
+            self.expirations += 1
+            self.misses += 1
             return None
 
-        entry.mark_accessed()
+        self._cache.move_to_end(key)
+        self.hits += 1
         return entry.data
 
     def set(self, key: str, data: Any, ttl_hours: Optional[int] = None) -> None:
         """Set item in memory cache."""
-        if len(self._cache) >= self.max_size:
-            self._evict_lru()
-
         ttl = ttl_hours or self.default_ttl_hours
-        expires_at = datetime.now() + timedelta(hours=ttl)
+        entry = _MemoryEntry(data, time.monotonic() + ttl * 3600)
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        elif len(self._cache) >= self.max_size:
+            self._evict_lru()
 
-        entry = CacheEntry(
-            key=key,
-            data=data,
-            expires_at=expires_at
-        )
         self._cache[key] = entry
 
     def delete(self, key: str) -> bool:
@@ -67,22 +96,26 @@ class MemoryCache:
         if not self._cache:
             return
 
-        lru_key = min(
-            self._cache.keys(),
-            key=lambda k: self._cache[k].last_accessed or self._cache[k].created_at
-        )
-        del self._cache[lru_key]
+        self._cache.popitem(last=False)
+        self.evictions += 1
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         total_entries = len(self._cache)
-        expired_entries = sum(1 for entry in self._cache.values() if entry.is_expired())
+        now = time.monotonic()
+        expired_entries = sum(1 for entry in self._cache.values() if entry.is_expired(now))
+        lookups = self.hits + self.misses
 
         return {
             'total_entries': total_entries,
             'expired_entries': expired_entries,
             'active_entries': total_entries - expired_entries,
             'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
             'memory_usage_mb': self._estimate_memory_usage()
         }
 
@@ -96,132 +129,303 @@ class MemoryCache:
             return 0.0
 
 
-class FileCache:
-    """File-based cache for persistent storage."""
+class SQLiteCache:
+    """
+    Single-file SQLite cache for persistent storage.
 
-    def __init__(self, cache_dir: Optional[Path] = None, max_size_mb: int = 100):
+    Cache hits are pure reads: access statistics are buffered in memory and
+    written back in batches instead of rewriting the entry on every get.
+    """
+
+    DB_FILENAME = "api_cache.sqlite3"
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_size_mb: int = 100,
+                 access_flush_threshold: int = 256, cleanup_check_interval: int = 200):
         if cache_dir is None:
             cache_dir = get_app_cache_dir()
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.max_size_mb = max_size_mb
-        self.api_cache_dir = self.cache_dir / "api_cache"
-        self.api_cache_dir.mkdir(exist_ok=True)
+        self.db_path = self.cache_dir / self.DB_FILENAME
+        self.legacy_cache_dir = self.cache_dir / "api_cache"
+        self.access_flush_threshold = access_flush_threshold
+        self.cleanup_check_interval = cleanup_check_interval
+
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending_access: Dict[str, List[float]] = {}  # key -> [hit count, last access time]
+        self._writes_since_cleanup = 0
+        atexit.register(self.close)
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            with self._lock:
+                if self._conn is None:
+                    self._conn = self._connect()
+        return self._conn
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, create the schema and import legacy JSON files."""
+        try:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    key TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL,
+                    access_count INTEGER NOT NULL DEFAULT 0,
+                    last_accessed REAL
+                )
+                """
+            )
+        except sqlite3.Error as e:
+            raise CacheError('open', str(self.db_path), str(e))
+
+        self._migrate_legacy_files(conn)
+        return conn
+
+    @staticmethod
+    @contextmanager
+    def _transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+        """Group several statements into one transaction (the connection is in autocommit mode)."""
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _migrate_legacy_files(self, conn: sqlite3.Connection) -> None:
+        """
+        Import entries left by the JSON-per-key file cache, then remove the imported files.
+
+        Files that cannot be read are renamed to *.json.unmigrated so they are
+        kept for inspection without being retried on every start.
+        """
+        if not self.legacy_cache_dir.is_dir():
+            return
 
-    @handle_errors(reraise=True)
-    def get(self, key: str) -> Optional[Any]:
-        """Get item from file cache."""
-        file_path = self._get_cache_file_path(key)
-        if not file_path.exists():
-            return None
+        rows = []
+        imported_files = []
+        for file_path in self.legacy_cache_dir.glob("*.json"):
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                expires_at = entry.get('expires_at')
+                created_at = entry.get('created_at')
+                rows.append((
+                    entry['key'],
+                    json.dumps(entry['data'], ensure_ascii=False, default=str),
+                    datetime.fromisoformat(created_at).timestamp() if created_at else time.time(),
+                    datetime.fromisoformat(expires_at).timestamp() if expires_at else None,
+                    entry.get('access_count', 0),
+                ))
+                imported_files.append(file_path)
+            except Exception as e:
+                log_error(CacheError('migrate', file_path.name, str(e)), "WARNING")
+                try:
+                    file_path.rename(file_path.with_name(f"{file_path.name}.unmigrated"))
+                except OSError as rename_error:
+                    log_error(CacheError('migrate', file_path.name, str(rename_error)), "WARNING")
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Check if expired
-            if 'expires_at' in data and data['expires_at']:
-                expires_at = datetime.fromisoformat(data['expires_at'])
-                if datetime.now() > expires_at:
-                    file_path.unlink()  # Delete expired file
+            with self._transaction(conn):
+                conn.executemany(
+                    "INSERT OR IGNORE INTO cache_entries "
+                    "(key, data, created_at, expires_at, access_count) VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+            for file_path in imported_files:
+                file_path.unlink()
+        except Exception as e:
+            log_error(CacheError('migrate', 'legacy_files', str(e)))
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get item from the SQLite cache."""
+        try:
+            with self._lock:
+                row = self.conn.execute(
+                    "SELECT data, expires_at FROM cache_entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
                     return None
 
-            # Update access time
-            data['last_accessed'] = datetime.now().isoformat()
-            data['access_count'] = data.get('access_count', 0) + 1
+                data, expires_at = row
+                now = time.time()
+                if expires_at is not None and now > expires_at:
+                    self.conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                    self._pending_access.pop(key, None)
+                    return None
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+                self._record_access(key, now)
 
-            return data['data']
+            return json.loads(data)
 
         except Exception as e:
             log_error(CacheError('get', key, str(e)))
             return None
 
-    @handle_errors(reraise=True)
     def set(self, key: str, data: Any, ttl_hours: Optional[int] = None) -> None:
-        """Set item in file cache."""
-        self._cleanup_if_needed()
-
-        file_path = self._get_cache_file_path(key)
-        expires_at = None
-        if ttl_hours:
-            expires_at = (datetime.now() + timedelta(hours=ttl_hours)).isoformat()
-
-        cache_data = {
-            'key': key,
-            'data': data,
-            'created_at': datetime.now().isoformat(),
-            'expires_at': expires_at,
-            'access_count': 0,
-            'last_accessed': None
-        }
+        """Set item in the SQLite cache."""
+        now = time.time()
+        expires_at = now + ttl_hours * 3600 if ttl_hours else None
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2, default=str)
+            payload = json.dumps(data, ensure_ascii=False, default=str)
+            with self._lock:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries "
+                    "(key, data, created_at, expires_at, access_count, last_accessed) "
+                    "VALUES (?, ?, ?, ?, 0, NULL)",
+                    (key, payload, now, expires_at)
+                )
+                self._pending_access.pop(key, None)
+                self._writes_since_cleanup += 1
+                if self._writes_since_cleanup >= self.cleanup_check_interval:
+                    self._writes_since_cleanup = 0
+                    self._cleanup_if_needed()
         except Exception as e:
             raise CacheError('set', key, str(e))
 
     def delete(self, key: str) -> bool:
-        """Delete item from file cache."""
-        file_path = self._get_cache_file_path(key)
+        """Delete item from the SQLite cache."""
         try:
-            if file_path.exists():
-                file_path.unlink()
-                return True
+            with self._lock:
+                self._pending_access.pop(key, None)
+                cursor = self.conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                return cursor.rowcount > 0
         except Exception as e:
             log_error(CacheError('delete', key, str(e)))
         return False
 
     def clear(self) -> None:
-        """Clear all items from file cache."""
+        """Clear all items from the SQLite cache."""
         try:
-            for file_path in self.api_cache_dir.glob("*.json"):
-                file_path.unlink()
+            with self._lock:
+                self._pending_access.clear()
+                self.conn.execute("DELETE FROM cache_entries")
         except Exception as e:
             log_error(CacheError('clear', 'all', str(e)))
 
-    def _get_cache_file_path(self, key: str) -> Path:
-        """Get the file path for a cache key."""
-        # Create safe filename from key
-        safe_key = hashlib.md5(key.encode()).hexdigest()
-        return self.api_cache_dir / f"{safe_key}.json"
+    def clear_expired(self) -> int:
+        """Remove expired entries. Returns number removed."""
+        try:
+            with self._lock:
+                cursor = self.conn.execute(
+                    "DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at < ?",
+                    (time.time(),)
+                )
+                return cursor.rowcount
+        except Exception as e:
+            log_error(CacheError('clear_expired', 'entries', str(e)))
+            return 0
+
+    def is_empty(self) -> bool:
+        """Check whether the cache holds no entries, without opening an empty database."""
+        if not self.db_path.exists():
+            legacy = self.legacy_cache_dir
+            return not legacy.is_dir() or next(legacy.glob("*.json"), None) is None
+        try:
+            with self._lock:
+                return self.conn.execute("SELECT 1 FROM cache_entries LIMIT 1").fetchone() is None
+        except Exception:
+            return True
+
+    def _record_access(self, key: str, now: float) -> None:
+        """Buffer access statistics, flushing once enough hits have accumulated."""
+        pending = self._pending_access.get(key)
+        if pending is None:
+            self._pending_access[key] = [1, now]
+        else:
+            pending[0] += 1
+            pending[1] = now
+
+        if len(self._pending_access) >= self.access_flush_threshold:
+            self.flush_access_stats()
+
+    def flush_access_stats(self) -> None:
+        """Write buffered access statistics to the database in one transaction."""
+        with self._lock:
+            if not self._pending_access or self._conn is None:
+                return
+            updates = [(count, last, key) for key, (count, last) in self._pending_access.items()]
+            self._pending_access.clear()
+            try:
+                with self._transaction(self._conn):
+                    self._conn.executemany(
+                        "UPDATE cache_entries SET access_count = access_count + ?, last_accessed = ? "
+                        "WHERE key = ?",
+                        updates
+                    )
+            except Exception as e:
+                log_error(CacheError('flush', 'access_stats', str(e)), "WARNING")
+
+    def _database_size_bytes(self) -> int:
+        """Get the on-disk size of the database, including its write-ahead log."""
+        total = 0
+        for suffix in ("", "-wal"):
+            path = Path(str(self.db_path) + suffix)
+            if path.exists():
+                total += path.stat().st_size
+        return total
 
     def _cleanup_if_needed(self) -> None:
-        """Clean up old cache files if size limit exceeded."""
+        """Evict the least recently used quarter of entries if the size limit is exceeded."""
         try:
-            total_size = sum(f.stat().st_size for f in self.api_cache_dir.glob("*.json"))
             max_size_bytes = self.max_size_mb * 1024 * 1024
-
-            if total_size > max_size_bytes:
-                # Remove oldest files first
-                files = sorted(
-                    self.api_cache_dir.glob("*.json"),
-                    key=lambda f: f.stat().st_mtime
+            if self._database_size_bytes() <= max_size_bytes:
+                return
+
+            self.flush_access_stats()
+            total = self.conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+            with self._transaction(self.conn):
+                self.conn.execute(
+                    "DELETE FROM cache_entries WHERE key IN ("
+                    "SELECT key FROM cache_entries "
+                    "ORDER BY COALESCE(last_accessed, created_at) LIMIT ?)",
+                    (max(1, total // 4),)
                 )
-
-                for file_path in files[:len(files)//4]:  # Remove 25% of files
-                    file_path.unlink()
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self.conn.execute("VACUUM")
 
         except Exception as e:
             log_error(CacheError('cleanup', 'size_limit', str(e)))
 
+    def close(self) -> None:
+        """Flush pending access statistics and close the database."""
+        with self._lock:
+            if self._conn is None:
+                return
+            self.flush_access_stats()
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
     def get_stats(self) -> Dict[str, Any]:
-        """Get file cache statistics."""
+        """Get SQLite cache statistics."""
         try:
-            files = list(self.api_cache_dir.glob("*.json"))
-            total_size = sum(f.stat().st_size for f in files)
+            with self._lock:
+                total_entries = self.conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+            total_size = self._database_size_bytes()
 
             return {
-                'total_files': len(files),
+                'total_entries': total_entries,
                 'total_size_mb': total_size / (1024 * 1024),
                 'max_size_mb': self.max_size_mb,
-                'usage_percentage': (total_size / (self.max_size_mb * 1024 * 1024)) * 100
+                'usage_percentage': (total_size / (self.max_size_mb * 1024 * 1024)) * 100,
+                'database_path': str(self.db_path)
             }
         except Exception:
-            return {'error': 'Could not get file cache stats'}
+            return {'error': 'Could not get SQLite cache stats'}
 
 
 class ImageCache:
@@ -234,6 +438,8 @@ class ImageCache:
         self.image_dir.mkdir(parents=True, exist_ok=True)
         self.official_artwork_dir = self.image_dir / "official_artwork"
         self.official_artwork_dir.mkdir(exist_ok=True)
+        self.derived_dir = self.image_dir / "derived"
+        self.derived_dir.mkdir(exist_ok=True)
 
     def get_image_path(self, pokemon_id: int, image_type: str = "official_artwork") -> Optional[Path]:
         """Get the local path for a Pokemon image."""
@@ -276,6 +482,56 @@ class ImageCache:
                 log_error(CacheError('delete_image', str(pokemon_id), str(e)))
         return False
 
+    @staticmethod
+    def _source_digest(source_path: Path) -> str:
+        """Identify a source image by its full resolved path, so same-named files never collide."""
+        return hashlib.sha1(str(source_path.resolve()).encode('utf-8')).hexdigest()[:16]
+
+    def _get_derived_path(self, source_path: Path, variant: str) -> Path:
+        """Get the derivative path for a source image, tied to its size and mtime."""
+        stat = source_path.stat()
+        version = hashlib.sha1(f"{stat.st_size}|{stat.st_mtime_ns}".encode('utf-8')).hexdigest()[:12]
+        return self.derived_dir / f"{self._source_digest(source_path)}_{variant}_{version}.png"
+
+    def get_derived_image(self, source_path: Path, variant: str) -> Optional["Image.Image"]:
+        """
+        Load a processed variant of a source image, if one is cached.
+
+        Args:
+            source_path: Original image the variant was derived from
+            variant: Name describing the processing, e.g. target geometry and DPI
+
+        Returns:
+            The derived image, or None if missing or the source has changed
+        """
+        from PIL import Image
+
+        try:
+            derived_path = self._get_derived_path(Path(source_path), variant)
+            with Image.open(derived_path) as stored:
+                return stored.copy()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log_error(CacheError('get_derived_image', str(source_path), str(e)), "WARNING")
+            return None
+
+    def store_derived_image(self, source_path: Path, variant: str, image: "Image.Image") -> None:
+        """Store a processed variant of a source image, replacing stale ones."""
+        source_path = Path(source_path)
+        try:
+            derived_path = self._get_derived_path(source_path, variant)
+            # Unique temp name, as several render processes may derive the same image
+            temp_path = derived_path.with_suffix(f".{os.getpid()}.tmp")
+            image.save(temp_path, 'PNG', compress_level=1)
+            os.replace(temp_path, derived_path)
+
+            for stale_path in self.derived_dir.glob(f"{self._source_digest(source_path)}_{variant}_*.png"):
+                if stale_path != derived_path:
+                    stale_path.unlink(missing_ok=True)
+        except Exception as e:
+            log_error(CacheError('store_derived_image', str(source_path), str(e)), "WARNING")
+
     def clear_images(self, image_type: Optional[str] = None) -> None:
         """Clear all images or specific type."""
         try:
@@ -299,34 +555,161 @@ class ImageCache:
         try:
             all_images = list(self.image_dir.rglob("*.png"))
             total_size = sum(f.stat().st_size for f in all_images)
+            derived_count = len(list(self.derived_dir.glob("*.png")))
 
             return {
-                'total_images': len(all_images),
+                'total_images': len(all_images) - derived_count,
                 'total_size_mb': total_size / (1024 * 1024),
-                'official_artwork_count': len(list(self.official_artwork_dir.glob("*.png")))
+                'official_artwork_count': len(list(self.official_artwork_dir.glob("*.png"))),
+                'derived_image_count': derived_count
             }
         except Exception:
             return {'error': 'Could not get image cache stats'}
 
 
+class RenderedCardCache:
+    """
+    On-disk cache of finished card bitmaps.
+
+    Cards are stored as fast-compressed PNGs named by a hash of everything that
+    affects their pixels, so unchanged cards are never rendered twice and any
+    change to the inputs simply misses.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_size_mb: int = 500,
+                 cleanup_check_interval: int = 100):
+        if cache_dir is None:
+            cache_dir = get_app_cache_dir() / "rendered_cards"
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_mb = max_size_mb
+        self.cleanup_check_interval = cleanup_check_interval
+        self._stores_since_cleanup = 0
+
+    @staticmethod
+    def make_key(inputs: Dict[str, Any]) -> str:
+        """Hash JSON-serializable card inputs into a cache key."""
+        payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _get_card_path(self, key: str) -> Path:
+        """Get file path for a card key."""
+        return self.cache_dir / f"{key}.png"
+
+    def get(self, key: str) -> Optional["Image.Image"]:
+        """Load a cached card, or None on a miss."""
+        from PIL import Image
+
+        card_path = self._get_card_path(key)
+        try:
+            with Image.open(card_path) as stored:
+                card = stored.copy()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log_error(CacheError('get_card', key, str(e)), "WARNING")
+            card_path.unlink(missing_ok=True)
+            return None
+
+        # PNG stores DPI as pixels per metre, so restore exact integers
+        if 'dpi' in card.info:
+            card.info['dpi'] = tuple(round(value) for value in card.info['dpi'])
+        card.info['card_key'] = key
+
+        try:
+            os.utime(card_path)  # Mark as recently used for size-based cleanup
+        except OSError:
+            pass
+        return card
+
+    def store(self, key: str, card: "Image.Image") -> None:
+        """Store a rendered card under its key."""
+        card_path = self._get_card_path(key)
+        # Serial and pooled renders, or concurrent runs, may store the same key; each writes its own temp file
+        temp_path = card_path.with_suffix(f".{os.getpid()}.tmp")
+        save_options = {'compress_level': 1}
+        if 'dpi' in card.info:
+            save_options['dpi'] = card.info['dpi']
+
+        try:
+            card.save(temp_path, 'PNG', **save_options)
+            os.replace(temp_path, card_path)
+        except Exception as e:
+            temp_path.unlink(missing_ok=True)
+            log_error(CacheError('store_card', key, str(e)), "WARNING")
+            return
+
+        card.info['card_key'] = key
+        self._stores_since_cleanup += 1
+        if self._stores_since_cleanup >= self.cleanup_check_interval:
+            self._stores_since_cleanup = 0
+            self._cleanup_if_needed()
+
+    def _cleanup_if_needed(self) -> None:
+        """Remove least recently used cards when the size limit is exceeded."""
+        try:
+            files = [(f, f.stat()) for f in self.cache_dir.glob("*.png")]
+            total_size = sum(stat.st_size for _, stat in files)
+            max_size_bytes = self.max_size_mb * 1024 * 1024
+            if total_size <= max_size_bytes:
+                return
+
+            # Trim to 75% of the limit so cleanup does not run on every store
+            target_size = max_size_bytes * 0.75
+            for card_file, stat in sorted(files, key=lambda item: item[1].st_mtime):
+                if total_size <= target_size:
+                    break
+                card_file.unlink(missing_ok=True)
+                total_size -= stat.st_size
+        except Exception as e:
+            log_error(CacheError('cleanup', 'rendered_cards', str(e)))
+
+    def clear(self) -> None:
+        """Remove all cached cards."""
+        try:
+            for card_file in self.cache_dir.glob("*.png"):
+                card_file.unlink()
+        except Exception as e:
+            log_error(CacheError('clear', 'rendered_cards', str(e)))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get rendered card cache statistics."""
+        try:
+            sizes = [f.stat().st_size for f in self.cache_dir.glob("*.png")]
+            return {
+                'total_cards': len(sizes),
+                'total_size_mb': sum(sizes) / (1024 * 1024)
+            }
+        except Exception:
+            return {'error': 'Could not get rendered card cache stats'}
+
+
 class CacheManager:
     """Main cache manager coordinating all cache layers."""
 
-    def __init__(self, cache_dir: Optional[Path] = None, memory_size: int = 1000, file_size_mb: int = 100):
+    # Room for pokemon and species entries of every Pokemon without LRU churn
+    DEFAULT_MEMORY_SIZE = 4096
+
+    def __init__(self, cache_dir: Optional[Path] = None, memory_size: int = DEFAULT_MEMORY_SIZE,
+                 file_size_mb: int = 100):
         self.memory_cache = MemoryCache(max_size=memory_size)
-        self.file_cache = FileCache(cache_dir=cache_dir, max_size_mb=file_size_mb)
+        self.file_cache = SQLiteCache(cache_dir=cache_dir, max_size_mb=file_size_mb)
         self.image_cache = ImageCache()
-        self._is_first_run = self._check_first_run()
+        self.rendered_card_cache = RenderedCardCache()
+        self._is_first_run: Optional[bool] = None
 
     def _check_first_run(self) -> bool:
         """Check if this is the first run by looking for existing cache."""
-        # If both cache directories are empty or just created, it's likely first run
-        api_cache_files = list(self.file_cache.api_cache_dir.glob("*.json"))
-        image_files = list(self.image_cache.official_artwork_dir.glob("*.png"))
-        return len(api_cache_files) == 0 and len(image_files) == 0
+        # If both the API cache and the image directory are empty, it's likely first run.
+        # scandir stops at the first entry instead of listing the whole directory.
+        with os.scandir(self.image_cache.official_artwork_dir) as entries:
+            has_images = any(entry.name.endswith(".png") for entry in entries)
+        return not has_images and self.file_cache.is_empty()
 
     def is_first_run(self) -> bool:
-        """Return whether this is the first run."""
+        """Return whether this is the first run, checked on first call."""
+        if self._is_first_run is None:
+            self._is_first_run = self._check_first_run()
         return self._is_first_run
 
     def get_cache_location(self) -> str:
@@ -400,44 +783,23 @@ class CacheManager:
         self.memory_cache.clear()
         self.file_cache.clear()
         self.image_cache.clear_images()
+        self.rendered_card_cache.clear()
 
     def clear_expired(self) -> Dict[str, int]:
         """Clear expired entries from all caches."""
         # Memory cache automatically removes expired items on access
-        # File cache expired items are removed when accessed
-
-        stats = {
+        return {
             'memory_cleared': 0,
-            'files_cleared': 0
+            'files_cleared': self.file_cache.clear_expired()
         }
 
-        # For file cache, manually check and remove expired files
-        try:
-            for file_path in self.file_cache.api_cache_dir.glob("*.json"):
-                try:
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-
-                    if 'expires_at' in data and data['expires_at']:
-                        expires_at = datetime.fromisoformat(data['expires_at'])
-                        if datetime.now() > expires_at:
-                            file_path.unlink()
-                            stats['files_cleared'] += 1
-                except Exception:
-                    # If we can't read the file, consider it corrupted and remove it
-                    file_path.unlink()
-                    stats['files_cleared'] += 1
-        except Exception as e:
-            log_error(CacheError('clear_expired', 'files', str(e)))
-
-        return stats
-
     def get_comprehensive_stats(self) -> Dict[str, Any]:
         """Get comprehensive statistics from all cache layers."""
         return {
             'memory_cache': self.memory_cache.get_stats(),
             'file_cache': self.file_cache.get_stats(),
             'image_cache': self.image_cache.get_stats(),
+            'rendered_card_cache': self.rendered_card_cache.get_stats(),
             'timestamp': datetime.now().isoformat()
         }
 
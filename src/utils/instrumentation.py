@@ -0,0 +1,171 @@
+"""
+Lightweight timing instrumentation for the Pokemon card generator.
+Records named spans, summarizes them with percentiles and optionally profiles a run.
+"""
+
+import inspect
+import json
+import math
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+
+class Instrumentation:
+    """
+    Collects wall-clock durations of named spans.
+
+    Recording a span costs two perf_counter calls and a list append, so spans
+    can stay enabled around per-card work. Samples recorded in worker
+    processes are shipped back with `drain` and folded in with `merge`.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._samples: Dict[str, List[float]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record one duration for a span name."""
+        if self.enabled:
+            with self._lock:
+                self._samples[name].append(seconds)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as one sample of `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def timed(self, name: str) -> Callable:
+        """Decorator timing each call of a function or coroutine function."""
+        def decorator(func: Callable) -> Callable:
+            if inspect.iscoroutinefunction(func):
+                @wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(name):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def timed_iter(self, name: str, items: Iterable) -> Iterator:
+        """Yield from items, recording the time taken to produce each one."""
+        items = iter(items)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            self.record(name, time.perf_counter() - start)
+            yield item
+
+    def total(self, name: str) -> float:
+        """Total seconds recorded for a span name."""
+        with self._lock:
+            return sum(self._samples.get(name, ()))
+
+    def drain(self) -> Dict[str, List[float]]:
+        """Remove and return all samples, e.g. to ship them out of a worker process."""
+        with self._lock:
+            samples = dict(self._samples)
+            self._samples = defaultdict(list)
+        return samples
+
+    def merge(self, samples: Dict[str, List[float]]) -> None:
+        """Add samples recorded elsewhere."""
+        if not self.enabled:
+            return
+        with self._lock:
+            for name, durations in samples.items():
+                self._samples[name].extend(durations)
+
+    def reset(self) -> None:
+        """Discard all samples."""
+        with self._lock:
+            self._samples = defaultdict(list)
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize every span.
+
+        Returns:
+            Mapping of span name to count, total, mean, min, max and p50/p90/p99, in seconds
+        """
+        with self._lock:
+            snapshot = {name: sorted(durations) for name, durations in self._samples.items() if durations}
+
+        stats = {}
+        for name, durations in sorted(snapshot.items()):
+            count = len(durations)
+            total = sum(durations)
+            stats[name] = {
+                'count': count,
+                'total': total,
+                'mean': total / count,
+                'min': durations[0],
+                'max': durations[-1],
+                'p50': _percentile(durations, 50),
+                'p90': _percentile(durations, 90),
+                'p99': _percentile(durations, 99),
+            }
+        return stats
+
+    def dump_json(self, path: Union[str, Path]) -> Path:
+        """Write the span summary to a JSON file."""
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.get_stats(), indent=2) + "\n", encoding="utf-8")
+        return path
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+@contextmanager
+def profile_run(output_path: Optional[Union[str, Path]] = None) -> Iterator[Any]:
+    """
+    Run the enclosed block under cProfile.
+
+    Only the current process is profiled; work done in render worker
+    processes shows up as time spent waiting on their results.
+
+    Args:
+        output_path: If given, stats are dumped there for `python -m pstats` or snakeviz
+
+    Yields:
+        The active cProfile.Profile
+    """
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if output_path:
+            path = Path(output_path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            pstats.Stats(profiler).dump_stats(str(path))
+
+
+# Global instrumentation instance
+instrumentation = Instrumentation()
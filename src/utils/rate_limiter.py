@@ -0,0 +1,65 @@
+"""
+Token-bucket rate limiting shared by every client that talks to upstream servers.
+"""
+
+import asyncio
+import threading
+import time
+
+from config.settings import settings
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter usable from coroutines and threads alike.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Each caller
+    reserves a token up front, letting the balance go negative, and then sleeps
+    until its token is due. Reservations are ordered, so concurrent callers are
+    spaced out evenly instead of all observing the same timestamp.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second; 0 or less disables limiting
+            burst: Maximum number of tokens that can accumulate while idle
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        """Wait asynchronously until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def acquire_sync(self) -> None:
+        """Block until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Global rate limiter shared by the API client, image downloader and type icon manager
+api_rate_limiter = TokenBucket(settings.api.rate_limit_per_second, settings.api.rate_limit_burst)
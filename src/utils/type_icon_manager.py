@@ -6,11 +6,12 @@ Downloads and caches Pokemon type icons from PokeAPI.
 import asyncio
 import aiohttp
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List, Set, Tuple
 from PIL import Image
 import requests
 
-from src.utils.error_handler import ImageDownloadError, log_error
+from src.utils.error_handler import ImageDownloadError, console, log_error
+from src.utils.rate_limiter import api_rate_limiter
 
 
 class TypeIconManager:
@@ -31,13 +32,36 @@ class TypeIconManager:
         # Use latest generation (Gen IX - Scarlet/Violet)
         self.base_url = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/types/generation-ix/scarlet-violet"
 
+        # Types with an icon on disk, scanned once; reset whenever icons are downloaded or cleared
+        self._available: Optional[Set[str]] = None
+        # Missing icons are fetched at most once per process, so an offline run does not retry per card
+        self._download_attempted = False
+        # Decoded icons fitted to a size, keyed by (type, max size); None when no icon is available
+        self._icons: Dict[Tuple[str, int], Optional[Image.Image]] = {}
+
+    def _available_types(self) -> Set[str]:
+        """Types whose icon is cached on disk."""
+        if self._available is None:
+            self._available = {type_name for type_name in self.type_to_id
+                               if (self.cache_dir / f"{type_name}.png").exists()}
+        return self._available
+
+    def invalidate(self) -> None:
+        """Forget what is on disk after icons were added or removed."""
+        self._available = None
+        self._icons.clear()
+
+    @property
+    def all_icons_present(self) -> bool:
+        """Whether every type icon is cached."""
+        return len(self._available_types()) == len(self.type_to_id)
+
     def get_type_icon_path(self, type_name: str) -> Optional[Path]:
         """Get path to cached type icon."""
-        if type_name.lower() not in self.type_to_id:
+        if type_name.lower() not in self._available_types():
             return None
 
-        icon_path = self.cache_dir / f"{type_name.lower()}.png"
-        return icon_path if icon_path.exists() else None
+        return self.cache_dir / f"{type_name.lower()}.png"
 
     def get_type_icon_url(self, type_name: str) -> Optional[str]:
         """Get PokeAPI URL for type icon."""
@@ -47,8 +71,9 @@ class TypeIconManager:
 
         return f"{self.base_url}/{type_id}.png"
 
-    async def download_type_icon(self, type_name: str) -> Optional[Path]:
-        """Download a single type icon."""
+    async def download_type_icon(self, type_name: str,
+                                 session: Optional[aiohttp.ClientSession] = None) -> Optional[Path]:
+        """Download a single type icon, reusing the given session if any."""
         url = self.get_type_icon_url(type_name)
         if not url:
             log_error(ImageDownloadError(0, type_name, f"Unknown type: {type_name}"), "WARNING")
@@ -57,27 +82,36 @@ class TypeIconManager:
         icon_path = self.cache_dir / f"{type_name.lower()}.png"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        icon_data = await response.read()
-
-                        # Save original icon
-                        with open(icon_path, 'wb') as f:
-                            f.write(icon_data)
-
-                        # Resize to fit within 140x140 pixels while maintaining aspect ratio
-                        self._resize_icon(icon_path, 140)
-
-                        return icon_path
-                    else:
-                        log_error(ImageDownloadError(0, type_name, f"HTTP {response.status}"), "WARNING")
-                        return None
+            await api_rate_limiter.acquire()
+            if session is None:
+                async with aiohttp.ClientSession() as own_session:
+                    return await self._fetch_type_icon(own_session, type_name, url, icon_path)
+            return await self._fetch_type_icon(session, type_name, url, icon_path)
 
         except Exception as e:
             log_error(ImageDownloadError(0, type_name, str(e)), "WARNING")
             return None
 
+    async def _fetch_type_icon(self, session: aiohttp.ClientSession, type_name: str,
+                               url: str, icon_path: Path) -> Optional[Path]:
+        """Fetch an icon and store it resized in the cache directory."""
+        async with session.get(url) as response:
+            if response.status != 200:
+                log_error(ImageDownloadError(0, type_name, f"HTTP {response.status}"), "WARNING")
+                return None
+
+            icon_data = await response.read()
+
+        # Save original icon
+        with open(icon_path, 'wb') as f:
+            f.write(icon_data)
+
+        # Resize to fit within 140x140 pixels while maintaining aspect ratio
+        self._resize_icon(icon_path, 140)
+        self.invalidate()
+
+        return icon_path
+
     def _resize_icon(self, icon_path: Path, max_size: int):
         """Resize icon proportionally to fit within max_size while maintaining aspect ratio."""
         try:
@@ -105,52 +139,94 @@ class TypeIconManager:
         except Exception as e:
             log_error(ImageDownloadError(0, str(icon_path), f"Resize failed: {str(e)}"), "WARNING")
 
-    async def download_all_type_icons(self) -> Dict[str, Optional[Path]]:
-        """Download all type icons concurrently."""
-        print("📥 Downloading Pokemon type icons...")
+    async def download_all_type_icons(self, type_names: Optional[Iterable[str]] = None,
+                                      verbose: bool = True) -> Dict[str, Optional[Path]]:
+        """
+        Download type icons concurrently over one session.
 
-        # Create tasks for all type downloads
-        tasks = []
-        for type_name in self.type_to_id.keys():
-            task = asyncio.create_task(self.download_type_icon(type_name))
-            tasks.append((type_name, task))
+        Args:
+            type_names: Types to download (default: all types)
+            verbose: Print a line per icon
 
-        # Execute downloads concurrently
-        results = {}
-        for type_name, task in tasks:
-            try:
-                result = await task
-                results[type_name] = result
-                if result:
-                    print(f"✅ {type_name}: Downloaded")
-                else:
-                    print(f"❌ {type_name}: Failed")
-            except Exception as e:
-                print(f"❌ {type_name}: Error - {str(e)}")
-                results[type_name] = None
+        Returns:
+            Mapping of type name to the cached icon path, or None if the download failed
+        """
+        if type_names is None:
+            type_names = self.type_to_id.keys()
+        if verbose:
+            console.print("📥 Downloading Pokemon type icons...")
 
+        results = {}
+        async with aiohttp.ClientSession() as session:
+            # Create tasks for all type downloads
+            tasks = []
+            for type_name in type_names:
+                task = asyncio.create_task(self.download_type_icon(type_name, session))
+                tasks.append((type_name, task))
+
+            # Execute downloads concurrently
+            for type_name, task in tasks:
+                try:
+                    result = await task
+                    results[type_name] = result
+                    if verbose:
+                        console.print(f"✅ {type_name}: Downloaded" if result else f"❌ {type_name}: Failed")
+                except Exception as e:
+                    if verbose:
+                        console.print(f"❌ {type_name}: Error - {str(e)}")
+                    results[type_name] = None
+
+        self.invalidate()
         return results
 
-    def ensure_type_icons_cached(self) -> bool:
-        """Ensure all type icons are cached. Download if missing."""
-        missing_types = []
-
-        for type_name in self.type_to_id.keys():
-            if not self.get_type_icon_path(type_name):
-                missing_types.append(type_name)
+    async def provision_type_icons(self) -> int:
+        """
+        Download any missing type icons up front, before rendering starts.
+
+        Returns:
+            Number of icons still missing afterwards
+        """
+        self.invalidate()  # Pick up icons added or removed since the last scan
+        missing = [type_name for type_name in self.type_to_id if type_name not in self._available_types()]
+        if missing:
+            self._download_attempted = True
+            await self.download_all_type_icons(missing, verbose=False)
+            missing = [type_name for type_name in missing if type_name not in self._available_types()]
+            if missing:
+                log_error(ImageDownloadError(0, ", ".join(missing), "Type icons unavailable, cards use colored circles"),
+                          "WARNING")
+        return len(missing)
+
+    def ensure_type_icons_cached(self, verbose: bool = False) -> bool:
+        """
+        Ensure all type icons are cached. Download if missing, at most once per process.
+
+        Args:
+            verbose: Print a line per icon; failures are logged either way
+
+        Returns:
+            True if missing icons were downloaded
+        """
+        if self.all_icons_present or self._download_attempted:
+            return False
+
+        self._download_attempted = True
+        missing_types = [type_name for type_name in self.type_to_id if type_name not in self._available_types()]
 
         if missing_types:
-            print(f"📥 Missing {len(missing_types)} type icons, downloading...")
+            if verbose:
+                console.print(f"📥 Missing {len(missing_types)} type icons, downloading...")
 
             # Use sync requests for simplicity in sync context
             for type_name in missing_types:
-                self._download_type_icon_sync(type_name)
+                self._download_type_icon_sync(type_name, verbose)
+            self.invalidate()
 
             return True
 
         return False
 
-    def _download_type_icon_sync(self, type_name: str) -> Optional[Path]:
+    def _download_type_icon_sync(self, type_name: str, verbose: bool = False) -> Optional[Path]:
         """Synchronous version of type icon download."""
         url = self.get_type_icon_url(type_name)
         if not url:
@@ -159,6 +235,7 @@ class TypeIconManager:
         icon_path = self.cache_dir / f"{type_name.lower()}.png"
 
         try:
+            api_rate_limiter.acquire_sync()
             response = requests.get(url, timeout=10)
             if response.status_code == 200:
                 # Save original icon
@@ -168,14 +245,15 @@ class TypeIconManager:
                 # Resize to fit within 140x140 pixels while maintaining aspect ratio
                 self._resize_icon(icon_path, 140)
 
-                print(f"✅ Downloaded: {type_name}")
+                if verbose:
+                    console.print(f"✅ Downloaded: {type_name}")
                 return icon_path
             else:
-                print(f"❌ Failed: {type_name} (HTTP {response.status_code})")
+                log_error(ImageDownloadError(0, type_name, f"HTTP {response.status_code}"), "WARNING")
                 return None
 
         except Exception as e:
-            print(f"❌ Error downloading {type_name}: {str(e)}")
+            log_error(ImageDownloadError(0, type_name, str(e)), "WARNING")
             return None
 
     def get_cache_stats(self) -> Dict[str, int]:
@@ -194,6 +272,8 @@ class TypeIconManager:
         """Clear all cached type icons."""
         for icon_file in self.cache_dir.glob("*.png"):
             icon_file.unlink()
+        self.invalidate()
+        self._download_attempted = False
 
     def load_type_icon(self, type_name: str) -> Optional[Image.Image]:
         """Load type icon as PIL Image."""
@@ -207,6 +287,40 @@ class TypeIconManager:
             log_error(ImageDownloadError(0, type_name, f"Failed to load icon: {str(e)}"), "WARNING")
             return None
 
+    def get_icon(self, type_name: str, max_size: int) -> Optional[Image.Image]:
+        """
+        Get a type icon decoded and scaled down to fit within max_size, from memory after the first call.
+
+        The returned image is shared between calls and must not be modified.
+
+        Args:
+            type_name: Pokemon type name
+            max_size: Largest width or height in pixels
+
+        Returns:
+            RGBA icon, or None if the icon is not available
+        """
+        cache_key = (type_name.lower(), max_size)
+        if cache_key not in self._icons:
+            self._icons[cache_key] = self._load_fitted_icon(type_name, max_size)
+        return self._icons[cache_key]
+
+    def _load_fitted_icon(self, type_name: str, max_size: int) -> Optional[Image.Image]:
+        """Decode an icon from disk and scale it to fit within max_size."""
+        icon = self.load_type_icon(type_name)
+        if icon is None:
+            return None
+
+        with icon:
+            icon = icon.convert('RGBA')
+        icon_width, icon_height = icon.size
+        if icon_width > max_size or icon_height > max_size:
+            # Scale down proportionally
+            scale_factor = min(max_size / icon_width, max_size / icon_height)
+            new_size = (int(icon_width * scale_factor), int(icon_height * scale_factor))
+            icon = icon.resize(new_size, Image.Resampling.LANCZOS)
+        return icon
+
 
 # Global type icon manager instance
-type_icon_manager = TypeIconManager()
\ No newline at end of file
+type_icon_manager = TypeIconManager()
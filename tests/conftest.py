@@ -0,0 +1,35 @@
+"""Shared pytest fixtures."""
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    """Point every global cache (API, image, rendered card, font index, type icons) at a per-test directory."""
+    from src.card import font_index as font_index_module
+    from src.card.font_index import FontIndex
+    from src.card.text_renderer import text_renderer
+    from src.utils.cache_manager import ImageCache, MemoryCache, RenderedCardCache, SQLiteCache, cache_manager
+    from src.utils.type_icon_manager import type_icon_manager
+
+    file_cache = SQLiteCache(cache_dir=tmp_path / "cache")
+    monkeypatch.setattr(cache_manager, "file_cache", file_cache)
+    monkeypatch.setattr(cache_manager, "memory_cache", MemoryCache(max_size=cache_manager.DEFAULT_MEMORY_SIZE))
+    monkeypatch.setattr(cache_manager, "_is_first_run", None)
+    monkeypatch.setattr(cache_manager, "image_cache", ImageCache(image_dir=tmp_path / "cache" / "images"))
+    monkeypatch.setattr(cache_manager, "rendered_card_cache",
+                        RenderedCardCache(cache_dir=tmp_path / "cache" / "rendered_cards"))
+    monkeypatch.setattr(font_index_module, "get_app_cache_dir", lambda: tmp_path / "cache")
+    monkeypatch.setattr(text_renderer, "font_index",
+                        FontIndex(text_renderer.system_font_paths, tmp_path / "cache" / "font_index.json"))
+    monkeypatch.setattr(text_renderer, "font_cache", {})
+
+    icon_dir = tmp_path / "cache" / "type_icons"
+    icon_dir.mkdir(parents=True)
+    monkeypatch.setattr(type_icon_manager, "cache_dir", icon_dir)
+    monkeypatch.setattr(type_icon_manager, "_available", None)
+    monkeypatch.setattr(type_icon_manager, "_icons", {})
+    # Cards fall back to colored circles instead of downloading icons mid-test
+    monkeypatch.setattr(type_icon_manager, "_download_attempted", True)
+
+    yield
+    file_cache.close()
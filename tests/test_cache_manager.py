@@ -0,0 +1,214 @@
+"""Tests for cache manager module."""
+import json
+import time
+import pytest
+from pathlib import Path
+from PIL import Image
+from src.utils import cache_manager as cache_module
+from src.utils.cache_manager import ImageCache, MemoryCache, RenderedCardCache, SQLiteCache
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path):
+    """Create SQLiteCache in a temporary directory."""
+    cache = SQLiteCache(cache_dir=tmp_path, access_flush_threshold=2)
+    yield cache
+    cache.close()
+
+
+def test_sqlite_cache_set_and_get(sqlite_cache):
+    """Test values round-trip through the SQLite cache."""
+    data = {'id': 25, 'names': {'en': 'Pikachu', 'ja': 'ピカチュウ'}}
+    sqlite_cache.set('pokemon_25', data, ttl_hours=1)
+
+    assert sqlite_cache.get('pokemon_25') == data
+    assert sqlite_cache.get('pokemon_26') is None
+    assert sqlite_cache.db_path.exists()
+
+
+def test_sqlite_cache_expired_entry(sqlite_cache):
+    """Test expired entries are treated as misses and removed."""
+    sqlite_cache.set('pokemon_1', {'id': 1}, ttl_hours=1)
+    sqlite_cache.conn.execute("UPDATE cache_entries SET expires_at = ?", (time.time() - 1,))
+
+    assert sqlite_cache.get('pokemon_1') is None
+    assert sqlite_cache.get_stats()['total_entries'] == 0
+
+
+def test_sqlite_cache_hits_do_not_write_until_flush(sqlite_cache):
+    """Test access statistics are buffered and written in batches."""
+    sqlite_cache.set('pokemon_1', {'id': 1})
+    sqlite_cache.set('pokemon_2', {'id': 2})
+
+    sqlite_cache.get('pokemon_1')
+    sqlite_cache.get('pokemon_1')
+    count = sqlite_cache.conn.execute(
+        "SELECT access_count FROM cache_entries WHERE key = 'pokemon_1'"
+    ).fetchone()[0]
+    assert count == 0  # Still buffered
+
+    sqlite_cache.get('pokemon_2')  # Second distinct key reaches the flush threshold
+    count = sqlite_cache.conn.execute(
+        "SELECT access_count FROM cache_entries WHERE key = 'pokemon_1'"
+    ).fetchone()[0]
+    assert count == 2
+
+
+def test_sqlite_cache_migrates_legacy_json_files(tmp_path):
+    """Test entries from the old JSON-per-key cache are imported into SQLite."""
+    legacy_dir = tmp_path / "api_cache"
+    legacy_dir.mkdir()
+    (legacy_dir / "abc.json").write_text(json.dumps({
+        'key': 'species_1',
+        'data': {'id': 1, 'name': 'bulbasaur'},
+        'created_at': '2025-01-01T00:00:00',
+        'expires_at': None,
+        'access_count': 3,
+        'last_accessed': None
+    }))
+
+    cache = SQLiteCache(cache_dir=tmp_path)
+    assert not cache.is_empty()
+    assert cache.get('species_1') == {'id': 1, 'name': 'bulbasaur'}
+    assert not list(legacy_dir.glob("*.json"))
+    cache.close()
+
+
+def test_sqlite_cache_keeps_unreadable_legacy_files(tmp_path):
+    """Test legacy files that fail to import are set aside instead of deleted."""
+    legacy_dir = tmp_path / "api_cache"
+    legacy_dir.mkdir()
+    (legacy_dir / "good.json").write_text(json.dumps({'key': 'species_2', 'data': {'id': 2}}))
+    (legacy_dir / "broken.json").write_text("{not json")
+    (legacy_dir / "keyless.json").write_text(json.dumps({'data': {'id': 3}}))
+
+    cache = SQLiteCache(cache_dir=tmp_path)
+
+    assert cache.get('species_2') == {'id': 2}
+    assert sorted(path.name for path in legacy_dir.iterdir()) == \
+        ["broken.json.unmigrated", "keyless.json.unmigrated"]
+    cache.close()
+
+
+def test_sqlite_cache_is_empty_without_database(tmp_path):
+    """Test emptiness check does not need an existing database."""
+    cache = SQLiteCache(cache_dir=tmp_path)
+
+    assert cache.is_empty()
+    assert not cache.db_path.exists()
+
+
+def test_memory_cache_evicts_least_recently_used():
+    """Test MemoryCache evicts the least recently used key."""
+    cache = MemoryCache(max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1  # 'b' is now least recently used
+
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    stats = cache.get_stats()
+    assert stats['evictions'] == 1
+    assert stats['hits'] == 3
+    assert stats['misses'] == 1
+
+
+def test_memory_cache_overwrite_does_not_evict():
+    """Test replacing an existing key in a full cache keeps other entries."""
+    cache = MemoryCache(max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.set('a', 10)
+
+    assert cache.get('a') == 10
+    assert cache.get('b') == 2
+    assert cache.get_stats()['evictions'] == 0
+
+
+def test_memory_cache_expiry(monkeypatch):
+    """Test entries expire using the monotonic clock."""
+    cache = MemoryCache()
+    now = time.monotonic()
+    monkeypatch.setattr(cache_module.time, 'monotonic', lambda: now)
+    cache.set('a', 1, ttl_hours=1)
+
+    monkeypatch.setattr(cache_module.time, 'monotonic', lambda: now + 3601)
+
+    assert cache.get('a') is None
+    assert cache.get_stats()['expirations'] == 1
+
+
+def test_rendered_card_cache_round_trip(tmp_path):
+    """Test cards are stored losslessly with their DPI and key."""
+    cache = RenderedCardCache(cache_dir=tmp_path)
+    card = Image.new('RGBA', (30, 40), (10, 20, 30, 255))
+    card.info['dpi'] = (300, 300)
+    key = cache.make_key({'pokemon': 25, 'language': 'en'})
+
+    assert cache.get(key) is None
+    cache.store(key, card)
+    cached = cache.get(key)
+
+    assert cached.tobytes() == card.tobytes()
+    assert cached.info['dpi'] == (300, 300)
+    assert cached.info['card_key'] == key
+    assert cache.get_stats()['total_cards'] == 1
+
+
+def test_rendered_card_cache_key_depends_on_inputs():
+    """Test any input change produces a different key."""
+    key = RenderedCardCache.make_key({'pokemon': 25, 'language': 'en'})
+
+    assert key == RenderedCardCache.make_key({'language': 'en', 'pokemon': 25})
+    assert key != RenderedCardCache.make_key({'pokemon': 25, 'language': 'ja'})
+
+
+def test_derived_image_invalidated_when_source_changes(tmp_path):
+    """Test derived images are reused until their source file changes."""
+    cache = ImageCache(image_dir=tmp_path / "images")
+    source = tmp_path / "25.png"
+    Image.new('RGBA', (50, 50), (255, 0, 0, 255)).save(source)
+    derived = Image.new('RGBA', (10, 10), (0, 255, 0, 128))
+
+    assert cache.get_derived_image(source, "card10x10") is None
+    cache.store_derived_image(source, "card10x10", derived)
+    assert cache.get_derived_image(source, "card10x10").tobytes() == derived.tobytes()
+    assert cache.get_derived_image(source, "card20x20") is None
+
+    Image.new('RGBA', (60, 60), (0, 0, 255, 255)).save(source)
+    assert cache.get_derived_image(source, "card10x10") is None
+
+    cache.store_derived_image(source, "card10x10", derived)
+    assert len(list(cache.derived_dir.glob("*_card10x10_*.png"))) == 1  # Stale variant replaced
+    assert cache.get_stats()['total_images'] == 0
+
+
+def test_derived_images_of_same_named_sources_coexist(tmp_path):
+    """Test sources sharing a file name in different directories keep separate derivatives."""
+    cache = ImageCache(image_dir=tmp_path / "images")
+    sources = [tmp_path / "a" / "1.png", tmp_path / "b" / "1.png"]
+    for index, source in enumerate(sources):
+        source.parent.mkdir()
+        Image.new('RGBA', (20, 20), (index * 200, 0, 0, 255)).save(source)
+        cache.store_derived_image(source, "card10x10", Image.new('RGBA', (10, 10), (index * 200, 0, 0, 255)))
+
+    assert cache.get_derived_image(sources[0], "card10x10").getpixel((0, 0))[0] == 0
+    assert cache.get_derived_image(sources[1], "card10x10").getpixel((0, 0))[0] == 200
+
+
+def test_rendered_card_store_uses_process_unique_temp_file(tmp_path, monkeypatch):
+    """Test concurrent stores of one key write separate temp files before publishing."""
+    cache = RenderedCardCache(cache_dir=tmp_path)
+    card = Image.new('RGBA', (10, 10), (1, 2, 3, 255))
+    replaced = []
+    original_replace = cache_module.os.replace
+    monkeypatch.setattr(cache_module.os, "replace",
+                        lambda src, dst: replaced.append(Path(src).name) or original_replace(src, dst))
+
+    cache.store("abc", card)
+
+    assert replaced == [f"abc.{cache_module.os.getpid()}.tmp"]
+    assert cache.get("abc").tobytes() == card.tobytes()
@@ -1,7 +1,7 @@
 """Tests for card designer module."""
 import pytest
 from pathlib import Path
-from PIL import Image
+from PIL import Image, ImageFont
 from src.card.card_designer import CardDesigner
 from src.models import PokemonData
 
@@ -95,3 +95,74 @@ def test_card_dimensions(card_designer):
 
     assert abs(card_designer.card_width - expected_width_px) <= 2  # Allow 2px tolerance
     assert abs(card_designer.card_height - expected_height_px) <= 2
+
+
+def test_base_card_template_is_copied(card_designer):
+    """Test base cards share one gradient template but are independent copies."""
+    first = card_designer._create_base_card()
+    second = card_designer._create_base_card()
+
+    assert first is not second
+    assert first.info['dpi'] == (300, 300)
+    assert first.getpixel((0, 0)) == (255, 255, 255, 255)
+    bottom = card_designer.card_height - 1
+    expected = int(255 - (bottom / card_designer.card_height) * 20)
+    assert first.getpixel((card_designer.card_width - 1, bottom)) == (expected, expected, expected, 255)
+
+    first.putpixel((0, 0), (0, 0, 0, 255))
+    assert second.getpixel((0, 0)) == (255, 255, 255, 255)
+
+
+def test_card_artwork_derivative_reused(sample_pokemon, tmp_path, monkeypatch):
+    """Test the fitted artwork is derived once and reused for later cards."""
+    from src.utils.cache_manager import ImageCache
+
+    image_cache = ImageCache(image_dir=tmp_path / "images")
+    card_designer = CardDesigner(image_cache=image_cache)
+    image_path = tmp_path / "25.png"
+    Image.new('RGBA', (100, 100), (200, 40, 40, 255)).save(image_path)
+
+    first = card_designer.create_card(sample_pokemon, image_path, language='en')
+    monkeypatch.setattr(card_designer, '_enhance_image', lambda image: pytest.fail("artwork re-derived"))
+    second = card_designer.create_card(sample_pokemon, image_path, language='en')
+
+    assert second.tobytes() == first.tobytes()
+    assert len(list(image_cache.derived_dir.glob("*.png"))) == 1
+
+
+def test_card_cache_key_tracks_resolved_fonts(sample_pokemon, tmp_path, monkeypatch):
+    """Test a change to the font a name is drawn with invalidates cached cards."""
+    from src.card.font_index import FontIndex
+    from src.card.text_renderer import text_renderer
+    from src.utils.cache_manager import RenderedCardCache
+
+    try:
+        font_bytes = ImageFont.load_default(24).font_bytes
+    except (TypeError, AttributeError):
+        pytest.skip("Pillow without a bundled scalable font")
+    font_dir = tmp_path / "fonts"
+    font_dir.mkdir()
+    image_path = tmp_path / "25.png"
+
+    monkeypatch.setattr(text_renderer, "font_index", FontIndex([font_dir], tmp_path / "empty_index.json"))
+    before = RenderedCardCache.make_key(CardDesigner.card_cache_key_inputs(sample_pokemon, image_path, 'en'))
+
+    (font_dir / "Aileron-Regular.ttf").write_bytes(font_bytes)
+    monkeypatch.setattr(text_renderer, "font_index", FontIndex([font_dir], tmp_path / "font_index.json"))
+    monkeypatch.setattr(text_renderer, "font_cache", {})
+    inputs = CardDesigner.card_cache_key_inputs(sample_pokemon, image_path, 'en')
+
+    assert inputs['fonts'][0][0].endswith("Aileron-Regular.ttf")
+    assert RenderedCardCache.make_key(inputs) != before
+
+
+def test_card_cache_key_tracks_font_settings(sample_pokemon, tmp_path, monkeypatch):
+    """Test a font size change invalidates cached cards even when the font files are unchanged."""
+    from config.settings import settings
+    from src.utils.cache_manager import RenderedCardCache
+
+    image_path = tmp_path / "25.png"
+    before = RenderedCardCache.make_key(CardDesigner.card_cache_key_inputs(sample_pokemon, image_path, 'en'))
+    monkeypatch.setattr(settings.font, "default_font_size", settings.font.default_font_size + 2)
+
+    assert RenderedCardCache.make_key(CardDesigner.card_cache_key_inputs(sample_pokemon, image_path, 'en')) != before
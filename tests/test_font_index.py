@@ -0,0 +1,71 @@
+"""Tests for font index module."""
+import pytest
+from PIL import ImageFont
+from src.card.font_index import FontIndex
+from src.card.text_renderer import TextRenderer
+
+
+@pytest.fixture
+def font_dir(tmp_path):
+    """Create a font directory holding Pillow's bundled Latin-only font."""
+    try:
+        font_bytes = ImageFont.load_default(24).font_bytes
+    except (TypeError, AttributeError):
+        pytest.skip("Pillow without a bundled scalable font")
+
+    directory = tmp_path / "fonts" / "truetype"
+    directory.mkdir(parents=True)
+    (directory / "Aileron-Regular.ttf").write_bytes(font_bytes)
+    (directory / "notes.txt").write_text("not a font")
+    return tmp_path / "fonts"
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    """Location of the persisted index."""
+    return tmp_path / "cache" / "font_index.json"
+
+
+def test_scan_records_language_coverage(font_dir, index_path):
+    """Test fonts are indexed with the languages they can actually draw."""
+    index = FontIndex([font_dir], index_path)
+
+    assert [font.languages for font in index.fonts] == [['en']]
+    assert index.find('en', 'bold', ['Arial']).endswith("Aileron-Regular.ttf")
+    assert index.find('ja') is None
+    assert index_path.exists()
+
+
+def test_persisted_index_is_reused(font_dir, index_path, monkeypatch):
+    """Test a second process loads the saved index instead of scanning."""
+    FontIndex([font_dir], index_path).fonts
+
+    def fail_scan(self):
+        pytest.fail("font directories were rescanned")
+
+    monkeypatch.setattr(FontIndex, "_scan", fail_scan)
+
+    assert FontIndex([font_dir], index_path).find('en') is not None
+
+
+def test_directory_change_invalidates_index(font_dir, index_path):
+    """Test adding a font directory triggers a rescan."""
+    FontIndex([font_dir], index_path).fonts
+    (font_dir / "extra").mkdir()
+    (font_dir / "extra" / "Copy-Bold.ttf").write_bytes((font_dir / "truetype" / "Aileron-Regular.ttf").read_bytes())
+
+    index = FontIndex([font_dir], index_path)
+
+    assert len(index.fonts) == 2
+    assert index.find('en', preferred_names=['Copy-Bold']).endswith("Copy-Bold.ttf")
+
+
+def test_text_renderer_resolves_system_fonts_through_index(font_dir, index_path):
+    """Test the renderer loads indexed fonts at the requested size."""
+    renderer = TextRenderer()
+    renderer.font_index = FontIndex([font_dir], index_path)
+
+    font = renderer.get_font('en', 30)
+
+    assert font.path.endswith("Aileron-Regular.ttf")
+    assert font.size == 30
@@ -0,0 +1,95 @@
+"""Tests for instrumentation module."""
+import asyncio
+import json
+import pstats
+import pytest
+from src.utils.instrumentation import Instrumentation, profile_run
+
+
+@pytest.fixture
+def instrumentation():
+    """Create a fresh instrumentation instance."""
+    return Instrumentation()
+
+
+def test_span_stats_and_percentiles(instrumentation):
+    """Test recorded spans are summarized with nearest-rank percentiles."""
+    for millis in range(1, 101):
+        instrumentation.record("work", millis / 1000)
+
+    stats = instrumentation.get_stats()["work"]
+
+    assert stats['count'] == 100
+    assert stats['total'] == pytest.approx(5.05)
+    assert stats['mean'] == pytest.approx(0.0505)
+    assert stats['min'] == pytest.approx(0.001)
+    assert stats['max'] == pytest.approx(0.1)
+    assert stats['p50'] == pytest.approx(0.05)
+    assert stats['p90'] == pytest.approx(0.09)
+    assert stats['p99'] == pytest.approx(0.099)
+
+
+def test_timed_supports_functions_and_coroutines(instrumentation):
+    """Test the decorator records one sample per call for sync and async functions."""
+    @instrumentation.timed("sync")
+    def add(a, b):
+        return a + b
+
+    @instrumentation.timed("async")
+    async def add_async(a, b):
+        await asyncio.sleep(0)
+        return a + b
+
+    assert add(1, 2) == 3
+    assert asyncio.run(add_async(2, 3)) == 5
+    with pytest.raises(TypeError):
+        add(1, None)
+
+    stats = instrumentation.get_stats()
+    assert stats['sync']['count'] == 2  # Failed calls are timed too
+    assert stats['async']['count'] == 1
+
+
+def test_timed_iter_records_one_sample_per_item(instrumentation):
+    """Test wrapping an iterator times each produced item without changing the items."""
+    items = list(instrumentation.timed_iter("produce", iter("abc")))
+
+    assert items == ["a", "b", "c"]
+    assert instrumentation.get_stats()['produce']['count'] == 3
+
+
+def test_drain_and_merge(instrumentation):
+    """Test samples drained from one instance can be merged into another."""
+    worker = Instrumentation()
+    with worker.span("card.create"):
+        pass
+
+    instrumentation.record("card.create", 0.5)
+    instrumentation.merge(worker.drain())
+
+    assert worker.get_stats() == {}
+    assert instrumentation.get_stats()['card.create']['count'] == 2
+
+
+def test_disabled_instrumentation_records_nothing():
+    """Test a disabled instance ignores spans and merged samples."""
+    instrumentation = Instrumentation(enabled=False)
+    with instrumentation.span("work"):
+        pass
+    instrumentation.merge({"work": [1.0]})
+
+    assert instrumentation.get_stats() == {}
+    assert instrumentation.total("work") == 0
+
+
+def test_dump_json_and_profile_run(instrumentation, tmp_path):
+    """Test span stats and cProfile output are written to disk."""
+    profile_path = tmp_path / "run.prof"
+    with profile_run(profile_path):
+        with instrumentation.span("work"):
+            sum(range(1000))
+
+    stats_path = instrumentation.dump_json(tmp_path / "spans" / "stats.json")
+
+    assert json.loads(stats_path.read_text())['work']['count'] == 1
+    assert pstats.Stats(str(profile_path)).total_calls > 0
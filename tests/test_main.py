@@ -0,0 +1,99 @@
+"""Tests for the command-line entry point."""
+import asyncio
+import json
+import pytest
+from PIL import Image
+import main
+from src.models import PokemonData, PokemonBasicData, PokemonType
+from src.utils.error_handler import PokemonCardGeneratorError
+from config.settings import settings
+
+
+def make_pokemon(pokemon_id: int) -> PokemonData:
+    """Create minimal Pokemon data."""
+    basic = PokemonBasicData(
+        id=pokemon_id, name=f"mon{pokemon_id}", height=4, weight=60,
+        types=[PokemonType(slot=1, type={"name": "electric", "url": "https://pokeapi.co/api/v2/type/13/"})]
+    )
+    return PokemonData(basic=basic, names={"en": f"Mon{pokemon_id}"})
+
+
+def test_batch_options_require_scope():
+    """Test batch-only options are rejected without --generations or --ids."""
+    with pytest.raises(SystemExit):
+        main.parse_args(["--output", "cards.pdf"])
+
+    args = main.parse_args([])
+    assert args.generations is None and args.ids is None
+
+    with pytest.raises(SystemExit):
+        main.parse_args(["--ids", "1-151", "--merge-shards"])
+    for workers in ("0", "-2"):
+        with pytest.raises(SystemExit):
+            main.parse_args(["--ids", "1", "--workers", workers])
+    assert main.parse_args(["--ids", "1-151", "--shard-pages", "5", "--merge-shards"]).shard_pages == 5
+
+
+def test_build_batch_session():
+    """Test batch arguments become interactive-style session data."""
+    session = main.build_batch_session(main.parse_args(["--ids", "1-3,25", "--language", "en,ja"]))
+
+    assert session == {'search_method': 'id', 'pokemon_ids': [1, 2, 3, 25], 'language': ['en', 'ja']}
+    with pytest.raises(PokemonCardGeneratorError):
+        main.build_batch_session(main.parse_args(["--generations", "1", "--language", "xx"]))
+
+
+def test_build_image_encoding():
+    """Test encoding options override only the settings they name."""
+    encoding = main.build_image_encoding(main.parse_args(["--ids", "1", "--image-encoding", "jpeg",
+                                                          "--downsample-dpi", "150"]))
+
+    assert (encoding.format, encoding.jpeg_quality, encoding.downsample_dpi) == ('jpeg', 90, 150)
+    assert main.build_image_encoding(main.parse_args(["--ids", "1"])).format == 'flate'
+
+
+def test_run_batch_writes_pdf_and_summary(tmp_path, monkeypatch):
+    """Test a batch run goes end to end without prompts and reports stage timings."""
+    image_paths = {}
+    for pokemon_id in (1, 2):
+        image_paths[pokemon_id] = tmp_path / f"{pokemon_id}.png"
+        Image.new('RGBA', (80, 80), (200, 50, 50, 255)).save(image_paths[pokemon_id])
+
+    async def fake_fetch(self, session_data):
+        return [make_pokemon(pid) for pid in session_data['pokemon_ids']]
+
+    async def fake_download(self, pokemon_list):
+        return image_paths
+
+    monkeypatch.setattr(main.PokemonCardGenerator, "_fetch_pokemon_data", fake_fetch)
+    monkeypatch.setattr(main.PokemonCardGenerator, "_download_images", fake_download)
+    monkeypatch.setattr(main.PokemonCardGenerator, "_get_output_path",
+                        lambda self, filename: pytest.fail("batch mode prompted for a path"))
+    monkeypatch.setattr(settings.render, "use_card_cache", False)
+
+    args = main.parse_args(["--ids", "1,2", "--output", str(tmp_path / "out"), "--workers", "1"])
+    summary = asyncio.run(main.run_batch(args))
+
+    assert summary['status'] == 'ok'
+    assert summary['cards'] == 2 and summary['pages'] == 1
+    assert summary['output'].startswith(str(tmp_path / "out"))
+    assert set(summary['timings_seconds']) == {'fetch', 'download', 'render', 'pdf', 'total'}
+    assert summary['spans']['render.card']['count'] == 2
+    assert summary['spans']['card.create']['count'] == 2
+    assert summary['spans']['pdf.page']['count'] == 1
+    json.dumps(summary)
+
+
+def test_batch_stdout_carries_only_the_summary(monkeypatch, capsys):
+    """Test stray prints during a batch run go to stderr, leaving stdout parseable."""
+    async def noisy_run_batch(args):
+        print("📥 Downloading Pokemon type icons...")
+        return {'status': 'ok'}
+
+    monkeypatch.setattr(main, "run_batch", noisy_run_batch)
+    monkeypatch.setattr(main, "_route_output_to_stderr", lambda: None)
+
+    assert main.main_batch(main.parse_args(["--ids", "1"])) == 0
+    captured = capsys.readouterr()
+    assert json.loads(captured.out) == {'status': 'ok'}
+    assert "Downloading" in captured.err
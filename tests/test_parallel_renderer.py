@@ -0,0 +1,100 @@
+"""Tests for parallel card renderer module."""
+import pytest
+from PIL import Image
+from src.card.parallel_renderer import ParallelCardRenderer, encode_card, decode_card
+from src.models import PokemonData, PokemonBasicData, PokemonType
+from src.utils.cache_manager import RenderedCardCache
+
+
+def make_pokemon(pokemon_id: int, name: str) -> PokemonData:
+    """Create minimal Pokemon data."""
+    basic = PokemonBasicData(
+        id=pokemon_id,
+        name=name,
+        height=4,
+        weight=60,
+        types=[PokemonType(slot=1, type={"name": "electric", "url": "https://pokeapi.co/api/v2/type/13/"})]
+    )
+    return PokemonData(basic=basic, names={"en": name.title()})
+
+
+@pytest.fixture
+def render_jobs(tmp_path):
+    """Create (pokemon, image_path) jobs with distinct artwork colours."""
+    jobs = []
+    for i, color in enumerate([(255, 0, 0, 255), (0, 255, 0, 255), (0, 0, 255, 255)], 1):
+        image_path = tmp_path / f"{i}.png"
+        Image.new('RGBA', (100, 100), color).save(image_path)
+        jobs.append((make_pokemon(i, f"mon{i}"), image_path))
+    return jobs
+
+
+def test_encode_decode_roundtrip():
+    """Test encoded cards decode to identical images."""
+    card = Image.new('RGBA', (20, 30), (10, 20, 30, 255))
+    card.info['dpi'] = (300, 300)
+
+    decoded = decode_card(encode_card(card))
+
+    assert decoded.tobytes() == card.tobytes()
+    assert decoded.info['dpi'] == (300, 300)
+
+
+def test_parallel_matches_serial_order(render_jobs):
+    """Test pooled rendering yields the same cards, in order, as in-process rendering."""
+    serial = ParallelCardRenderer(workers=1, use_card_cache=False).render_cards(render_jobs, 'en')
+
+    progress = []
+    parallel = ParallelCardRenderer(workers=2, use_card_cache=False).render_cards(
+        render_jobs, 'en',
+        progress_callback=lambda completed, pokemon: progress.append((completed, pokemon.pokemon_id))
+    )
+
+    assert len(parallel) == len(serial) == 3
+    for serial_card, parallel_card in zip(serial, parallel):
+        assert parallel_card.size == serial_card.size
+        assert parallel_card.tobytes() == serial_card.tobytes()
+    assert progress == [(1, 1), (2, 2), (3, 3)]
+
+
+def test_repeat_run_uses_rendered_card_cache(render_jobs, tmp_path):
+    """Test unchanged cards are loaded from the cache and changed ones re-rendered."""
+    card_cache = RenderedCardCache(cache_dir=tmp_path / "rendered")
+    first = ParallelCardRenderer(workers=1, card_cache=card_cache).render_cards(render_jobs, 'en')
+
+    # Change one card's artwork; only that card may be rendered again
+    Image.new('RGBA', (100, 100), (255, 255, 0, 255)).save(render_jobs[1][1])
+    renderer = ParallelCardRenderer(workers=1, card_cache=card_cache)
+    rendered = []
+    original_create_card = renderer.card_designer.create_card
+
+    def counting_create_card(pokemon, *args):
+        rendered.append(pokemon.pokemon_id)
+        return original_create_card(pokemon, *args)
+
+    renderer.card_designer.create_card = counting_create_card
+
+    second = renderer.render_cards(render_jobs, 'en')
+
+    assert rendered == [2]
+    assert renderer.cache_hits == 2
+    assert second[0].tobytes() == first[0].tobytes()
+    assert second[0].info['dpi'] == first[0].info['dpi']
+    assert second[1].tobytes() != first[1].tobytes()
+
+
+def test_parallel_renders_are_cached_by_the_workers(render_jobs, tmp_path, monkeypatch):
+    """Test pooled renders are stored by the workers and reused, without PNG encoding on the consumer."""
+    card_cache = RenderedCardCache(cache_dir=tmp_path / "rendered")
+    monkeypatch.setattr(ParallelCardRenderer, "_store_rendered",
+                        lambda self, key, card: pytest.fail("card stored on the consuming process"))
+
+    first = ParallelCardRenderer(workers=2, card_cache=card_cache).render_cards(render_jobs, 'en')
+    renderer = ParallelCardRenderer(workers=2, card_cache=card_cache)
+    second = renderer.render_cards(render_jobs, 'en')
+
+    assert card_cache.get_stats()['total_cards'] == 3
+    assert all(card.info['card_key'] for card in first)
+    assert [card.info['card_key'] for card in second] == [card.info['card_key'] for card in first]
+    assert renderer.cache_hits == 3
+    assert second[2].tobytes() == first[2].tobytes()
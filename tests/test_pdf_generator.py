@@ -1,4 +1,5 @@
 """Tests for PDF generator module."""
+import re
 import pytest
 from pathlib import Path
 from PIL import Image
@@ -93,3 +94,351 @@ def test_pdf_output_path_creation(pdf_generator, sample_cards, tmp_path):
 
     assert output_path.exists()
     assert result.total_cards == 3
+
+
+def test_generate_pdf_stream_from_generator(pdf_generator, tmp_path):
+    """Test streaming PDF generation consumes a generator page by page."""
+    def card_stream():
+        for i in range(20):
+            card = Image.new('RGBA', (744, 1039), (255, 255, 255, 255))
+            card.info['dpi'] = (300, 300)
+            yield card
+
+    output_path = tmp_path / "test_stream.pdf"
+    result = pdf_generator.generate_cards_pdf_stream(card_stream(), str(output_path), {}, total_cards=20)
+
+    assert output_path.exists()
+    assert result.total_cards == 20
+    assert result.total_pages == 3  # ceil(20 / 9) = 3
+    assert result.cards_per_page == 9
+
+
+def test_generate_pdf_stream_empty(pdf_generator, tmp_path):
+    """Test streaming PDF generation rejects an empty card stream."""
+    from src.utils.error_handler import PDFGenerationError
+
+    with pytest.raises(PDFGenerationError):
+        pdf_generator.generate_cards_pdf_stream(iter([]), str(tmp_path / "empty.pdf"), {})
+
+
+def test_duplicate_cards_are_embedded_once(pdf_generator, tmp_path):
+    """Test repeated cards reference a single image XObject in both generators."""
+    red = Image.new('RGBA', (744, 1039), (255, 0, 0, 255))
+    blue = Image.new('RGBA', (744, 1039), (0, 0, 255, 255))
+    cards = [red, blue, red.copy(), red, blue]
+
+    list_path = tmp_path / "list.pdf"
+    stream_path = tmp_path / "stream.pdf"
+    pdf_generator.generate_cards_pdf(cards, str(list_path))
+    pdf_generator.generate_cards_pdf_stream(iter(cards), str(stream_path), total_cards=len(cards))
+
+    for path in (list_path, stream_path):
+        assert path.read_bytes().count(b"/Subtype /Image") == 2
+
+
+def test_card_key_names_the_xobject():
+    """Test cached cards are named by their content key instead of hashing pixels."""
+    from src.pdf.pdf_generator import card_xobject_name
+
+    card = Image.new('RGB', (744, 1039), 'white')
+    card.info['card_key'] = "abc123"
+
+    assert card_xobject_name(card) == "card_abc123_744x1039_RGB"
+    assert card_xobject_name(card.resize((372, 519))) != card_xobject_name(card)
+
+
+def _flaky_shard_worker(cards, order, output_path, metadata, encoding):
+    """Fail the first attempt at the second shard, then write it normally."""
+    import src.pdf.pdf_generator as pdf_module
+
+    marker = Path(f"{output_path}.failed")
+    if output_path.endswith("_part002.pdf") and not marker.exists():
+        marker.touch()
+        raise RuntimeError("simulated worker crash")
+    return pdf_module._original_write_shard_worker(cards, order, output_path, metadata, encoding)
+
+
+def _dying_shard_worker(cards, order, output_path, metadata, encoding):
+    """Kill the worker process on the first attempt at the second shard."""
+    import os
+    import src.pdf.pdf_generator as pdf_module
+
+    marker = Path(f"{output_path}.killed")
+    if output_path.endswith("_part002.pdf") and not marker.exists():
+        marker.touch()
+        Path(f"{output_path}.part").write_bytes(b"%PDF-truncated")
+        os._exit(1)
+    return pdf_module._original_write_shard_worker(cards, order, output_path, metadata, encoding)
+
+
+def image_dictionaries(pdf_bytes):
+    """Extract the dictionaries of embedded image XObjects."""
+    return re.findall(rb"<<[^<>]*/Subtype /Image[^<>]*>>", pdf_bytes)
+
+
+@pytest.fixture
+def noisy_card():
+    """Create a card with photographic detail, where JPEG pays off."""
+    card = Image.effect_noise((744, 1039), 40).convert('RGB')
+    card.info['dpi'] = (300, 300)
+    return card
+
+
+def test_jpeg_encoding_embeds_dct_streams(pdf_generator, noisy_card, tmp_path):
+    """Test JPEG output embeds DCT streams and is smaller than lossless Flate output."""
+    from src.pdf.image_encoding import ImageEncoding
+
+    flate_path = tmp_path / "flate.pdf"
+    jpeg_path = tmp_path / "jpeg.pdf"
+    pdf_generator.generate_cards_pdf_stream(iter([noisy_card]), str(flate_path),
+                                            encoding=ImageEncoding('flate'))
+    pdf_generator.generate_cards_pdf([noisy_card], str(jpeg_path),
+                                     encoding=ImageEncoding('jpeg', jpeg_quality=85))
+
+    flate_pdf, jpeg_pdf = flate_path.read_bytes(), jpeg_path.read_bytes()
+    [flate_image] = image_dictionaries(flate_pdf)
+    [jpeg_image] = image_dictionaries(jpeg_pdf)
+    assert b"/Filter [ /FlateDecode ]" in flate_image
+    assert b"/Filter [ /DCTDecode ]" in jpeg_image
+    assert len(jpeg_pdf) < len(flate_pdf)
+
+
+def test_downsampling_reduces_embedded_pixels(pdf_generator, noisy_card, tmp_path):
+    """Test downsampled cards are embedded at the lower resolution."""
+    from src.pdf.image_encoding import ImageEncoding
+
+    output_path = tmp_path / "proof.pdf"
+    pdf_generator.generate_cards_pdf_stream(iter([noisy_card]), str(output_path),
+                                            encoding=ImageEncoding('flate', downsample_dpi=150))
+
+    [image] = image_dictionaries(output_path.read_bytes())
+    assert b"/Width 372" in image
+
+
+def test_estimate_pdf_size_by_encoding(pdf_generator):
+    """Test size estimates shrink with lossy encoding, downsampling and duplicate cards."""
+    from src.pdf.image_encoding import ImageEncoding
+
+    flate = pdf_generator.estimate_pdf_size(90, ImageEncoding('flate'))
+    jpeg = pdf_generator.estimate_pdf_size(90, ImageEncoding('jpeg', jpeg_quality=90))
+    low_jpeg = pdf_generator.estimate_pdf_size(90, ImageEncoding('jpeg', jpeg_quality=75))
+    proof = pdf_generator.estimate_pdf_size(90, ImageEncoding('jpeg', jpeg_quality=90, downsample_dpi=150))
+    deduplicated = pdf_generator.estimate_pdf_size(90, ImageEncoding('flate'), unique_cards=9)
+
+    assert flate['estimated_pages'] == 10
+    assert flate['image_encoding'] == 'flate'
+    assert proof['estimated_size_mb'] < low_jpeg['estimated_size_mb'] < jpeg['estimated_size_mb'] \
+        < flate['estimated_size_mb']
+    assert deduplicated['estimated_size_mb'] < flate['estimated_size_mb'] / 5
+
+
+def test_invalid_image_encoding():
+    """Test unknown formats and out-of-range quality are rejected."""
+    from src.pdf.image_encoding import ImageEncoding
+    from src.utils.error_handler import PDFGenerationError
+
+    with pytest.raises(PDFGenerationError):
+        ImageEncoding('webp')
+    with pytest.raises(PDFGenerationError):
+        ImageEncoding('jpeg', jpeg_quality=0)
+
+
+def test_cards_are_drawn_at_layout_positions(pdf_generator, tmp_path, monkeypatch):
+    """Test cards are drawn straight onto the canvas at the layout manager's positions."""
+    import src.pdf.pdf_generator as pdf_module
+    from reportlab.lib.units import mm
+
+    drawn = []
+    monkeypatch.setattr(pdf_module, "draw_card_xobject",
+                        lambda canv, name, encoded, x, y, *args: drawn.append((canv.getPageNumber(), x, y)))
+    cards = [Image.new('RGB', (744, 1039), 'white') for _ in range(10)]
+
+    result = pdf_generator.generate_cards_pdf(cards, str(tmp_path / "layout.pdf"))
+
+    layout = pdf_generator.page_layout.calculate_optimal_layout(len(cards))
+    x_mm, y_mm = pdf_generator.page_layout.get_card_positions(layout)[0]
+    expected_first = (x_mm * mm, pdf_generator.a4_height - (y_mm + layout['card_height_mm']) * mm)
+    assert result.total_pages == 2
+    assert [page for page, _, _ in drawn] == [1] * 9 + [2]
+    assert drawn[0][1:] == pytest.approx(expected_first)
+    assert drawn[9][1:] == pytest.approx(expected_first)
+
+
+def test_threaded_encoding_matches_serial(noisy_card, tmp_path):
+    """Test cards encoded on a thread pool are embedded in order, once each, as serial encoding does."""
+    blue = Image.new('RGBA', (744, 1039), (0, 0, 255, 255))
+    cards = [noisy_card, blue, noisy_card, blue] * 3
+
+    outputs = []
+    for workers in (1, 3):
+        output_path = tmp_path / f"workers{workers}.pdf"
+        result = PDFGenerator(encode_workers=workers).generate_cards_pdf(cards, str(output_path))
+        assert result.total_cards == 12
+        outputs.append(image_dictionaries(output_path.read_bytes()))
+
+    assert len(outputs[0]) == 2
+    assert outputs[0] == outputs[1]
+
+
+def test_sharded_pdf_writes_numbered_set(pdf_generator, tmp_path):
+    """Test sharded output splits pages across numbered files, shipping repeated cards once."""
+    red = Image.new('RGBA', (744, 1039), (255, 0, 0, 255))
+    cards = [red] * 9 + [Image.new('RGBA', (744, 1039), (0, 0, 255, 255))] * 11
+
+    result = pdf_generator.generate_cards_pdf_shards(iter(cards), str(tmp_path / "cards.pdf"),
+                                                     pages_per_shard=1, total_cards=20, workers=2)
+
+    assert [Path(path).name for path in result.shard_paths] == \
+        ["cards_part001.pdf", "cards_part002.pdf", "cards_part003.pdf"]
+    assert (result.total_cards, result.total_pages, result.merged) == (20, 3, False)
+    assert result.file_path == str(tmp_path)
+    assert not list(tmp_path.glob("*.part"))
+    for path in result.shard_paths:
+        assert len(image_dictionaries(Path(path).read_bytes())) == 1
+
+
+def test_failed_shard_is_rewritten_alone(pdf_generator, tmp_path, monkeypatch):
+    """Test a shard that fails is retried without redoing the other shards."""
+    import src.pdf.pdf_generator as pdf_module
+
+    monkeypatch.setattr(pdf_module, "_original_write_shard_worker", pdf_module._write_shard_worker, raising=False)
+    monkeypatch.setattr(pdf_module, "_write_shard_worker", _flaky_shard_worker)
+    cards = [Image.new('RGBA', (744, 1039), (255, 255, 255, 255)) for _ in range(27)]
+
+    result = pdf_generator.generate_cards_pdf_shards(cards, str(tmp_path / "cards.pdf"),
+                                                     pages_per_shard=1, workers=2)
+
+    assert result.retried_shards == 1
+    assert result.total_pages == 3
+    assert all(Path(path).exists() for path in result.shard_paths)
+
+
+def test_killed_worker_shard_is_rewritten_in_fresh_pool(pdf_generator, tmp_path, monkeypatch):
+    """Test a shard whose worker process dies is rewritten, and later shards still get written."""
+    import src.pdf.pdf_generator as pdf_module
+
+    monkeypatch.setattr(pdf_module, "_original_write_shard_worker", pdf_module._write_shard_worker, raising=False)
+    monkeypatch.setattr(pdf_module, "_write_shard_worker", _dying_shard_worker)
+    cards = [Image.new('RGBA', (744, 1039), (255, 255, 255, 255)) for _ in range(36)]
+
+    result = pdf_generator.generate_cards_pdf_shards(cards, str(tmp_path / "cards.pdf"),
+                                                     pages_per_shard=1, workers=2)
+
+    assert result.retried_shards >= 1
+    assert result.total_pages == 4
+    assert all(Path(path).exists() for path in result.shard_paths)
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_stale_shard_temp_files_are_removed(pdf_generator, tmp_path):
+    """Test temp files left by workers killed in an earlier run are cleaned up."""
+    (tmp_path / "cards_part007.pdf.part").write_bytes(b"%PDF-truncated")
+    (tmp_path / "other_part001.pdf.part").write_bytes(b"%PDF-truncated")
+    cards = [Image.new('RGBA', (744, 1039), (255, 255, 255, 255)) for _ in range(9)]
+
+    pdf_generator.generate_cards_pdf_shards(cards, str(tmp_path / "cards.pdf"), pages_per_shard=1, workers=1)
+
+    assert [path.name for path in tmp_path.glob("*.part")] == ["other_part001.pdf.part"]
+
+
+def test_default_shard_workers_are_capped(monkeypatch):
+    """Test the default shard worker count is bounded, since each shard holds raw pixels."""
+    from config.settings import PDFSettings
+    from config import settings as settings_module
+
+    monkeypatch.setattr(settings_module.os, "cpu_count", lambda: 64)
+
+    assert PDFSettings().shard_worker_count == PDFSettings().max_shard_workers
+    assert PDFSettings(shard_workers=8).shard_worker_count == 8
+
+
+def test_sharded_pdf_merge(pdf_generator, tmp_path, monkeypatch):
+    """Test merged output replaces the numbered shards with a single file."""
+    import src.pdf.pdf_generator as pdf_module
+
+    merged_inputs = []
+
+    def fake_merge(pdf_files, output_path):
+        merged_inputs.extend(Path(path).name for path in pdf_files)
+        Path(output_path).write_bytes(b"".join(Path(path).read_bytes() for path in pdf_files))
+
+    monkeypatch.setattr(pdf_module, "pdf_merge_available", lambda: True)
+    monkeypatch.setattr(pdf_generator, "merge_pdfs", fake_merge)
+    cards = [Image.new('RGBA', (744, 1039), (255, 255, 255, 255)) for _ in range(10)]
+
+    result = pdf_generator.generate_cards_pdf_shards(cards, str(tmp_path / "cards.pdf"),
+                                                     pages_per_shard=1, merge=True, workers=2)
+
+    assert result.merged and result.file_path == str(tmp_path / "cards.pdf")
+    assert merged_inputs == ["cards_part001.pdf", "cards_part002.pdf"]
+    assert result.shard_paths == [] and not list(tmp_path.glob("cards_part*"))
+
+
+def test_supported_reportlab_internals(tmp_path):
+    """Test the Canvas internals used to embed pre-encoded images exist in the installed ReportLab."""
+    import reportlab
+    from reportlab.pdfgen import canvas
+    from src.pdf.image_encoding import ImageEncoding
+    from src.pdf.pdf_generator import _has_image_internals, draw_card_xobject
+
+    assert 4 <= int(reportlab.Version.split('.')[0]) < 6  # Range pinned in pyproject.toml
+    canv = canvas.Canvas(str(tmp_path / "internals.pdf"))
+    assert _has_image_internals(canv)
+    assert hasattr(canv, '_currentPageHasImages')
+
+    encoded = ImageEncoding().encode(Image.new('RGB', (8, 8), 'red'))
+    canv._currentPageHasImages = 0
+    draw_card_xobject(canv, "card_test", encoded, 0, 0, 10, 10)
+    assert canv._currentPageHasImages
+    canv.showPage()
+    canv.save()
+    assert (tmp_path / "internals.pdf").read_bytes().count(b"/Subtype /Image") == 1
+
+
+def test_missing_reportlab_internals_fall_back_to_draw_image(noisy_card, tmp_path, monkeypatch):
+    """Test PDFs are still written through the public drawImage when Canvas internals are unavailable."""
+    import src.pdf.pdf_generator as pdf_module
+    from src.pdf.image_encoding import ImageEncoding
+
+    monkeypatch.setattr(pdf_module, "_has_image_internals", lambda canv: False)
+    blue = Image.new('RGBA', (744, 1039), (0, 0, 255, 255))
+    cards = [noisy_card, blue, noisy_card]
+
+    for encoding in (ImageEncoding(), ImageEncoding('jpeg')):
+        output_path = tmp_path / f"{encoding.format}.pdf"
+        result = PDFGenerator(encode_workers=1).generate_cards_pdf(cards, str(output_path), encoding=encoding)
+
+        assert result.total_cards == 3
+        assert len(image_dictionaries(output_path.read_bytes())) == 2
+
+
+def test_encoded_image_decodes_to_its_pixels():
+    """Test lossless encodings decode back to the original pixels."""
+    from src.pdf.image_encoding import ImageEncoding
+
+    card = Image.effect_noise((40, 30), 40).convert('RGB')
+
+    assert ImageEncoding().encode(card).to_image().tobytes() == card.tobytes()
+    assert ImageEncoding('jpeg').encode(card).to_image().size == (40, 30)
+
+
+def test_keyless_cards_are_hashed_off_the_writer_thread(noisy_card, tmp_path, monkeypatch):
+    """Test pixel digests of cards without a cache key are computed on the encode pool."""
+    import threading
+    import src.pdf.pdf_generator as pdf_module
+
+    threads = []
+    original = pdf_module.card_xobject_name
+
+    def recording_name(card):
+        threads.append(threading.current_thread().name)
+        return original(card)
+
+    monkeypatch.setattr(pdf_module, "card_xobject_name", recording_name)
+    blue = Image.new('RGBA', (744, 1039), (0, 0, 255, 255))
+    output_path = tmp_path / "keyless.pdf"
+
+    PDFGenerator(encode_workers=2).generate_cards_pdf([noisy_card, blue, noisy_card.copy(), blue], str(output_path))
+
+    assert threads and all(name.startswith("pdf-encode") for name in threads)
+    assert len(image_dictionaries(output_path.read_bytes())) == 2
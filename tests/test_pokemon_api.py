@@ -0,0 +1,263 @@
+"""Tests for Pokemon API client module."""
+import asyncio
+import json
+import pytest
+from src.api import pokemon_api
+from src.api.pokemon_api import AsyncPokemonAPIClient, PokemonAPIClient
+from src.models import PokemonBasicData, PokemonData, PokemonSpeciesData, PokemonType
+from config.constants import CARD_RECORD_SCHEMA_VERSION
+
+
+@pytest.fixture
+def api_client():
+    """Create PokemonAPIClient without an HTTP session."""
+    return PokemonAPIClient()
+
+
+def make_basic(sprites=None) -> PokemonBasicData:
+    """Create minimal basic Pokemon data."""
+    return PokemonBasicData(
+        id=25,
+        name="pikachu",
+        height=4,
+        weight=60,
+        types=[PokemonType(slot=1, type={"name": "electric", "url": "https://pokeapi.co/api/v2/type/13/"})],
+        sprites=sprites
+    )
+
+
+def test_artwork_url_from_sprites(api_client, monkeypatch):
+    """Test the artwork URL is taken from sprite data without any request."""
+    import requests
+    monkeypatch.setattr(requests, "head", lambda *a, **kw: pytest.fail("unexpected HEAD request"))
+
+    sprite_url = "https://example.com/artwork/25.png"
+    basic = make_basic({"other": {"official-artwork": {"front_default": sprite_url}}})
+
+    assert api_client.get_official_artwork_url(25, basic) == sprite_url
+
+
+def test_artwork_url_falls_back_to_pattern(api_client):
+    """Test the URL pattern is used when sprite data has no artwork."""
+    url = api_client.get_official_artwork_url(25, make_basic())
+
+    assert url.endswith("/official-artwork/25.png")
+
+
+def test_fetch_pokemon_keeps_order_and_bounds_concurrency(monkeypatch):
+    """Test queued fetches stay within max_concurrent and return in input order."""
+    in_flight = 0
+    peak = 0
+    progress = []
+
+    async def fake_get_pokemon_async(self, session, pokemon_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001 * (pokemon_id % 3))
+        in_flight -= 1
+        return pokemon_id
+
+    monkeypatch.setattr(pokemon_api.cache_manager, "get_pokemon_data", lambda pokemon_id: None)
+    monkeypatch.setattr(AsyncPokemonAPIClient, "_get_pokemon_async", fake_get_pokemon_async)
+
+    async def run():
+        async with AsyncPokemonAPIClient(max_concurrent=3) as client:
+            return await client.fetch_pokemon(
+                list(range(1, 11)),
+                progress_callback=lambda completed, total, pid: progress.append((completed, total))
+            )
+
+    assert asyncio.run(run()) == list(range(1, 11))
+    assert peak <= 3
+    assert progress[-1] == (10, 10)
+
+
+def basic_payload(pokemon_id: int) -> dict:
+    """Create a minimal /pokemon response body."""
+    return {
+        "id": pokemon_id, "name": "pikachu", "height": 4, "weight": 60,
+        "types": [{"slot": 1, "type": {"name": "electric", "url": "https://pokeapi.co/api/v2/type/13/"}}]
+    }
+
+
+def test_pokemon_and_species_requested_concurrently(monkeypatch):
+    """Test the species request starts before the pokemon request finishes."""
+    started = []
+    both_started = asyncio.Event()
+
+    async def fake_make_request(self, session, endpoint):
+        started.append(endpoint)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        if "species" in endpoint:
+            return {"id": 25, "name": "pikachu"}
+        return basic_payload(25)
+
+    monkeypatch.setattr(pokemon_api.cache_manager, "get_species_data", lambda pokemon_id: None)
+    monkeypatch.setattr(pokemon_api.cache_manager, "set_species_data", lambda *a, **kw: None)
+    monkeypatch.setattr(pokemon_api.cache_manager, "set_pokemon_data", lambda *a, **kw: None)
+    monkeypatch.setattr(AsyncPokemonAPIClient, "_make_request", fake_make_request)
+
+    pokemon = asyncio.run(AsyncPokemonAPIClient()._get_pokemon_async(None, 25))
+
+    assert pokemon.basic.id == 25
+    assert pokemon.species is not None
+    assert len(started) == 2
+
+
+def test_cached_species_skips_species_request(monkeypatch):
+    """Test the async path reuses cached species data."""
+    endpoints = []
+
+    async def fake_make_request(self, session, endpoint):
+        endpoints.append(endpoint)
+        return basic_payload(25)
+
+    monkeypatch.setattr(pokemon_api.cache_manager, "get_species_data",
+                        lambda pokemon_id: {"id": 25, "name": "pikachu"})
+    monkeypatch.setattr(pokemon_api.cache_manager, "set_pokemon_data", lambda *a, **kw: None)
+    monkeypatch.setattr(AsyncPokemonAPIClient, "_make_request", fake_make_request)
+
+    pokemon = asyncio.run(AsyncPokemonAPIClient()._get_pokemon_async(None, 25))
+
+    assert pokemon.species.name == "pikachu"
+    assert endpoints == ["/pokemon/25"]
+
+
+def test_retry_backoff_releases_concurrency_slot(monkeypatch):
+    """Test a request backing off does not hold its slot, so concurrent retries cannot deadlock."""
+    import aiohttp
+
+    client = AsyncPokemonAPIClient(max_concurrent=1)
+    attempts = {}
+    slot_held_while_sleeping = []
+    original_sleep = asyncio.sleep
+
+    class FakeResponse:
+        status = 200
+
+        def raise_for_status(self):
+            pass
+
+        async def json(self):
+            return {"ok": True}
+
+    class FakeRequest:
+        def __init__(self, url):
+            self.url = url
+
+        async def __aenter__(self):
+            attempts[self.url] = attempts.get(self.url, 0) + 1
+            if attempts[self.url] == 1:
+                raise aiohttp.ClientConnectionError("reset")
+            return FakeResponse()
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+    class FakeSession:
+        def get(self, url, timeout=None):
+            return FakeRequest(url)
+
+    async def fake_sleep(delay, *args, **kwargs):
+        if delay:
+            slot_held_while_sleeping.append(client._semaphore.locked())
+        await original_sleep(0)
+
+    monkeypatch.setattr(pokemon_api.asyncio, "sleep", fake_sleep)
+
+    async def run():
+        return await asyncio.wait_for(asyncio.gather(
+            client._make_request(FakeSession(), "/pokemon/25"),
+            client._make_request(FakeSession(), "/pokemon-species/25"),
+        ), timeout=5)
+
+    assert asyncio.run(run()) == [{"ok": True}, {"ok": True}]
+    assert set(attempts.values()) == {2}
+    assert slot_held_while_sleeping and not any(slot_held_while_sleeping)
+
+
+def make_full_pokemon() -> PokemonData:
+    """Create Pokemon data as parsed from full PokeAPI payloads."""
+    species = PokemonSpeciesData(
+        id=25, name="pikachu",
+        names=[
+            {"language": {"name": "ja", "url": "https://pokeapi.co/api/v2/language/11/"}, "name": "ピカチュウ"},
+            {"language": {"name": "en", "url": "https://pokeapi.co/api/v2/language/9/"}, "name": "Pikachu"},
+        ],
+        flavor_text_entries=[
+            {"flavor_text": "It stores electricity.",
+             "language": {"name": "en", "url": "https://pokeapi.co/api/v2/language/9/"},
+             "version": {"name": "red", "url": "https://pokeapi.co/api/v2/version/1/"}},
+        ]
+    )
+    return PokemonData(basic=PokemonBasicData(**basic_payload(25)), species=species,
+                       official_artwork_url="https://example.com/artwork/25.png")
+
+
+def test_card_record_round_trip():
+    """Test the compact card record keeps everything the card renders."""
+    pokemon = make_full_pokemon()
+
+    record = pokemon.to_card_record(flavor_languages=("en",))
+    restored = PokemonData.from_card_record(json.loads(json.dumps(record)))
+
+    assert record["v"] == CARD_RECORD_SCHEMA_VERSION
+    assert restored.pokemon_id == 25
+    assert restored.all_types == ["electric"]
+    assert restored.get_display_name("ja") == "ピカチュウ"
+    assert restored.get_flavor_text("en") == "It stores electricity."
+    assert str(restored.official_artwork_url) == "https://example.com/artwork/25.png"
+    assert restored.basic.height_meters == pytest.approx(0.4)
+
+
+def test_legacy_cached_payload_is_compacted(monkeypatch):
+    """Test a full cached payload still loads and is rewritten as a card record."""
+    stored = {}
+    legacy = make_full_pokemon().model_dump(mode="json")
+    monkeypatch.setattr(pokemon_api.cache_manager, "get_pokemon_data", lambda pokemon_id: legacy)
+    monkeypatch.setattr(pokemon_api.cache_manager, "set_pokemon_data",
+                        lambda pokemon_id, data, ttl_hours=24: stored.update({pokemon_id: data}))
+
+    pokemon = pokemon_api.load_cached_pokemon(25)
+
+    assert pokemon.get_display_name("ja") == "ピカチュウ"
+    assert stored[25]["v"] == CARD_RECORD_SCHEMA_VERSION
+    assert len(json.dumps(stored[25])) < len(json.dumps(legacy))
+
+
+def test_outdated_card_record_is_a_cache_miss(monkeypatch):
+    """Test records written with another schema version are ignored."""
+    record = make_full_pokemon().to_card_record()
+    record["v"] = CARD_RECORD_SCHEMA_VERSION + 1
+    monkeypatch.setattr(pokemon_api.cache_manager, "get_pokemon_data", lambda pokemon_id: record)
+
+    assert pokemon_api.load_cached_pokemon(25) is None
+
+
+def test_fetch_species_rebuilds_cached_card_record(monkeypatch):
+    """Test species fetched for a Pokemon cached without it replace the fallback names in its record."""
+    full = make_full_pokemon()
+    stored = {25: full.model_copy(update={'species': None}).to_card_record()}
+    species_payload = full.species.model_dump(mode="json")
+    endpoints = []
+
+    async def fake_make_request(self, session, endpoint):
+        endpoints.append(endpoint)
+        return species_payload
+
+    monkeypatch.setattr(pokemon_api.cache_manager, "get_pokemon_data", lambda pokemon_id: stored.get(pokemon_id))
+    monkeypatch.setattr(pokemon_api.cache_manager, "set_pokemon_data",
+                        lambda pokemon_id, data, ttl_hours=24: stored.update({pokemon_id: data}))
+    monkeypatch.setattr(pokemon_api.cache_manager, "get_species_data", lambda pokemon_id: None)
+    monkeypatch.setattr(pokemon_api.cache_manager, "set_species_data", lambda *a, **kw: None)
+    monkeypatch.setattr(AsyncPokemonAPIClient, "_make_request", fake_make_request)
+
+    assert stored[25]["names"]["ja"] == "Pikachu"
+    fetched = asyncio.run(AsyncPokemonAPIClient().fetch_species([25]))
+
+    assert fetched == [25]
+    assert endpoints == ["/pokemon-species/25"]
+    assert stored[25]["names"]["ja"] == "ピカチュウ"
@@ -0,0 +1,84 @@
+"""Tests for the cache prefetch script."""
+import asyncio
+import pytest
+import prefetch
+
+
+class FakeCache:
+    """Cache manager stub holding which IDs have data, species and artwork cached."""
+
+    def __init__(self, pokemon=(), species=(), images=()):
+        self.pokemon = set(pokemon)
+        self.species = set(species)
+        self.images = set(images)
+
+    def get_pokemon_data(self, pokemon_id):
+        return {'id': pokemon_id} if pokemon_id in self.pokemon else None
+
+    def get_species_data(self, pokemon_id):
+        return {'id': pokemon_id} if pokemon_id in self.species else None
+
+    def has_pokemon_image(self, pokemon_id):
+        return pokemon_id in self.images
+
+
+@pytest.fixture
+def fake_prefetch(monkeypatch):
+    """Stub the cache and fetchers, recording what run_prefetch asks to fetch."""
+    cache = FakeCache(pokemon=[1, 2, 3], species=[1, 2], images=[1])
+    calls = {}
+
+    async def fake_prefetch_data(pokemon_ids, species_ids, concurrency, progress):
+        calls['data'] = (list(pokemon_ids), list(species_ids))
+        return len(pokemon_ids) + len(species_ids)
+
+    async def fake_prefetch_images(pokemon_ids, concurrency, progress):
+        calls['images'] = list(pokemon_ids)
+        return len(pokemon_ids) - 1  # One download fails
+
+    async def fake_provision():
+        calls['icons'] = True
+        return 0
+
+    monkeypatch.setattr(prefetch, "cache_manager", cache)
+    monkeypatch.setattr(prefetch, "prefetch_data", fake_prefetch_data)
+    monkeypatch.setattr(prefetch, "prefetch_images", fake_prefetch_images)
+    monkeypatch.setattr(prefetch.type_icon_manager, "provision_type_icons", fake_provision)
+    return calls
+
+
+def test_concurrency_must_be_positive():
+    """Test a concurrency that would hang or fail the run is rejected."""
+    for concurrency in ("0", "-3"):
+        with pytest.raises(SystemExit):
+            prefetch.parse_args(["--concurrency", concurrency])
+    assert prefetch.parse_args(["--concurrency", "1"]).concurrency == 1
+
+
+def test_find_missing_separates_species_only_ids(monkeypatch):
+    """Test a cached Pokemon without species data is listed for a species fetch, not a Pokemon fetch."""
+    monkeypatch.setattr(prefetch, "cache_manager", FakeCache(pokemon=[1, 2], species=[1], images=[1, 2]))
+
+    assert prefetch.find_missing([1, 2, 3]) == ([3], [2], [3])
+    assert prefetch.find_missing([1, 2, 3], include_images=False) == ([3], [2], [])
+
+
+def test_run_prefetch_fetches_only_what_is_missing(fake_prefetch):
+    """Test partly cached IDs resume with just the missing entries and are counted accordingly."""
+    stats = asyncio.run(prefetch.run_prefetch([1, 2, 3, 4]))
+
+    assert fake_prefetch['data'] == ([4], [3])
+    assert fake_prefetch['images'] == [2, 3, 4]
+    assert fake_prefetch['icons']
+    assert (stats['requested'], stats['already_cached_data'], stats['fetched_data']) == (4, 2, 2)
+    assert (stats['already_cached_images'], stats['downloaded_images'], stats['failed_images']) == (1, 2, 1)
+    assert stats['failed_data'] == 0
+
+
+def test_run_prefetch_without_images(fake_prefetch):
+    """Test --skip-images leaves artwork and type icons alone."""
+    stats = asyncio.run(prefetch.run_prefetch([1, 2, 3], include_images=False))
+
+    assert fake_prefetch['data'] == ([], [3])
+    assert 'images' not in fake_prefetch and 'icons' not in fake_prefetch
+    assert (stats['already_cached_images'], stats['downloaded_images'], stats['failed_images']) == (0, 0, 0)
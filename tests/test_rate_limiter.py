@@ -0,0 +1,60 @@
+"""Tests for rate limiter module."""
+import asyncio
+import pytest
+from src.utils import rate_limiter as rate_limiter_module
+from src.utils.rate_limiter import TokenBucket
+
+
+def test_burst_then_spaced_reservations(monkeypatch):
+    """Test a full bucket serves the burst immediately and spaces later requests."""
+    monkeypatch.setattr(rate_limiter_module.time, 'monotonic', lambda: 100.0)
+    bucket = TokenBucket(rate=10, burst=3)
+
+    delays = [bucket._reserve() for _ in range(5)]
+
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    assert delays[3] == pytest.approx(0.1)
+    assert delays[4] == pytest.approx(0.2)
+
+
+def test_tokens_refill_over_time(monkeypatch):
+    """Test tokens refill at the configured rate up to the burst size."""
+    now = [100.0]
+    monkeypatch.setattr(rate_limiter_module.time, 'monotonic', lambda: now[0])
+    bucket = TokenBucket(rate=10, burst=2)
+    bucket._reserve()
+    bucket._reserve()
+
+    now[0] += 60.0  # Long idle period refills only up to the burst
+
+    delays = [bucket._reserve() for _ in range(3)]
+
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(0.1)
+
+
+def test_concurrent_acquires_are_rate_limited(monkeypatch):
+    """Test concurrent coroutines do not all pass at once."""
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(rate_limiter_module.asyncio, 'sleep', fake_sleep)
+    bucket = TokenBucket(rate=50, burst=1)
+
+    async def run():
+        await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+
+    asyncio.run(run())
+
+    assert len(sleeps) == 3
+    assert sorted(sleeps) == sleeps  # Later reservations wait longer
+
+
+def test_zero_rate_disables_limiting():
+    """Test a non-positive rate never delays requests."""
+    bucket = TokenBucket(rate=0, burst=1)
+
+    assert all(bucket._reserve() == 0.0 for _ in range(10))
+
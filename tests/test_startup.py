@@ -0,0 +1,44 @@
+"""Tests for CLI startup cost."""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules only needed once a search runs, not to show the welcome screen
+HEAVY_MODULES = ['PIL', 'reportlab', 'aiohttp', 'requests', 'pydantic', 'PyPDF2', 'src.models']
+
+
+def run_startup_probe(code: str) -> dict:
+    """Run code in a fresh interpreter and return the JSON it prints."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_main_import_defers_heavy_modules():
+    """Test importing main and checking first run loads none of the heavy pipeline modules."""
+    loaded = run_startup_probe(
+        "import json, sys, main\n"
+        "main.cache_manager.is_first_run()\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+
+    assert loaded == []
+
+
+def test_pipeline_modules_still_import():
+    """Test the deferred modules load when the pipeline is first used."""
+    loaded = run_startup_probe(
+        "import json, sys, main\n"
+        "main.PokemonCardGenerator._generate_cards\n"
+        "from src.card.parallel_renderer import ParallelCardRenderer\n"
+        "from src.pdf.pdf_generator import PDFGenerator\n"
+        "from src.api.pokemon_api import AsyncPokemonAPIClient\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+
+    assert {'PIL', 'reportlab', 'aiohttp', 'pydantic'} <= set(loaded)
@@ -0,0 +1,66 @@
+"""Tests for text renderer module."""
+import pytest
+from src.card import text_renderer as text_renderer_module
+from src.card.text_renderer import TextRenderer
+
+
+@pytest.fixture
+def renderer():
+    """Create a text renderer with empty measurement caches."""
+    renderer = TextRenderer()
+    renderer.clear_font_cache()
+    return renderer
+
+
+def test_wrap_text_breaks_into_at_most_two_lines(renderer):
+    """Test words are wrapped greedily and names needing three lines are rejected."""
+    font = renderer.get_font('en', 20)
+    word_width = font.getlength("Great")
+
+    assert renderer._wrap_text("Great Tusk", int(word_width) + 1, font) == "Great\nTusk"
+    assert renderer._wrap_text("Great Tusk", 10_000, font) == "Great Tusk"
+    assert renderer._wrap_text("Great Tusk Ancient Paradox", int(word_width) + 1, font) is None
+    assert renderer._wrap_text("Crabominable", 1, font) is None
+
+
+def test_wrap_text_measures_each_word_once(renderer, monkeypatch):
+    """Test wrapping measures words rather than every growing prefix of the line."""
+    measured = []
+    original = text_renderer_module._text_length.__wrapped__
+
+    def counting_length(text, font):
+        measured.append(text)
+        return original(text, font)
+
+    monkeypatch.setattr(text_renderer_module, "_text_length", counting_length)
+    font = renderer.get_font('en', 20)
+
+    renderer._wrap_text("Iron Valiant Ancient", 10_000, font)
+
+    assert sorted(measured) == sorted([" ", "Iron", "Valiant", "Ancient"])
+
+
+def test_fit_text_to_width_is_memoized(renderer, monkeypatch):
+    """Test fitting the same text again reuses the cached layout without measuring."""
+    first = renderer.fit_text_to_width("Tapu Koko", 60, 'en')
+
+    def fail(*args):
+        pytest.fail("cached layout was measured again")
+
+    monkeypatch.setattr(text_renderer_module, "_text_length", fail)
+    monkeypatch.setattr(renderer, "get_font", fail)
+
+    assert renderer.fit_text_to_width("Tapu Koko", 60, 'en') == first
+
+
+def test_fit_text_to_width_prefers_largest_fitting_size(renderer):
+    """Test the chosen font fits the width and the next size up would not."""
+    if renderer.get_font('en', 8).size == renderer.get_font('en', 40).size:
+        pytest.skip("no scalable font installed")
+
+    text, font = renderer.fit_text_to_width("Pikachu", 80, 'en', min_size=8, max_size=40)
+
+    assert text == "Pikachu"
+    assert font.getlength(text) <= 80
+    if font.size < 40:
+        assert renderer.get_font('en', font.size + 1).getlength(text) > 80
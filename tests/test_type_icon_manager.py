@@ -0,0 +1,81 @@
+"""Tests for type icon manager module."""
+import asyncio
+import pytest
+from PIL import Image
+from src.utils.type_icon_manager import TypeIconManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a type icon manager caching into a temporary directory."""
+    manager = TypeIconManager()
+    manager.cache_dir = tmp_path
+    return manager
+
+
+def write_icon(manager, type_name, size=(200, 100)):
+    """Write a cached icon for a type."""
+    Image.new('RGBA', size, (255, 0, 0, 255)).save(manager.cache_dir / f"{type_name}.png")
+
+
+def test_get_icon_is_fitted_once_per_size(manager):
+    """Test icons are decoded and scaled once, then served from memory by (type, size)."""
+    write_icon(manager, 'fire')
+
+    icon = manager.get_icon('fire', 140)
+    (manager.cache_dir / "fire.png").unlink()  # Later calls must not touch the file
+
+    assert icon.size == (140, 70)
+    assert icon.mode == 'RGBA'
+    assert manager.get_icon('Fire', 140) is icon
+    assert manager.get_icon('water', 140) is None
+
+
+def test_provision_downloads_only_missing_icons(manager, monkeypatch):
+    """Test up-front provisioning fetches missing icons concurrently and renders then skip downloads."""
+    for type_name in list(manager.type_to_id)[2:]:
+        write_icon(manager, type_name)
+    requested = []
+
+    async def fake_download(type_name, session=None):
+        requested.append(type_name)
+        await asyncio.sleep(0)
+        write_icon(manager, type_name)
+        return manager.cache_dir / f"{type_name}.png"
+
+    monkeypatch.setattr(manager, "download_type_icon", fake_download)
+    monkeypatch.setattr(manager, "_download_type_icon_sync",
+                        lambda type_name, verbose: pytest.fail("rendering downloaded an icon"))
+
+    assert asyncio.run(manager.provision_type_icons()) == 0
+    assert sorted(requested) == sorted(list(manager.type_to_id)[:2])
+    assert manager.all_icons_present
+    assert manager.ensure_type_icons_cached() is False
+
+
+def test_missing_icons_are_fetched_at_most_once(manager, monkeypatch):
+    """Test a failed download is not retried on every card."""
+    attempts = []
+    monkeypatch.setattr(manager, "_download_type_icon_sync",
+                        lambda type_name, verbose: attempts.append(type_name))
+
+    manager.ensure_type_icons_cached()
+    manager.ensure_type_icons_cached()
+
+    assert len(attempts) == len(manager.type_to_id)
+    assert manager.get_type_icon_path('fire') is None
+
+
+def test_quiet_sync_download_prints_nothing(manager, monkeypatch, capsys):
+    """Test the render-time fallback download keeps progress off stdout unless verbose."""
+    from src.utils import type_icon_manager as icon_module
+
+    def offline(url, timeout):
+        raise OSError("offline")
+
+    monkeypatch.setattr(icon_module.requests, "get", offline)
+    monkeypatch.setattr(icon_module.api_rate_limiter, "acquire_sync", lambda: None)
+    monkeypatch.setattr(icon_module, "log_error", lambda error, level: None)
+
+    assert manager.ensure_type_icons_cached() is True
+    assert capsys.readouterr().out == ""